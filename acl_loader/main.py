@@ -4,14 +4,15 @@ import click
 import ipaddress
 import json
 import syslog
-import operator
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 import openconfig_acl
 import tabulate
 import pyangbind.lib.pybindJSON as pybindJSON
 from natsort import natsorted
 from sonic_py_common import multi_asic
-from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
+from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector, ConfigDBPipeConnector
 from utilities_common.general import load_db_config
 
 def info(msg):
@@ -68,6 +69,190 @@ class AclLoaderException(Exception):
     pass
 
 
+def openconfig_int(low, high):
+    """ Integer leaf in the [low, high] range """
+
+    def convert(value):
+        if isinstance(value, (bool, float)):
+            raise ValueError("%r is not an integer" % (value,))
+        try:
+            number = int(value)
+        except TypeError:
+            raise ValueError("%r is not an integer" % (value,))
+        if number < low or number > high:
+            raise ValueError("%d is out of range [%d, %d]" % (number, low, high))
+        return number
+
+    return convert
+
+
+def openconfig_string(value):
+    if not isinstance(value, str):
+        raise ValueError("%r is not a string" % (value,))
+    return value
+
+
+def openconfig_identity(identities):
+    """ Identity leaf, one of identities """
+
+    def convert(value):
+        if openconfig_string(value) not in identities:
+            raise ValueError("%s is not one of %s" % (value, ", ".join(identities)))
+        return value
+
+    return convert
+
+
+def openconfig_union(*leaf_types):
+    """ Leaf of the first of leaf_types accepting the value """
+
+    def convert(value):
+        for leaf_type in leaf_types:
+            try:
+                return leaf_type(value)
+            except ValueError:
+                pass
+        raise ValueError("%r is not a valid value" % (value,))
+
+    return convert
+
+
+def openconfig_leaf_list(leaf_type):
+
+    def convert(value):
+        if not isinstance(value, list):
+            raise ValueError("%r is not a list" % (value,))
+        return [leaf_type(item) for item in value]
+
+    return convert
+
+
+def openconfig_ip_prefix(value):
+    if "/" not in openconfig_string(value):
+        raise ValueError("%s is not an IP prefix" % value)
+    ipaddress.ip_network(value, strict=False)
+    return value
+
+
+def openconfig_port_range(value):
+    ports = openconfig_string(value).split("..")
+    if len(ports) != 2:
+        raise ValueError("%s is not a port range" % value)
+    for port in ports:
+        openconfig_int(0, 65535)(port)
+    return value
+
+
+def check_openconfig_container(data, names):
+    """
+    Check that an openconfig container loaded from JSON only has known children, as pybindJSON does.
+    :param data: Container as loaded from JSON
+    :param names: Names of the children of the container
+    :return: data
+    """
+    if not isinstance(data, dict):
+        raise ValueError("%r is not a container" % (data,))
+    for name in data:
+        if name not in names:
+            raise AttributeError("JSON object contained a key that did not exist (%s)" % name)
+    return data
+
+
+def load_openconfig_container(data, schema):
+    """
+    Convert an openconfig container loaded from JSON to an object with the attributes of the pybind
+    openconfig_acl objects. The leaves are validated, and missing leaves have their unset value.
+    Unknown children are rejected at every level.
+    :param data: Container as loaded from JSON
+    :param schema: dict of the child containers schema, and of the (type, unset value) of the leaves
+    :return: types.SimpleNamespace
+    """
+    check_openconfig_container(data, schema)
+    container = types.SimpleNamespace()
+    for name, node in schema.items():
+        value = data.get(name)
+        if isinstance(node, dict):
+            value = load_openconfig_container({} if value is None else value, node)
+        elif value is None:
+            value = node[1]
+        else:
+            value = node[0](value)
+        setattr(container, name.replace("-", "_"), value)
+    return container
+
+
+def rule_priority(rule):
+    try:
+        return int(rule.get("PRIORITY", 0))
+    except ValueError:
+        return 0
+
+
+def rule_to_raw(rule):
+    """
+    Rule fields as Config DB stores them. The converters keep some values as int, while the
+    rules read back from Config DB only hold strings.
+    """
+    return {field: str(value) for field, value in rule.items()}
+
+
+class AclRulesDiff(object):
+    """
+    Minimal set of ACL_RULE changes turning the current rules into the new rules.
+    The rules of replaced_tables found in both are deleted and added again, even if unchanged.
+    """
+
+    def __init__(self, current_rules, new_rules, replaced_tables=()):
+        self.deleted = {key: rule for key, rule in current_rules.items() if key not in new_rules}
+        self.added = {key: rule for key, rule in new_rules.items() if key not in current_rules}
+        # Rules whose fields are only added or changed, updated in place
+        self.modified = {}
+        # Rules with removed fields, deleted and added again
+        self.replaced = {}
+        for key, rule in new_rules.items():
+            if key not in current_rules:
+                continue
+            if key[0] in replaced_tables:
+                self.replaced[key] = rule
+            elif rule_to_raw(rule) == rule_to_raw(current_rules[key]):
+                continue
+            elif set(current_rules[key]).issubset(rule):
+                self.modified[key] = rule
+            else:
+                self.replaced[key] = rule
+
+    def __len__(self):
+        return len(self.deleted) + len(self.added) + len(self.modified) + len(self.replaced)
+
+    @staticmethod
+    def _ordered(rules, deleted=False):
+        # Highest priority first
+        keys = sorted(rules, key=lambda key: rule_priority(rules[key]), reverse=True)
+        return {key: None if deleted else rules[key] for key in keys}
+
+    def get_batches(self, priority_order=False):
+        """
+        Get the changes as a list of {key: rule} batches, to be written in order. A None rule
+        deletes the key.
+        By default the rules are deleted before the new rules are written, as a full update
+        would do. In priority order, the rules are added and modified in priority order
+        before the stale rules are removed, so that the rules which are kept are always
+        programmed. Only the replaced rules are missing from the dataplane for a moment.
+        :param priority_order: Add and modify the rules before deleting the stale rules
+        :return: list of batches
+        """
+        deleted = dict(self.deleted)
+        deleted.update(self.replaced)
+        updated = dict(self.added)
+        updated.update(self.modified)
+        if priority_order:
+            batches = [self._ordered(updated), self._ordered(deleted, deleted=True), self._ordered(self.replaced)]
+        else:
+            updated.update(self.replaced)
+            batches = [self._ordered(deleted, deleted=True), self._ordered(updated)]
+        return [batch for batch in batches if batch]
+
+
 class AclLoader(object):
 
     ACL_TABLE = "ACL_TABLE"
@@ -90,6 +275,9 @@ class AclLoader(object):
     min_priority = 1
     max_priority = 10000
 
+    # Number of ACL_RULE changes written in a pipelined CONFIG_DB request
+    rules_batch_size = 1000
+
     ethertype_map = {
         "ETHERTYPE_LLDP": 0x88CC,
         "ETHERTYPE_VLAN": 0x8100,
@@ -113,6 +301,52 @@ class AclLoader(object):
         "IP_L2TP": 115
     }
 
+    # Schema of the openconfig ACL entries, see load_openconfig_container()
+    openconfig_acl_entry = {
+        "sequence-id": (openconfig_int(0, 0xFFFFFFFF), ""),
+        "config": {
+            "sequence-id": (openconfig_int(0, 0xFFFFFFFF), ""),
+            "description": (openconfig_string, ""),
+        },
+        "actions": {"config": {
+            "forwarding-action": (openconfig_identity(["ACCEPT", "DROP", "REJECT"]), ""),
+        }},
+        "l2": {"config": {
+            "ethertype": (openconfig_union(openconfig_int(0x0600, 0xFFFF), openconfig_identity(ethertype_map)), ""),
+            "vlan-id": (openconfig_int(1, 4094), ""),
+        }},
+        "ip": {"config": {
+            "protocol": (openconfig_union(openconfig_int(0, 254), openconfig_identity(ip_protocol_map)), ""),
+            "source-ip-address": (openconfig_ip_prefix, ""),
+            "destination-ip-address": (openconfig_ip_prefix, ""),
+            "dscp": (openconfig_int(0, 63), ""),
+        }},
+        "icmp": {"config": {
+            "type": (openconfig_int(0, 255), ""),
+            "code": (openconfig_int(0, 255), ""),
+        }},
+        "transport": {"config": {
+            "source-port": (openconfig_union(openconfig_int(0, 65535), openconfig_port_range,
+                                             openconfig_identity(["ANY"])), ""),
+            "destination-port": (openconfig_union(openconfig_int(0, 65535), openconfig_port_range,
+                                                  openconfig_identity(["ANY"])), ""),
+            "tcp-flags": (openconfig_leaf_list(openconfig_identity(["TCP_FIN", "TCP_SYN", "TCP_RST", "TCP_PSH",
+                                                                    "TCP_ACK", "TCP_URG", "TCP_ECE", "TCP_CWR"])), []),
+        }},
+        "input_interface": {"interface_ref": {"config": {
+            "interface": (openconfig_string, ""),
+        }}},
+    }
+
+    # Leaves of the openconfig ACL sets, besides their entries
+    openconfig_acl_set = {
+        "name": (openconfig_string, ""),
+        "config": {
+            "name": (openconfig_string, ""),
+            "description": (openconfig_string, ""),
+        },
+    }
+
     def __init__(self):
         self.yang_acl = None
         self.requested_session = None
@@ -123,6 +357,7 @@ class AclLoader(object):
         self.rules_info = {}
         self.tables_state_info = None
         self.rules_state_info = None
+        self.priority_order = False
 
         # Load database config files
         load_db_config()
@@ -343,6 +578,28 @@ class AclLoader(object):
         """
         self.max_priority = int(priority)
 
+    def set_priority_order(self, priority_order):
+        """
+        Set whether the rules are updated in priority order, see AclRulesDiff.get_batches()
+        :param priority_order: Add and modify the rules before deleting the stale rules
+        :return:
+        """
+        self.priority_order = priority_order
+
+    def get_replaced_tables(self):
+        """
+        Get the tables whose rules are all deleted and added again by an update.
+        :return: set of table names
+        """
+        # TODO: Until we test ASIC behavior, we cannot assume that we can insert
+        # dataplane ACLs and shift existing ACLs. Therefore, we perform a full
+        # update on dataplane ACLs, and only perform an incremental update on
+        # control plane ACLs. The rules are updated in place in priority order only.
+        if self.priority_order:
+            return set()
+        return {table_name for table_name, table in self.tables_db_info.items()
+                if table.get('type', '').upper() != self.ACL_TABLE_TYPE_CTRLPLANE}
+
     def is_table_valid(self, tname):
         return self.tables_db_info.get(tname)
 
@@ -413,15 +670,40 @@ class AclLoader(object):
                 raise AclLoaderException("Invalid input file %s" % filename)
         return yang_acl
 
-    def load_rules_from_file(self, filename, skip_action_validation=False):
+    @staticmethod
+    def load_acl_json(filename):
+        """
+        Load file in openconfig ACL format as plain JSON, without building the pybind objects
+        :param filename: File in openconfig ACL format
+        :return: dict of ACL sets by name
+        """
+        with open(filename, 'r') as f:
+            plain_json = json.load(f)
+        try:
+            acl_sets = plain_json['acl']['acl-sets']['acl-set']
+        except (KeyError, TypeError):
+            raise AclLoaderException("Invalid input file %s" % filename)
+        if not isinstance(acl_sets, dict) or not all(isinstance(acl_set, dict) for acl_set in acl_sets.values()):
+            raise AclLoaderException("Invalid input file %s" % filename)
+        check_openconfig_container(plain_json, ["acl"])
+        check_openconfig_container(plain_json['acl'], ["acl-sets"])
+        check_openconfig_container(plain_json['acl']['acl-sets'], ["acl-set"])
+        return acl_sets
+
+    def load_rules_from_file(self, filename, skip_action_validation=False, use_pybind=False):
         """
         Load file with ACL rules configuration in openconfig ACL format. Convert rules
         to Config DB schema.
         :param filename: File in openconfig ACL format
+        :param use_pybind: Parse the file to the pybind openconfig_acl objects, instead of converting
+            each rule from the plain JSON
         :return:
         """
-        self.yang_acl = AclLoader.parse_acl_json(filename)
-        self.convert_rules(skip_action_validation)
+        if use_pybind:
+            self.yang_acl = AclLoader.parse_acl_json(filename)
+            self.convert_rules(skip_action_validation)
+        else:
+            self.convert_json_rules(AclLoader.load_acl_json(filename), skip_action_validation)
 
     def convert_action(self, table_name, rule_idx, rule, skip_validation=False):
         rule_props = {}
@@ -772,26 +1054,99 @@ class AclLoader(object):
         :return:
         """
         for acl_set_name in self.yang_acl.acl.acl_sets.acl_set:
-            table_name = acl_set_name.replace(" ", "_").replace("-", "_").upper()
-            acl_set = self.yang_acl.acl.acl_sets.acl_set[acl_set_name]
+            acl_entries = self.yang_acl.acl.acl_sets.acl_set[acl_set_name].acl_entries.acl_entry
+            self.convert_acl_set(acl_set_name, ((name, acl_entries[name]) for name in acl_entries),
+                                 skip_aciton_validation)
 
-            if not self.is_table_valid(table_name):
-                warning("%s table does not exist" % (table_name))
-                continue
+    def convert_json_rules(self, acl_sets, skip_action_validation=False):
+        """
+        Convert rules in openconfig ACL format loaded from JSON to Config DB schema. Each ACL entry
+        is validated as pybindJSON would and converted as it is loaded.
+        :param acl_sets: dict of ACL sets by name, see load_acl_json()
+        :return:
+        """
+        for acl_set_name, acl_set in acl_sets.items():
+            acl_entries = self.iter_json_acl_entries(acl_set)
+            self.convert_acl_set(acl_set_name, acl_entries, skip_action_validation)
+            # The entries of the sets that are not converted are still validated
+            for _ in acl_entries:
+                pass
 
-            if self.current_table is not None and self.current_table != table_name:
-                continue
+    def iter_json_acl_entries(self, acl_set):
+        acl_set = dict(acl_set)
+        acl_entries = check_openconfig_container(acl_set.pop("acl-entries", {}), ["acl-entry"])
+        load_openconfig_container(acl_set, self.openconfig_acl_set)
+        acl_entries = acl_entries.get("acl-entry", {})
+        if not isinstance(acl_entries, dict):
+            raise ValueError("%r is not a list of ACL entries" % (acl_entries,))
+        for acl_entry_name, acl_entry in acl_entries.items():
+            yield acl_entry_name, load_openconfig_container(acl_entry, self.openconfig_acl_entry)
+
+    def convert_acl_set(self, acl_set_name, acl_entries, skip_action_validation=False):
+        """
+        Convert the rules of an ACL set to Config DB schema
+        :param acl_set_name: ACL set name
+        :param acl_entries: iterable of (ACL entry name, ACL entry) pairs
+        :return:
+        """
+        table_name = acl_set_name.replace(" ", "_").replace("-", "_").upper()
 
-            for acl_entry_name in acl_set.acl_entries.acl_entry:
-                acl_entry = acl_set.acl_entries.acl_entry[acl_entry_name]
-                try:
-                    rule = self.convert_rule_to_db_schema(table_name, acl_entry, skip_aciton_validation)
-                    deep_update(self.rules_info, rule)
-                except AclLoaderException as ex:
-                    error("Error processing rule %s: %s. Skipped." % (acl_entry_name, ex))
+        if not self.is_table_valid(table_name):
+            warning("%s table does not exist" % (table_name))
+            return
+
+        if self.current_table is not None and self.current_table != table_name:
+            return
 
-            if not self.is_table_egress(table_name):
-                deep_update(self.rules_info, self.deny_rule(table_name))
+        for acl_entry_name, acl_entry in acl_entries:
+            try:
+                rule = self.convert_rule_to_db_schema(table_name, acl_entry, skip_action_validation)
+                deep_update(self.rules_info, rule)
+            except AclLoaderException as ex:
+                error("Error processing rule %s: %s. Skipped." % (acl_entry_name, ex))
+
+        if not self.is_table_egress(table_name):
+            deep_update(self.rules_info, self.deny_rule(table_name))
+
+    def connect_configdb_pipes(self):
+        """
+        Connect to the host config DB, and to the config DB of every front asic namespace if present
+        :return: list of ConfigDBPipeConnector
+        """
+        configdb_pipes = [ConfigDBPipeConnector()]
+        for namespace in (self.per_npu_configdb or {}):
+            configdb_pipes.append(ConfigDBPipeConnector(namespace=namespace))
+        for configdb_pipe in configdb_pipes:
+            configdb_pipe.connect()
+        return configdb_pipes
+
+    def program_rules(self, current_rules, new_rules, replaced_tables=()):
+        """
+        Write the changes from current_rules to new_rules to the config DBs in pipelined batches.
+        The host and the front asic namespaces config DBs are programmed concurrently.
+        :param current_rules: Rules in Config DB schema to be replaced
+        :param new_rules: Rules in Config DB schema to be programmed
+        :param replaced_tables: Tables whose rules are all deleted and added again
+        :return: AclRulesDiff
+        """
+        diff = AclRulesDiff(current_rules, new_rules, replaced_tables)
+        batches = []
+        for batch in diff.get_batches(self.priority_order):
+            keys = list(batch)
+            for index in range(0, len(keys), self.rules_batch_size):
+                batches.append({key: batch[key] for key in keys[index:index + self.rules_batch_size]})
+        if not batches:
+            return diff
+
+        def program(configdb_pipe):
+            for batch in batches:
+                configdb_pipe.mod_config({self.ACL_RULE: batch})
+
+        configdb_pipes = self.connect_configdb_pipes()
+        with ThreadPoolExecutor(max_workers=len(configdb_pipes)) as executor:
+            # Raise the exceptions of the namespaces
+            list(executor.map(program, configdb_pipes))
+        return diff
 
     def full_update(self):
         """
@@ -799,95 +1154,22 @@ class AclLoader(object):
         will be removed. New rules loaded from file will be installed. If
         the current_table is not empty, only rules within that table will
         be removed and new rules in that table will be installed.
-        :return:
+        Only the control plane rules which differ are written, and all the
+        rules in priority order.
+        :return: AclRulesDiff
         """
-        for key in self.rules_db_info:
-            if self.current_table is None or self.current_table == key[0]:
-                self.configdb.mod_entry(self.ACL_RULE, key, None)
-                # Program for per front asic namespace also if present
-                for namespace_configdb in self.per_npu_configdb.values():
-                    namespace_configdb.mod_entry(self.ACL_RULE, key, None)
-
-
-        self.configdb.mod_config({self.ACL_RULE: self.rules_info})
-        # Program for per front asic namespace also if present
-        for namespace_configdb in self.per_npu_configdb.values():
-            namespace_configdb.mod_config({self.ACL_RULE: self.rules_info})
+        current_rules = {key: rule for key, rule in self.rules_db_info.items()
+                         if self.current_table is None or self.current_table == key[0]}
+        return self.program_rules(current_rules, self.rules_info, self.get_replaced_tables())
 
     def incremental_update(self):
         """
         Perform incremental ACL rules configuration update. Get existing rules from
         Config DB. Compare with rules specified in file and perform corresponding
         modifications.
-        :return:
+        :return: AclRulesDiff
         """
-
-        # TODO: Until we test ASIC behavior, we cannot assume that we can insert
-        # dataplane ACLs and shift existing ACLs. Therefore, we perform a full
-        # update on dataplane ACLs, and only perform an incremental update on
-        # control plane ACLs.
-
-        new_rules = set(self.rules_info.keys())
-        new_dataplane_rules = set()
-        new_controlplane_rules = set()
-        current_rules = set(self.rules_db_info.keys())
-        current_dataplane_rules = set()
-        current_controlplane_rules = set()
-
-        for key in new_rules:
-            table_name = key[0]
-            if self.tables_db_info[table_name]['type'].upper() == self.ACL_TABLE_TYPE_CTRLPLANE:
-                new_controlplane_rules.add(key)
-            else:
-                new_dataplane_rules.add(key)
-
-        for key in current_rules:
-            table_name = key[0]
-            if self.tables_db_info[table_name]['type'].upper() == self.ACL_TABLE_TYPE_CTRLPLANE:
-                current_controlplane_rules.add(key)
-            else:
-                current_dataplane_rules.add(key)
-
-        # Remove all existing dataplane rules
-        for key in current_dataplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, None)
-            # Program for per-asic namespace also if present
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, None)
-
-
-        # Add all new dataplane rules
-        for key in new_dataplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-            # Program for per-asic namespace corresponding to front asic also if present.
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-
-        added_controlplane_rules = new_controlplane_rules.difference(current_controlplane_rules)
-        removed_controlplane_rules = current_controlplane_rules.difference(new_controlplane_rules)
-        existing_controlplane_rules = new_rules.intersection(current_controlplane_rules)
-
-        for key in added_controlplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-            # Program for per-asic namespace corresponding to front asic also if present.
-            # For control plane ACL it's not needed but to keep all db in sync program everywhere
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-
-        for key in removed_controlplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, None)
-            # Program for per-asic namespace corresponding to front asic also if present.
-            # For control plane ACL it's not needed but to keep all db in sync program everywhere
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, None)
-
-        for key in existing_controlplane_rules:
-            if not operator.eq(self.rules_info[key], self.rules_db_info[key]):
-                self.configdb.set_entry(self.ACL_RULE, key, self.rules_info[key])
-                # Program for per-asic namespace corresponding to front asic also if present.
-                # For control plane ACL it's not needed but to keep all db in sync program everywhere
-                for namespace_configdb in self.per_npu_configdb.values():
-                    namespace_configdb.set_entry(self.ACL_RULE, key, self.rules_info[key])
+        return self.program_rules(self.rules_db_info, self.rules_info, self.get_replaced_tables())
 
     def delete(self, table=None, rule=None):
         """
@@ -895,13 +1177,9 @@ class AclLoader(object):
         :param rule:
         :return:
         """
-        for key in self.rules_db_info:
-            if not table or table == key[0]:
-                if not rule or rule == key[1]:
-                    self.configdb.set_entry(self.ACL_RULE, key, None)
-                    # Program for per-asic namespace corresponding to front asic also if present.
-                    for namespace_configdb in self.per_npu_configdb.values():
-                        namespace_configdb.set_entry(self.ACL_RULE, key, None)
+        remaining_rules = {key: value for key, value in self.rules_db_info.items()
+                           if (table and table != key[0]) or (rule and rule != key[1])}
+        self.program_rules(self.rules_db_info, remaining_rules)
 
     def show_table(self, table_name):
         """
@@ -1155,8 +1433,11 @@ def update(ctx):
 @click.option('--mirror_stage', type=click.Choice(["ingress", "egress"]), default="ingress")
 @click.option('--max_priority', type=click.INT, required=False)
 @click.option('--skip_action_validation', is_flag=True, default=False, help="Skip action validation")
+@click.option('--priority_order', is_flag=True, default=False,
+              help="Only write the changed rules, adding and modifying them in priority order "
+                   "before removing the stale rules")
 @click.pass_context
-def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, skip_action_validation):
+def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, skip_action_validation, priority_order):
     """
     Full update of ACL rules configuration.
     If a table_name is provided, the operation will be restricted in the specified table.
@@ -1174,6 +1455,8 @@ def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, sk
     if max_priority:
         acl_loader.set_max_priority(max_priority)
 
+    acl_loader.set_priority_order(priority_order)
+
     acl_loader.load_rules_from_file(filename, skip_action_validation)
     acl_loader.full_update()
 
@@ -1183,8 +1466,11 @@ def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, sk
 @click.option('--session_name', type=click.STRING, required=False)
 @click.option('--mirror_stage', type=click.Choice(["ingress", "egress"]), default="ingress")
 @click.option('--max_priority', type=click.INT, required=False)
+@click.option('--priority_order', is_flag=True, default=False,
+              help="Only write the changed rules, adding and modifying them in priority order "
+                   "before removing the stale rules")
 @click.pass_context
-def incremental(ctx, filename, session_name, mirror_stage, max_priority):
+def incremental(ctx, filename, session_name, mirror_stage, max_priority, priority_order):
     """
     Incremental update of ACL rule configuration.
     """
@@ -1198,6 +1484,8 @@ def incremental(ctx, filename, session_name, mirror_stage, max_priority):
     if max_priority:
         acl_loader.set_max_priority(max_priority)
 
+    acl_loader.set_priority_order(priority_order)
+
     acl_loader.load_rules_from_file(filename)
     acl_loader.incremental_update()
 
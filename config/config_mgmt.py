@@ -3,6 +3,7 @@ config_mgmt.py provides classes for configuration validation and for Dynamic
 Port Breakout.
 '''
 
+import copy
 import os
 import re
 import shutil
@@ -18,6 +19,7 @@ from jsondiff import diff
 from sonic_py_common import port_util
 from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
 from utilities_common.general import load_module_from_source
+from utilities_common import sonic_yang_cache
 
 
 # Load sonic-cfggen from source since /usr/local/bin/sonic-cfggen does not have .py extension.
@@ -71,9 +73,9 @@ class ConfigMgmt():
         return
 
     def __init_sonic_yang(self):
-        self.sy = sonic_yang.SonicYang(YANG_DIR, debug=self.DEBUG, sonic_yang_options=self.sonicYangOptions)
-        # load yang models
-        self.sy.loadYangModel()
+        # load yang models, they are shared in the process and data is loaded in a copy
+        self.sy = copy.copy(sonic_yang_cache.load_sonic_yang(
+            YANG_DIR, debug=self.DEBUG, sonic_yang_options=self.sonicYangOptions))
         # load jIn from config DB or from config DB json file.
         if self.source.lower() == 'configdb':
             self.readConfigDB()
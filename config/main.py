@@ -1,6 +1,7 @@
 #!/usr/sbin/env python
 
 import click
+import concurrent.futures
 import datetime
 import ipaddress
 import json
@@ -14,13 +15,15 @@ import sys
 import time
 import itertools
 import copy
+import multiprocessing
 import tempfile
 
 from jsonpatch import JsonPatchConflict
 from jsonpointer import JsonPointerException
 from collections import OrderedDict
 from generic_config_updater.generic_updater import GenericUpdater, ConfigFormat, extract_scope
-from generic_config_updater.gu_common import HOST_NAMESPACE, GenericConfigUpdaterError
+from generic_config_updater.gu_common import HOST_NAMESPACE, GenericConfigUpdaterError, ConfigWrapper, \
+    genericUpdaterLogging
 from minigraph import parse_device_desc_xml, minigraph_encoder
 from natsort import natsorted
 from portconfig import get_child_ports
@@ -43,24 +46,8 @@ import utilities_common.multi_asic as multi_asic_util
 
 from .utils import log
 
-from . import aaa
-from . import chassis_modules
-from . import console
-from . import feature
-from . import fabric
-from . import flow_counters
-from . import kdump
-from . import kube
-from . import muxcable
-from . import nat
-from . import vlan
-from . import vxlan
 from . import plugins
 from .config_mgmt import ConfigMgmtDPB, ConfigMgmt
-from . import mclag
-from . import syslog
-from . import switchport
-from . import dns
 
 
 # mock masic APIs for unit test
@@ -1174,27 +1161,70 @@ def multi_asic_save_config(db, filename):
     with open(filename, 'w') as file:
         json.dump(all_current_config, file, indent=4)
 
+
 # Function to apply patch for a single ASIC.
-def apply_patch_for_scope(scope_changes, results, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path):
+def apply_patch_for_scope(scope_changes, results, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path,
+                          incremental_validation=False):
     scope, changes = scope_changes
     # Replace localhost to DEFAULT_NAMESPACE which is db definition of Host
     if scope.lower() == HOST_NAMESPACE or scope == "":
         scope = multi_asic.DEFAULT_NAMESPACE
 
     scope_for_log = scope if scope else HOST_NAMESPACE
+    start_time = time.monotonic()
     try:
         # Call apply_patch with the ASIC-specific changes and predefined parameters
-        GenericUpdater(namespace=scope).apply_patch(jsonpatch.JsonPatch(changes),
-                                                    config_format,
-                                                    verbose,
-                                                    dry_run,
-                                                    ignore_non_yang_tables,
-                                                    ignore_path)
-        results[scope_for_log] = {"success": True, "message": "Success"}
-        log.log_notice(f"'apply-patch' executed successfully for {scope_for_log} by {changes}")
+        generic_updater = GenericUpdater(namespace=scope, incremental_validation=incremental_validation)
+        generic_updater.apply_patch(jsonpatch.JsonPatch(changes),
+                                    config_format,
+                                    verbose,
+                                    dry_run,
+                                    ignore_non_yang_tables,
+                                    ignore_path)
+        duration = time.monotonic() - start_time
+        results[scope_for_log] = {"success": True, "message": "Success", "duration": duration}
+        log.log_notice(f"'apply-patch' executed successfully for {scope_for_log} by {changes} in {duration:.2f}s")
     except Exception as e:
-        results[scope_for_log] = {"success": False, "message": str(e)}
-        log.log_error(f"'apply-patch' executed failed for {scope_for_log} by {changes} due to {str(e)}")
+        duration = time.monotonic() - start_time
+        results[scope_for_log] = {"success": False, "message": str(e), "duration": duration}
+        log.log_error(f"'apply-patch' executed failed for {scope_for_log} by {changes} due to {str(e)} "
+                      f"in {duration:.2f}s")
+
+
+def apply_patch_for_scope_in_worker(scope_changes, config_format, verbose, dry_run, ignore_non_yang_tables,
+                                    ignore_path, incremental_validation=False):
+    results = {}
+    apply_patch_for_scope(scope_changes, results, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path,
+                          incremental_validation)
+    return results
+
+
+# Function to apply patch for all the ASICs concurrently, one worker process per ASIC.
+def apply_patch_for_scopes_in_parallel(changes_by_scope, results, config_format, verbose, dry_run,
+                                       ignore_non_yang_tables, ignore_path, incremental_validation=False):
+    # Load the YANG models once, the forked workers inherit them
+    try:
+        genericUpdaterLogging.set_verbose(verbose)
+        ConfigWrapper().create_sonic_yang_with_loaded_models()
+    except Exception as e:
+        # Every scope loads the models again and reports the failure
+        log.log_warning(f"'apply-patch' failed to preload YANG models due to {str(e)}")
+
+    # A scope mostly waits on the databases and on the services validation, so every scope gets its own worker
+    mp_context = multiprocessing.get_context('fork')
+    with concurrent.futures.ProcessPoolExecutor(max_workers=len(changes_by_scope), mp_context=mp_context) as executor:
+        futures = [executor.submit(apply_patch_for_scope_in_worker, scope_changes, config_format, verbose, dry_run,
+                                   ignore_non_yang_tables, ignore_path, incremental_validation)
+                   for scope_changes in changes_by_scope.items()]
+        # The results are collected in the scopes order
+        for (scope, changes), future in zip(changes_by_scope.items(), futures):
+            try:
+                results.update(future.result())
+            except Exception as e:
+                # The worker process died, the changes of the scope may be partially applied
+                scope_for_log = scope if scope and scope.lower() != HOST_NAMESPACE else HOST_NAMESPACE
+                results[scope_for_log] = {"success": False, "message": str(e), "duration": None}
+                log.log_error(f"'apply-patch' executed failed for {scope_for_log} by {changes} due to {str(e)}")
 
 
 def validate_patch(patch):
@@ -1259,35 +1289,31 @@ def config(ctx):
     ctx.obj = Db()
 
 
-# Add groups from other modules
-config.add_command(aaa.aaa)
-config.add_command(aaa.tacacs)
-config.add_command(aaa.radius)
-config.add_command(chassis_modules.chassis)
-config.add_command(console.console)
-config.add_command(fabric.fabric)
-config.add_command(feature.feature)
-config.add_command(flow_counters.flowcnt_route)
-config.add_command(kdump.kdump)
-config.add_command(kube.kubernetes)
-config.add_command(muxcable.muxcable)
-config.add_command(nat.nat)
-config.add_command(vlan.vlan)
-config.add_command(vxlan.vxlan)
-
-#add mclag commands
-config.add_command(mclag.mclag)
-config.add_command(mclag.mclag_member)
-config.add_command(mclag.mclag_unique_ip)
-
-# syslog module
-config.add_command(syslog.syslog)
-
-# DNS module
-config.add_command(dns.dns)
-
-# Switchport module
-config.add_command(switchport.switchport)
+# Groups from other modules, the modules are only imported when their group is invoked
+SUBCOMMANDS = {
+    'aaa': 'config.aaa:aaa',
+    'chassis': 'config.chassis_modules:chassis',
+    'console': 'config.console:console',
+    'dns': 'config.dns:dns',
+    'fabric': 'config.fabric:fabric',
+    'feature': 'config.feature:feature',
+    'flowcnt-route': 'config.flow_counters:flowcnt_route',
+    'kdump': 'config.kdump:kdump',
+    'kubernetes': 'config.kube:kubernetes',
+    'mclag': 'config.mclag:mclag',
+    'member': 'config.mclag:mclag_member',
+    'muxcable': 'config.muxcable:muxcable',
+    'nat': 'config.nat:nat',
+    'radius': 'config.aaa:radius',
+    'switchport': 'config.switchport:switchport',
+    'syslog': 'config.syslog:syslog',
+    'tacacs': 'config.aaa:tacacs',
+    'unique-ip': 'config.mclag:mclag_unique_ip',
+    'vlan': 'config.vlan:vlan',
+    'vxlan': 'config.vxlan:vxlan',
+}
+
+config.add_lazy_commands(SUBCOMMANDS)
 
 @config.command()
 @click.option('-y', '--yes', is_flag=True, callback=_abort_if_false,
@@ -1424,8 +1450,12 @@ def print_dry_run_message(dry_run):
 @click.option('-n', '--ignore-non-yang-tables', is_flag=True, default=False, help='ignore validation for tables without YANG models', hidden=True)
 @click.option('-i', '--ignore-path', multiple=True, help='ignore validation for config specified by given path which is a JsonPointer', hidden=True)
 @click.option('-v', '--verbose', is_flag=True, default=False, help='print additional details of what the operation is doing')
+@click.option('-p', '--parallel', is_flag=True, default=False, help='apply the patch to the ASICs concurrently')
+@click.option('--incremental-validation', is_flag=True, default=False,
+              help='validate only the tables affected by each change while sorting the patch')
 @click.pass_context
-def apply_patch(ctx, patch_file_path, format, dry_run, ignore_non_yang_tables, ignore_path, verbose):
+def apply_patch(ctx, patch_file_path, format, dry_run, ignore_non_yang_tables, ignore_path, verbose, parallel,
+                incremental_validation):
     """Apply given patch of updates to Config. A patch is a JsonPatch which follows rfc6902.
        This command can be used do partial updates to the config with minimum disruption to running processes.
        It allows addition as well as deletion of configs. The patch file represents a diff of ConfigDb(ABNF)
@@ -1471,8 +1501,19 @@ def apply_patch(ctx, patch_file_path, format, dry_run, ignore_non_yang_tables, i
                 changes_by_scope[asic] = []
 
         # Apply changes for each scope
-        for scope_changes in changes_by_scope.items():
-            apply_patch_for_scope(scope_changes, results, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path)
+        if parallel and len(changes_by_scope) > 1:
+            apply_patch_for_scopes_in_parallel(changes_by_scope, results, config_format, verbose, dry_run,
+                                               ignore_non_yang_tables, ignore_path, incremental_validation)
+        else:
+            for scope_changes in changes_by_scope.items():
+                apply_patch_for_scope(scope_changes, results, config_format, verbose, dry_run,
+                                      ignore_non_yang_tables, ignore_path, incremental_validation)
+
+        if verbose:
+            for scope, result in results.items():
+                if result.get("duration") is not None:
+                    status = 'succeeded' if result['success'] else 'failed'
+                    click.echo(f"Scope {scope}: {status} in {result['duration']:.2f}s")
 
         # Check if any updates failed
         failures = [scope for scope, result in results.items() if not result['success']]
@@ -1497,8 +1538,11 @@ def apply_patch(ctx, patch_file_path, format, dry_run, ignore_non_yang_tables, i
 @click.option('-n', '--ignore-non-yang-tables', is_flag=True, default=False, help='ignore validation for tables without YANG models', hidden=True)
 @click.option('-i', '--ignore-path', multiple=True, help='ignore validation for config specified by given path which is a JsonPointer', hidden=True)
 @click.option('-v', '--verbose', is_flag=True, default=False, help='print additional details of what the operation is doing')
+@click.option('--incremental-validation', is_flag=True, default=False,
+              help='validate only the tables affected by each change while sorting the patch')
 @click.pass_context
-def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, ignore_path, verbose):
+def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, ignore_path, verbose,
+            incremental_validation):
     """Replace the whole config with the specified config. The config is replaced with minimum disruption e.g.
        if ACL config is different between current and target config only ACL config is updated, and other config/services
        such as DHCP will not be affected.
@@ -1515,7 +1559,8 @@ def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, igno
 
         config_format = ConfigFormat[format.upper()]
 
-        GenericUpdater().replace(target_config, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path)
+        GenericUpdater(incremental_validation=incremental_validation).replace(
+            target_config, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path)
 
         click.secho("Config replaced successfully.", fg="cyan", underline=True)
     except Exception as ex:
@@ -1528,8 +1573,10 @@ def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, igno
 @click.option('-n', '--ignore-non-yang-tables', is_flag=True, default=False, help='ignore validation for tables without YANG models', hidden=True)
 @click.option('-i', '--ignore-path', multiple=True, help='ignore validation for config specified by given path which is a JsonPointer', hidden=True)
 @click.option('-v', '--verbose', is_flag=True, default=False, help='print additional details of what the operation is doing')
+@click.option('--incremental-validation', is_flag=True, default=False,
+              help='validate only the tables affected by each change while sorting the patch')
 @click.pass_context
-def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path, verbose):
+def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path, verbose, incremental_validation):
     """Rollback the whole config to the specified checkpoint. The config is rolled back with minimum disruption e.g.
        if ACL config is different between current and checkpoint config only ACL config is updated, and other config/services
        such as DHCP will not be affected.
@@ -1538,7 +1585,8 @@ def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path,
     try:
         print_dry_run_message(dry_run)
 
-        GenericUpdater().rollback(checkpoint_name, verbose, dry_run, ignore_non_yang_tables, ignore_path)
+        GenericUpdater(incremental_validation=incremental_validation).rollback(
+            checkpoint_name, verbose, dry_run, ignore_non_yang_tables, ignore_path)
 
         click.secho("Config rolled back successfully.", fg="cyan", underline=True)
     except Exception as ex:
@@ -7427,7 +7475,7 @@ def smoothing_interval(interval, rates_type):
 
 # Load plugins and register them
 helper = util_base.UtilHelper()
-helper.load_and_register_plugins(plugins, config)
+helper.load_and_register_plugins(plugins, config, lazy=True)
 
 #
 # 'subinterface' group ('config subinterface ...')
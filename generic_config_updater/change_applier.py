@@ -1,14 +1,15 @@
 import copy
 import json
-import subprocess
 import jsondiff
 import importlib
 import os
-import tempfile
+import time
 from collections import defaultdict
 from swsscommon.swsscommon import ConfigDBConnector
 from sonic_py_common import multi_asic
-from .gu_common import GenericConfigUpdaterError, genericUpdaterLogging
+from utilities_common.bulk_reader import get_pipeline_client
+from .gu_common import GenericConfigUpdaterError, genericUpdaterLogging, get_config_db_pipe_connector, \
+    read_config_db
 
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 UPDATER_CONF_FILE = f"{SCRIPT_DIR}/gcu_services_validator.conf.json"
@@ -39,8 +40,51 @@ def get_config_db(namespace=multi_asic.DEFAULT_NAMESPACE):
     config_db.connect()
     return config_db
 
-def set_config(config_db, tbl, key, data):
-    config_db.set_entry(tbl, key, data)
+
+def set_config(config_db, entries):
+    """
+    Write entries, a list of (tbl, key, old data, new data), to CONFIG_DB in one
+    MULTI/EXEC transaction. The new fields of an entry are set, its old fields that
+    are not in the new data are removed with HDEL, as ConfigDBConnector.set_entry()
+    does. Entries with new data None are deleted.
+    If no redis client supporting pipelines can be opened, the entries are written
+    with config_db.mod_config() and the old fields are removed after it.
+    """
+    client = get_pipeline_client(config_db, config_db.db_name)
+    if client is None:
+        set_config_without_pipeline(config_db, entries)
+        return
+
+    pipe = client.pipeline(transaction=True)
+    for tbl, key, old_data, new_data in entries:
+        _hash = '{}{}{}'.format(tbl.upper(), config_db.TABLE_NAME_SEPARATOR, config_db.serialize_key(key))
+        if new_data is None:
+            pipe.delete(_hash)
+            continue
+        raw_data = config_db.typed_to_raw(new_data)
+        pipe.hmset(_hash, raw_data)
+        if old_data is not None:
+            removed_fields = [field for field in config_db.typed_to_raw(old_data) if field not in raw_data]
+            if removed_fields:
+                pipe.hdel(_hash, *removed_fields)
+    pipe.execute()
+
+
+def set_config_without_pipeline(config_db, entries):
+    data = defaultdict(dict)
+    removed_fields = []
+    for tbl, key, old_data, new_data in entries:
+        data[tbl][key] = new_data
+        if new_data is None or old_data is None:
+            continue
+        raw_data = config_db.typed_to_raw(new_data)
+        _hash = '{}{}{}'.format(tbl.upper(), config_db.TABLE_NAME_SEPARATOR, config_db.serialize_key(key))
+        removed_fields.extend((_hash, field) for field in config_db.typed_to_raw(old_data) if field not in raw_data)
+    config_db.mod_config(data)
+
+    client = config_db.get_redis_client(config_db.db_name)
+    for _hash, field in removed_fields:
+        client.hdel(_hash, field)
 
 
 def prune_empty_table(data):
@@ -82,6 +126,8 @@ class ChangeApplier:
             "BUFFER_PROFILE",
             "FLEX_COUNTER_TABLE"
         ]
+        # In-memory copy of the running config, kept up to date as changes are applied
+        self.running_config = None
         if (not ChangeApplier.updater_conf) and os.path.exists(UPDATER_CONF_FILE):
             with open(UPDATER_CONF_FILE, "r") as s:
                 ChangeApplier.updater_conf = json.load(s)
@@ -124,14 +170,13 @@ class ChangeApplier:
             log_debug("service invoked: {}".format(cmd))
         return 0
 
-
-    def _upd_data(self, tbl, run_tbl, upd_tbl, upd_keys):
+    def _upd_data(self, tbl, run_tbl, upd_tbl, upd_keys, upd_entries):
         for key in set(run_tbl.keys()).union(set(upd_tbl.keys())):
             run_data = run_tbl.get(key, None)
             upd_data = upd_tbl.get(key, None)
 
             if run_data != upd_data:
-                set_config(self.config_db, tbl, key, upd_data)
+                upd_entries.append((tbl, key, run_data, upd_data))
                 upd_keys[tbl][key] = {}
                 log_debug("Patch affected tbl={} key={}".format(tbl, key))
 
@@ -142,52 +187,66 @@ class ChangeApplier:
 
 
     def apply(self, change):
-        run_data = self._get_running_config()
-        upd_data = prune_empty_table(change.apply(copy.deepcopy(run_data)))
+        run_data = self._get_running_data()
+        start_time = time.monotonic()
+        upd_data = prune_empty_table(change.apply(copy.deepcopy(run_data), in_place=True))
         upd_keys = defaultdict(dict)
+        upd_entries = []
 
         for tbl in sorted(set(run_data.keys()).union(set(upd_data.keys()))):
             self._upd_data(tbl, run_data.get(tbl, {}),
-                    upd_data.get(tbl, {}), upd_keys)
+                           upd_data.get(tbl, {}), upd_keys, upd_entries)
+
+        # All the keys updated by the change are written at once
+        if upd_entries:
+            set_config(self.config_db, upd_entries)
+        write_time = time.monotonic() - start_time
 
         ret = self._services_validate(run_data, upd_data, upd_keys)
         if not ret:
-            run_data = self._get_running_config()
-            self.remove_backend_tables_from_config(upd_data)
-            self.remove_backend_tables_from_config(run_data)
-            if upd_data != run_data:
-                self._report_mismatch(run_data, upd_data)
+            # Only the updated tables are read back, the other tables were not written
+            tables = [tbl for tbl in upd_keys if tbl and tbl not in self.backend_tables]
+            run_tables = self._get_running_tables(tables)
+            upd_tables = {tbl: upd_data[tbl] for tbl in tables if tbl in upd_data}
+            if upd_tables != run_tables:
+                self._report_mismatch(run_tables, upd_tables)
                 ret = -1
         if ret:
             log_error("Failed to apply Json change")
+            # The running config is read again on next change
+            self.running_config = None
+        else:
+            # The updated tables are kept as read back
+            self.running_config = {tbl: entries for tbl, entries in upd_data.items()
+                                   if tbl not in self.backend_tables and tbl not in tables}
+            self.running_config.update(run_tables)
+        log_debug("Change applied in {:.3f}s, {} key(s) written in {:.3f}s".format(
+            time.monotonic() - start_time, len(upd_entries), write_time))
         return ret
 
     def remove_backend_tables_from_config(self, data):
         for key in self.backend_tables:
             data.pop(key, None)
 
-    def _get_running_config(self):
-        _, fname = tempfile.mkstemp(suffix="_changeApplier")
-        
-        if self.namespace:
-            cmd = ['sonic-cfggen', '-d', '--print-data', '-n', self.namespace]
+    def _get_running_data(self):
+        """
+        Return the running config to apply a change to. The backend tables are also written by the
+        daemons, so they are read again for every change, the other tables are kept in memory.
+        """
+        if self.running_config is None:
+            run_data = self._get_running_config()
         else:
-            cmd = ['sonic-cfggen', '-d', '--print-data']
-
-        with open(fname, "w") as file:
-            result = subprocess.Popen(cmd, stdout=file, stderr=subprocess.PIPE, text=True)
-            _, err = result.communicate()
-
-        return_code = result.returncode
-        if return_code:
-            os.remove(fname)
-            raise GenericConfigUpdaterError(f"Failed to get running config for namespace: {self.namespace}, Return code: {return_code}, Error: {err}")
+            run_data = dict(self.running_config)
+            run_data.update(self._get_running_tables(self.backend_tables))
+        self.running_config = {tbl: entries for tbl, entries in run_data.items() if tbl not in self.backend_tables}
+        return run_data
 
-        run_data = {}
+    def _get_running_config(self):
         try:
-            with open(fname, "r") as file:
-                run_data = json.load(file)
-        finally:
-            if os.path.isfile(fname):
-                os.remove(fname)
-        return run_data
+            return read_config_db(get_config_db_pipe_connector(self.namespace))
+        except Exception as ex:
+            raise GenericConfigUpdaterError(f"Failed to get running config for namespace: {self.namespace}, "
+                                            f"Error: {ex}")
+
+    def _get_running_tables(self, tables):
+        return read_config_db(self.config_db, tables)
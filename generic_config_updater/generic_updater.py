@@ -4,7 +4,7 @@ import os
 from enum import Enum
 from .gu_common import HOST_NAMESPACE, GenericConfigUpdaterError, EmptyTableError, ConfigWrapper, \
                        DryRunConfigWrapper, PatchWrapper, genericUpdaterLogging
-from .patch_sorter import StrictPatchSorter, NonStrictPatchSorter, ConfigSplitter, \
+from .patch_sorter import PatchSorter, StrictPatchSorter, NonStrictPatchSorter, ConfigSplitter, \
                           TablesWithoutYangConfigSplitter, IgnorePathsFromYangConfigSplitter
 from .change_applier import ChangeApplier, DryRunChangeApplier
 from sonic_py_common import multi_asic
@@ -345,8 +345,9 @@ class ConfigLockDecorator(Decorator):
 
 
 class GenericUpdateFactory:
-    def __init__(self, namespace=multi_asic.DEFAULT_NAMESPACE):
+    def __init__(self, namespace=multi_asic.DEFAULT_NAMESPACE, incremental_validation=False):
         self.namespace = namespace
+        self.incremental_validation = incremental_validation
 
     def create_patch_applier(self, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths):
         self.init_verbose_logging(verbose)
@@ -441,8 +442,10 @@ class GenericUpdateFactory:
             return ChangeApplier(namespace=self.namespace)
 
     def get_patch_sorter(self, ignore_non_yang_tables, ignore_paths, config_wrapper, patch_wrapper):
+        inner_patch_sorter = PatchSorter(config_wrapper, patch_wrapper,
+                                         incremental_validation=self.incremental_validation)
         if not ignore_non_yang_tables and not ignore_paths:
-            return StrictPatchSorter(config_wrapper, patch_wrapper)
+            return StrictPatchSorter(config_wrapper, patch_wrapper, inner_patch_sorter)
 
         inner_config_splitters = []
         if ignore_non_yang_tables:
@@ -453,13 +456,14 @@ class GenericUpdateFactory:
 
         config_splitter = ConfigSplitter(config_wrapper, inner_config_splitters)
 
-        return NonStrictPatchSorter(config_wrapper, patch_wrapper, config_splitter)
+        return NonStrictPatchSorter(config_wrapper, patch_wrapper, config_splitter, patch_sorter=inner_patch_sorter)
 
 
 class GenericUpdater:
-    def __init__(self, generic_update_factory=None, namespace=multi_asic.DEFAULT_NAMESPACE):
-        self.generic_update_factory = \
-            generic_update_factory if generic_update_factory is not None else GenericUpdateFactory(namespace=namespace)
+    def __init__(self, generic_update_factory=None, namespace=multi_asic.DEFAULT_NAMESPACE,
+                 incremental_validation=False):
+        self.generic_update_factory = generic_update_factory if generic_update_factory is not None else \
+            GenericUpdateFactory(namespace=namespace, incremental_validation=incremental_validation)
 
     def apply_patch(self, patch, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths, sort=True):
         patch_applier = self.generic_update_factory.create_patch_applier(config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths)
@@ -4,13 +4,15 @@ import importlib
 from jsonpointer import JsonPointer
 import sonic_yang
 import sonic_yang_ext
-import subprocess
 import yang as ly
 import copy
 import re
 import os
+from collections import OrderedDict
 from sonic_py_common import logger, multi_asic
+from swsscommon.swsscommon import ConfigDBPipeConnector
 from enum import Enum
+from utilities_common import sonic_yang_cache
 
 YANG_DIR = "/usr/local/yang-models"
 SYSLOG_IDENTIFIER = "GenericConfigUpdater"
@@ -37,8 +39,8 @@ class JsonChange:
     def __init__(self, patch):
         self.patch = patch
 
-    def apply(self, config):
-        return self.patch.apply(config)
+    def apply(self, config, in_place=False):
+        return self.patch.apply(config, in_place=in_place)
 
     def __repr__(self):
         return str(self)
@@ -52,31 +54,49 @@ class JsonChange:
             return self.patch == other.patch
         return False
 
+
+def get_config_db_pipe_connector(namespace=multi_asic.DEFAULT_NAMESPACE):
+    if namespace is None:
+        namespace = multi_asic.DEFAULT_NAMESPACE
+    config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=namespace)
+    config_db.connect()
+    return config_db
+
+
+def read_config_db(config_db, tables=None):
+    """
+    Read CONFIG_DB as JSON, in the same format as 'sonic-cfggen -d --print-data'.
+    If tables is None, the whole config is read with one pipelined dump, otherwise only the given tables are read.
+    """
+    if tables is None:
+        data = config_db.get_config()
+    else:
+        data = {}
+        for table in tables:
+            entries = config_db.get_table(table)
+            if entries:
+                data[table] = entries
+
+    return {table: {config_db.serialize_key(key): entry for key, entry in entries.items()}
+            for table, entries in data.items()}
+
 class ConfigWrapper:
     def __init__(self, yang_dir=YANG_DIR, namespace=multi_asic.DEFAULT_NAMESPACE):
         self.namespace = namespace
         self.yang_dir = YANG_DIR
         self.sonic_yang_with_loaded_models = None
+        self.table_dependencies = None
 
     def get_config_db_as_json(self):
-        text = self._get_config_db_as_text()
-        config_db_json = json.loads(text)
+        # CONFIG_DB is read in-process instead of forking 'sonic-cfggen -d --print-data'
+        try:
+            config_db_json = read_config_db(get_config_db_pipe_connector(self.namespace))
+        except Exception as ex:
+            raise GenericConfigUpdaterError(f"Failed to get running config for namespace: {self.namespace}, "
+                                            f"Error: {ex}")
         config_db_json.pop("bgpraw", None)
         return config_db_json
 
-    def _get_config_db_as_text(self):
-        if self.namespace is not None and self.namespace != multi_asic.DEFAULT_NAMESPACE:
-            cmd = ['sonic-cfggen', '-d', '--print-data', '-n', self.namespace]
-        else:
-            cmd = ['sonic-cfggen', '-d', '--print-data']
-
-        result = subprocess.Popen(cmd, shell=False, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        text, err = result.communicate()
-        return_code = result.returncode
-        if return_code: # non-zero means failure
-            raise GenericConfigUpdaterError(f"Failed to get running config for namespace: {self.namespace}, Return code: {return_code}, Error: {err}")
-        return text
-
     def get_sonic_yang_as_json(self):
         config_db_json = self.get_config_db_as_json()
         return self.convert_config_db_to_sonic_yang(config_db_json)
@@ -288,14 +308,101 @@ class ConfigWrapper:
                 config_with_non_empty_tables[table] = copy.deepcopy(config[table])
         return config_with_non_empty_tables
 
+    def get_table_dependencies(self):
+        """
+        Returns a dict mapping every table with a YANG model to the set of tables its YANG model can refer to
+        i.e. through leafref, must or when statements, including the table itself.
+        Returns None if the dependencies cannot be found from the YANG models.
+        """
+        if self.table_dependencies is None:
+            try:
+                self.table_dependencies = self._create_table_dependencies()
+            except Exception:
+                # Unexpected YANG models layout, callers will validate whole configs
+                self.table_dependencies = {}
+
+        return self.table_dependencies if self.table_dependencies else None
+
+    def _create_table_dependencies(self):
+        sy = self.create_sonic_yang_with_loaded_models()
+
+        # confDbYangMap maps tables to their module, and common modules without tables to themselves
+        modules = {}
+        table_modules = {}
+        for name, cmap in sy.confDbYangMap.items():
+            if 'yangModule' in cmap:
+                modules[cmap['module']] = cmap['yangModule']
+                table_modules[name] = cmap['module']
+            else:
+                modules[cmap['@name']] = cmap
+        tables = set(table_modules)
+
+        def get_xpaths(model):
+            # XPaths of the leafref paths, and of the must and when conditions
+            if isinstance(model, str):
+                yield model
+            elif isinstance(model, list):
+                for item in model:
+                    yield from get_xpaths(item)
+            elif isinstance(model, dict):
+                for name, value in model.items():
+                    if name == 'path' and isinstance(value, dict) and '@value' in value:
+                        yield value['@value']
+                    elif name in ('must', 'when'):
+                        for statement in value if isinstance(value, list) else [value]:
+                            yield statement['@condition']
+                    elif isinstance(value, (dict, list)):
+                        yield from get_xpaths(value)
+
+        def get_mentioned_tables(model):
+            # Tables show up as location steps of the XPaths e.g. /port:sonic-port/port:PORT/port:PORT_LIST/port:name
+            steps = set()
+            for xpath in get_xpaths(model):
+                steps.update(re.findall(r'(?:^|/)\s*(?:[\w.-]+:)?([\w.-]+)', xpath))
+            return tables.intersection(steps)
+
+        def get_imported_modules(module_name, imported_modules):
+            if module_name in imported_modules or module_name not in modules:
+                return imported_modules
+            imported_modules.add(module_name)
+            imports = modules[module_name].get('import', [])
+            for item in imports if isinstance(imports, list) else [imports]:
+                get_imported_modules(item['@module'], imported_modules)
+            return imported_modules
+
+        # A table can refer to any table in the XPaths of its module, or of the modules its module imports
+        module_dependencies = {}
+        for module_name in set(table_modules.values()):
+            module_dependencies[module_name] = set()
+            for imported_module_name in get_imported_modules(module_name, set()):
+                module_dependencies[module_name] |= get_mentioned_tables(modules[imported_module_name])
+
+        table_dependencies = {}
+        for table, module_name in table_modules.items():
+            table_dependencies[table] = {table} | module_dependencies[module_name]
+
+        # An augmented table can also refer to the tables the augmenting module refers to
+        for module_name, module in modules.items():
+            augments = module.get('augment', [])
+            for augment in augments if isinstance(augments, list) else [augments]:
+                augmenting_dependencies = module_dependencies.get(module_name)
+                if augmenting_dependencies is None:
+                    augmenting_dependencies = set()
+                    for imported_module_name in get_imported_modules(module_name, set()):
+                        augmenting_dependencies |= get_mentioned_tables(modules[imported_module_name])
+                for table in get_mentioned_tables(augment.get('@target-node', '')):
+                    table_dependencies[table] |= augmenting_dependencies
+
+        return table_dependencies
+
     # TODO: move creating copies of sonic_yang with loaded models to sonic-yang-mgmt directly
     def create_sonic_yang_with_loaded_models(self):
         # sonic_yang_with_loaded_models will only be initialized once the first time this method is called
         if self.sonic_yang_with_loaded_models is None:
             sonic_yang_print_log_enabled = genericUpdaterLogging.get_verbose()
-            loaded_models_sy = sonic_yang.SonicYang(self.yang_dir, print_log_enabled=sonic_yang_print_log_enabled)
-            loaded_models_sy.loadYangModel() # This call takes a long time (100s of ms) because it reads files from disk
-            self.sonic_yang_with_loaded_models = loaded_models_sy
+            # Loading the models takes a long time (seconds), they are shared by all the ConfigWrapper instances
+            self.sonic_yang_with_loaded_models = sonic_yang_cache.load_sonic_yang(
+                self.yang_dir, print_log_enabled=sonic_yang_print_log_enabled)
 
         return copy.copy(self.sonic_yang_with_loaded_models)
 
@@ -309,11 +416,12 @@ class DryRunConfigWrapper(ConfigWrapper):
     def apply_change_to_config_db(self, change):
         self._init_imitated_config_db_if_none()
         self.logger.log_notice(f"Would apply {change}")
-        self.imitated_config_db = change.apply(self.imitated_config_db)
+        # The imitated config_db is private, the change is applied in place instead of on a copy
+        self.imitated_config_db = change.apply(self.imitated_config_db, in_place=True)
 
     def get_config_db_as_json(self):
         self._init_imitated_config_db_if_none()
-        return self.imitated_config_db
+        return copy.deepcopy(self.imitated_config_db)
 
     def _init_imitated_config_db_if_none(self):
         # if there is no initial imitated config_db and it is the first time calling this method
@@ -395,6 +503,79 @@ class OperationWrapper:
 
         return operation
 
+
+class RefPathsIndex:
+    """
+    A reverse index of the leafref references of a config: the paths referencing each leaf of the config.
+
+    The leaves are grouped by table and key e.g. /PORT/Ethernet0, so that finding the references to a path
+    is a few dictionary lookups. An index is never modified, remove_paths() returns a new index.
+    """
+    def __init__(self, refs=None):
+        # {table: {key: {leaf_path: set of ref_paths}}}, key is None for leaves directly under the table
+        self.refs = refs if refs is not None else {}
+
+    def add(self, leaf_path, ref_path):
+        tokens = JsonPointer(leaf_path).parts
+        table = tokens[0]
+        key = tokens[1] if len(tokens) > 1 else None
+        self.refs.setdefault(table, {}).setdefault(key, {}).setdefault(leaf_path, set()).add(ref_path)
+
+    def find_ref_paths(self, path):
+        """
+        Finds the paths referencing any leaf under the given 'path'.
+        """
+        tokens = JsonPointer(path).parts
+        if not tokens:
+            groups = [group for table in self.refs.values() for group in table.values()]
+        elif len(tokens) == 1:
+            groups = list(self.refs.get(tokens[0], {}).values())
+        else:
+            group = self.refs.get(tokens[0], {}).get(tokens[1], {})
+            groups = [{leaf_path: ref_paths for leaf_path, ref_paths in group.items()
+                       if _is_path_under(leaf_path, path)}]
+
+        ref_paths = set()
+        for group in groups:
+            for leaf_ref_paths in group.values():
+                ref_paths.update(leaf_ref_paths)
+        return sorted(ref_paths)
+
+    def remove_paths(self, paths):
+        """
+        Returns the index of the config without the given paths, the references to and from them are dropped.
+        """
+        refs = {table: dict(groups) for table, groups in self.refs.items()}
+        for path in paths:
+            tokens = JsonPointer(path).parts
+            if not tokens:
+                return RefPathsIndex()
+            if len(tokens) == 1:
+                refs.pop(tokens[0], None)
+            elif len(tokens) == 2:
+                refs.get(tokens[0], {}).pop(tokens[1], None)
+            elif tokens[1] in refs.get(tokens[0], {}):
+                refs[tokens[0]][tokens[1]] = {leaf_path: ref_paths
+                                              for leaf_path, ref_paths in refs[tokens[0]][tokens[1]].items()
+                                              if not _is_path_under(leaf_path, path)}
+
+        for groups in refs.values():
+            for key, group in groups.items():
+                new_group = {}
+                for leaf_path, ref_paths in group.items():
+                    kept_ref_paths = {ref_path for ref_path in ref_paths
+                                      if not any(_is_path_under(ref_path, path) for path in paths)}
+                    if kept_ref_paths:
+                        new_group[leaf_path] = kept_ref_paths
+                groups[key] = new_group
+
+        return RefPathsIndex(refs)
+
+
+def _is_path_under(path, parent_path):
+    return path == parent_path or path.startswith(parent_path + PathAddressing.PATH_SEPARATOR)
+
+
 class PathAddressing:
     """
     Path refers to the 'path' in JsonPatch operations: https://tools.ietf.org/html/rfc6902
@@ -406,8 +587,15 @@ class PathAddressing:
     PATH_SEPARATOR = "/"
     XPATH_SEPARATOR = "/"
 
+    # Number of configs whose references index is kept, the sorters query the current config and the configs
+    # simulated from it
+    MAX_REF_PATHS_INDEXES = 32
+
     def __init__(self, config_wrapper=None):
         self.config_wrapper = config_wrapper
+        # {id(config): (config, snapshot of the config, RefPathsIndex)}, the config is kept so that its id is not
+        # reused, the snapshot to detect the config being modified in place
+        self._ref_paths_indexes = OrderedDict()
 
     def get_path_tokens(self, path):
         return JsonPointer(path).parts
@@ -553,42 +741,132 @@ class PathAddressing:
         return self._find_leafref_paths(path, config)
 
     def _find_leafref_paths(self, path, config):
+        return self._get_ref_paths_index(config).find_ref_paths(path)
+
+    def _get_ref_paths_index(self, config):
+        """
+        Returns the references index of the given config.
+
+        The index is built once per config. A config modified in place since it was indexed no longer matches the
+        snapshot kept with its index, and is indexed again. The index of a config obtained by removing paths from
+        a config already indexed e.g. by simulating a remove move, is derived from the index of the latter.
+        """
+        config_id = id(config)
+        entry = self._ref_paths_indexes.pop(config_id, None)
+        if entry is not None and entry[0] is config and entry[1] == config:
+            self._ref_paths_indexes[config_id] = entry
+            return entry[2]
+
+        snapshot = None
+        index = None
+        for indexed_config, indexed_snapshot, indexed_index in reversed(self._ref_paths_indexes.values()):
+            removed_paths = self._get_removed_paths(indexed_config, config, [])
+            if removed_paths is not None:
+                derived_snapshot = self._remove_paths(indexed_snapshot, removed_paths)
+                if derived_snapshot == config:
+                    snapshot = derived_snapshot
+                    index = indexed_index.remove_paths(removed_paths) if removed_paths else indexed_index
+                break
+
+        if index is None:
+            snapshot = copy.deepcopy(config)
+            index = self._build_ref_paths_index(config)
+
+        self._ref_paths_indexes[config_id] = (config, snapshot, index)
+        if len(self._ref_paths_indexes) > self.MAX_REF_PATHS_INDEXES:
+            self._ref_paths_indexes.popitem(last=False)
+        return index
+
+    def _remove_paths(self, config, paths):
+        """
+        Returns a copy of the config without the given paths. Only the containers on the paths are copied.
+        """
+        new_config = copy.copy(config)
+        for path in paths:
+            tokens = self.get_path_tokens(path)
+            ptr = new_config
+            for token in tokens[:-1]:
+                ptr[token] = copy.copy(ptr[token])
+                ptr = ptr[token]
+            del ptr[tokens[-1]]
+        return new_config
+
+    def _get_removed_paths(self, old_config, new_config, tokens):
+        """
+        Returns the paths removed from old_config to get new_config, or None if new_config has other changes.
+        The containers shared between the configs are not compared.
+        """
+        if old_config is new_config:
+            return []
+
+        if not isinstance(old_config, dict) or not isinstance(new_config, dict):
+            return [] if old_config == new_config else None
+
+        for key in new_config:
+            if key not in old_config:
+                return None
+
+        removed_paths = []
+        for key, old_value in old_config.items():
+            tokens.append(key)
+            if key not in new_config:
+                removed_paths.append(self.create_path(tokens))
+            else:
+                inner_removed_paths = self._get_removed_paths(old_value, new_config[key], tokens)
+                if inner_removed_paths is None:
+                    tokens.pop()
+                    return None
+                removed_paths.extend(inner_removed_paths)
+            tokens.pop()
+
+        return removed_paths
+
+    def _build_ref_paths_index(self, config):
         sy = self._create_sonic_yang_with_loaded_models()
 
         tmp_config = copy.deepcopy(config)
 
         sy.loadData(tmp_config)
 
-        xpath = self.convert_path_to_xpath(path, config, sy)
+        index = RefPathsIndex()
+        backlinks_refs = {}
+        for node in sy.root.tree_for():
+            for inner_node in node.tree_dfs():
+                # TODO: leaflist also can be used as the 'path' argument in 'leafref' so add support to leaflist
+                if not self._is_leaf_node(inner_node):
+                    continue
+
+                ref_xpaths = self._find_leaf_ref_xpaths(inner_node, sy, backlinks_refs)
+                if not ref_xpaths:
+                    continue
+
+                leaf_path = self.convert_xpath_to_path(inner_node.path(), config, sy)
+                for ref_xpath in ref_xpaths:
+                    index.add(leaf_path, self.convert_xpath_to_path(ref_xpath, config, sy))
 
-        leaf_xpaths = self._get_inner_leaf_xpaths(xpath, sy)
+        return index
+
+    def _find_leaf_ref_xpaths(self, node, sy, backlinks_refs):
+        """
+        Finds the xpaths referencing the given leaf node, same as SonicYang.find_data_dependencies.
+        The nodes of each backlink are read once for all the leaves and kept in backlinks_refs by value.
+        """
+        backlinks = ly.Schema_Node_Leaf(node.schema()).backlinks()
+        if backlinks is None or backlinks.number() == 0:
+            return []
 
+        value = node.subtype().value_str()
         ref_xpaths = []
-        for xpath in leaf_xpaths:
-            ref_xpaths.extend(sy.find_data_dependencies(xpath))
-
-        ref_paths = []
-        ref_paths_set = set()
-        for ref_xpath in ref_xpaths:
-            ref_path = self.convert_xpath_to_path(ref_xpath, config, sy)
-            if ref_path not in ref_paths_set:
-                ref_paths.append(ref_path)
-                ref_paths_set.add(ref_path)
-
-        ref_paths.sort()
-        return ref_paths
-
-    def _get_inner_leaf_xpaths(self, xpath, sy):
-        if xpath == "/": # Point to Root element which contains all xpaths
-            nodes = sy.root.tree_for()
-        else: # Otherwise get all nodes that match xpath
-            nodes = sy.root.find_path(xpath).data()
-
-        for node in nodes:
-            for inner_node in node.tree_dfs():
-                # TODO: leaflist also can be used as the 'path' argument in 'leafref' so add support to leaflist
-                if self._is_leaf_node(inner_node):
-                    yield inner_node.path()
+        for link in backlinks.schema():
+            link_path = link.path()
+            if link_path not in backlinks_refs:
+                refs_by_value = {}
+                for data_node in sy.root.find_path(link_path).data():
+                    refs_by_value.setdefault(data_node.subtype().value_str(), []).append(data_node.path())
+                backlinks_refs[link_path] = refs_by_value
+            ref_xpaths.extend(backlinks_refs[link_path].get(value, []))
+
+        return ref_xpaths
 
     def _is_leaf_node(self, node):
         schema = node.schema()
@@ -1,39 +1,121 @@
 import copy
+import heapq
+import itertools
 import json
 import jsonpatch
 from collections import deque, OrderedDict
 from enum import Enum
+from jsonpointer import JsonPointer
 from .gu_common import OperationWrapper, OperationType, GenericConfigUpdaterError, \
                        JsonChange, PathAddressing, genericUpdaterLogging
 
+
+class ConfigHasher:
+    """
+    A class to compute the structural hash of a config, and to update it after a change.
+
+    The hash of a config is the sum of the hashes of its entries, an entry being a key of a table e.g.
+    /PORT/Ethernet0, or a whole table if it is not a dictionary. Changing a path only changes the hashes
+    of the entries on that path, so the hash of the new config is obtained by replacing these entry
+    hashes instead of serializing the whole config again.
+    """
+    HASH_MASK = (1 << 64) - 1
+
+    @staticmethod
+    def _hash_value(table, key, value):
+        return hash((table, key, json.dumps(value, sort_keys=True)))
+
+    @staticmethod
+    def _hash_table(table, value):
+        if not isinstance(value, dict):
+            return ConfigHasher._hash_value(table, None, value)
+
+        # The table itself is hashed as well, an empty table is not the same as a missing one
+        table_hash = hash((table,))
+        for key, entry in value.items():
+            table_hash += ConfigHasher._hash_value(table, key, entry)
+        return table_hash
+
+    @staticmethod
+    def hash_config(config):
+        if not isinstance(config, dict):
+            return hash(json.dumps(config, sort_keys=True))
+
+        config_hash = 0
+        for table, value in config.items():
+            config_hash += ConfigHasher._hash_table(table, value)
+        return config_hash & ConfigHasher.HASH_MASK
+
+    @staticmethod
+    def update_hash(config_hash, old_config, new_config, path):
+        """
+        Return the hash of new_config, given the hash of old_config and the path of the only change between them.
+        """
+        tokens = JsonPointer(path).parts
+        if not tokens or not isinstance(old_config, dict) or not isinstance(new_config, dict):
+            return ConfigHasher.hash_config(new_config)
+
+        table = tokens[0]
+        old_table = old_config.get(table)
+        new_table = new_config.get(table)
+        if len(tokens) > 1 and isinstance(old_table, dict) and isinstance(new_table, dict):
+            key = tokens[1]
+            if key in old_table:
+                config_hash -= ConfigHasher._hash_value(table, key, old_table[key])
+            if key in new_table:
+                config_hash += ConfigHasher._hash_value(table, key, new_table[key])
+        else:
+            if table in old_config:
+                config_hash -= ConfigHasher._hash_table(table, old_table)
+            if table in new_config:
+                config_hash += ConfigHasher._hash_table(table, new_table)
+
+        return config_hash & ConfigHasher.HASH_MASK
+
 class Diff:
     """
     A class that contains the diff info between current and target configs.
+
+    The configs are never modified in place, so the hashes of the configs are computed once, and the hash
+    of a Diff generated by apply_move is updated from the hash of its parent.
     """
-    def __init__(self, current_config, target_config):
+    def __init__(self, current_config, target_config, current_config_hash=None, target_config_hash=None):
         self.current_config = current_config
         self.target_config = target_config
+        self.current_config_hash = current_config_hash
+        self.target_config_hash = target_config_hash
+
+    def get_hashes(self):
+        if self.current_config_hash is None:
+            self.current_config_hash = ConfigHasher.hash_config(self.current_config)
+        if self.target_config_hash is None:
+            self.target_config_hash = ConfigHasher.hash_config(self.target_config)
+        return self.current_config_hash, self.target_config_hash
 
     def __hash__(self):
-        cc = json.dumps(self.current_config, sort_keys=True)
-        tc = json.dumps(self.target_config, sort_keys=True)
-        return hash((cc,tc))
+        return hash(self.get_hashes())
 
     def __eq__(self, other):
         """Overrides the default implementation"""
         if isinstance(other, Diff):
+            if self.get_hashes() != other.get_hashes():
+                return False
             return self.current_config == other.current_config and self.target_config == other.target_config
 
         return False
 
-    # TODO: Can be optimized to apply the move in place. JsonPatch supports that using the option 'in_place=True'
-    # Check: https://python-json-patch.readthedocs.io/en/latest/tutorial.html#applying-a-patch
-    # NOTE: in case move is applied in place, we will need to support `undo_move` as well.
     def apply_move(self, move):
         new_current_config = move.apply(self.current_config)
-        return Diff(new_current_config, self.target_config)
+        new_current_config_hash = None
+        if self.current_config_hash is not None:
+            new_current_config_hash = ConfigHasher.update_hash(
+                self.current_config_hash, self.current_config, new_current_config, move.path)
+        return Diff(new_current_config, self.target_config, new_current_config_hash, self.target_config_hash)
 
     def has_no_diff(self):
+        current_config_hash, target_config_hash = self.get_hashes()
+        if current_config_hash != target_config_hash:
+            return False
         return self.current_config == self.target_config
 
     def __str__(self):
@@ -272,7 +354,28 @@ class JsonMove:
         return JsonMove(diff, op_type, current_config_tokens, target_config_tokens)
 
     def apply(self, config):
-        return self.patch.apply(config)
+        """
+        Returns a new config with the move applied. Only the containers on the path of the move are copied,
+        the rest is shared with the given config, so configs must not be modified in place.
+        """
+        tokens = JsonPointer(self.path).parts
+        if not tokens:
+            return self.patch.apply(config)
+
+        new_config = copy.copy(config)
+        ptr = new_config
+        for token in tokens[:-1]:
+            if isinstance(ptr, list):
+                if not token.isdigit() or int(token) >= len(ptr):
+                    break
+                token = int(token)
+            elif not isinstance(ptr, dict) or token not in ptr:
+                break
+            ptr[token] = copy.copy(ptr[token])
+            ptr = ptr[token]
+
+        # Only the copied containers of the path are modified
+        return self.patch.apply(new_config, in_place=True)
 
     def __str__(self):
         return str(self.patch)
@@ -676,15 +779,93 @@ class DeleteWholeConfigMoveValidator:
 class FullConfigMoveValidator:
     """
     A class to validate that full config is valid according to YANG models after applying the move.
+
+    If incremental, the validation results are remembered per config, and once the current config is known
+    to be valid, only the tables that can be affected by the move are validated. These are the table updated
+    by the move, the tables referring to it, and the tables these tables refer to, recursively. The other tables
+    are unchanged and do not refer to any changed table, so they remain valid.
+
+    A validator is created for every sort, and at most max_validation_results results are remembered, the least
+    recently used ones are dropped. A dropped result is validated again if needed.
     """
-    def __init__(self, config_wrapper):
+    DEFAULT_MAX_VALIDATION_RESULTS = 1000
+
+    def __init__(self, config_wrapper, incremental=False, max_validation_results=DEFAULT_MAX_VALIDATION_RESULTS):
         self.config_wrapper = config_wrapper
+        self.incremental = incremental
+        self.max_validation_results = max_validation_results
+        self.validation_results = OrderedDict()
 
     def validate(self, move, diff):
         simulated_config = move.apply(diff.current_config)
-        is_valid, error = self.config_wrapper.validate_config_db_config(simulated_config)
+        if not self.incremental:
+            is_valid, error = self.config_wrapper.validate_config_db_config(simulated_config)
+            return is_valid
+
+        # Diffs compare their configs when their hashes are equal, so a hash collision cannot return the result
+        # of another config
+        current_config_hash, target_config_hash = diff.get_hashes()
+        simulated_config_hash = ConfigHasher.update_hash(
+            current_config_hash, diff.current_config, simulated_config, move.path)
+        simulated_diff = Diff(simulated_config, diff.target_config, simulated_config_hash, target_config_hash)
+        is_valid = self._get_validation_result(simulated_diff)
+        if is_valid is None:
+            tables = self._get_tables_to_validate(move, diff)
+            if tables is not None:
+                config = {table: simulated_config[table] for table in tables if table in simulated_config}
+            else:
+                config = simulated_config
+            is_valid, error = self.config_wrapper.validate_config_db_config(config)
+            self._add_validation_result(simulated_diff, is_valid)
+
+        return is_valid
+
+    def _is_valid_config(self, diff):
+        is_valid = self._get_validation_result(diff)
+        if is_valid is None:
+            is_valid, error = self.config_wrapper.validate_config_db_config(diff.current_config)
+            self._add_validation_result(diff, is_valid)
+
+        return is_valid
+
+    def _get_validation_result(self, diff):
+        is_valid = self.validation_results.get(diff)
+        if is_valid is not None:
+            self.validation_results.move_to_end(diff)
         return is_valid
 
+    def _add_validation_result(self, diff, is_valid):
+        self.validation_results[diff] = is_valid
+        if len(self.validation_results) > self.max_validation_results:
+            self.validation_results.popitem(last=False)
+
+    def _get_tables_to_validate(self, move, diff):
+        tokens = JsonPointer(move.path).parts
+        if not tokens:
+            return None
+
+        table_dependencies = self.config_wrapper.get_table_dependencies()
+        if table_dependencies is None or tokens[0] not in table_dependencies:
+            return None
+
+        if not self._is_valid_config(diff):
+            return None
+
+        table = tokens[0]
+        tables_to_check = [table]
+        for other_table, dependencies in table_dependencies.items():
+            if table in dependencies:
+                tables_to_check.append(other_table)
+
+        tables = set()
+        while tables_to_check:
+            table = tables_to_check.pop()
+            if table not in tables:
+                tables.add(table)
+                tables_to_check.extend(table_dependencies.get(table, []))
+
+        return tables
+
 class CreateOnlyMoveValidator:
     """
     A class to validate create-only fields are only created, but never modified/updated. In other words:
@@ -1624,16 +1805,155 @@ class MemoizationSorter:
         self.mem[diff_hash] = bst_moves
         return bst_moves
 
+
+class BestFirstSorter:
+    """
+    An A*-like sorter that explores first the configs estimated to be the closest to the target config.
+
+    The priority of a config is the number of moves to reach it plus an estimate of the number of moves left,
+    which is the number of leaves different from the target config plus the number of references still left
+    to the keys to be deleted. The sorted moves are not guaranteed to be the fewest possible.
+
+    A generated move is only validated when its resulting config is explored, so the moves leading to configs
+    which are never explored are never validated. The frontier is bounded to max_frontier_size configs, the ones
+    with the lowest priority are kept. If no sorting is found after configs were dropped from the frontier, the
+    diff is sorted again by MemoizationSorter, which explores all the configs.
+    """
+    DEFAULT_MAX_FRONTIER_SIZE = 1000
+
+    def __init__(self, move_wrapper, path_addressing=None, max_frontier_size=DEFAULT_MAX_FRONTIER_SIZE):
+        self.visited = {}
+        self.move_wrapper = move_wrapper
+        self.path_addressing = path_addressing
+        self.max_frontier_size = max_frontier_size
+        self.ref_paths = []
+        self.frontier_truncated = False
+        self.logger = genericUpdaterLogging.get_logger(title="Patch Sorter - Best First")
+
+    def sort(self, diff):
+        if diff.has_no_diff():
+            return []
+
+        self.ref_paths = self._find_deleted_keys_ref_paths(diff)
+        sequence = itertools.count()
+        frontier = []
+
+        # A node is a tuple (diff, parent node, move from the parent diff)
+        self.visited[diff] = True
+        self._expand((diff, None, None), 0, frontier, sequence)
+
+        while frontier:
+            _, _, _, depth, move, parent, new_diff = heapq.heappop(frontier)
+
+            if new_diff in self.visited:
+                continue
+            if not self.move_wrapper.validate(move, parent[0]):
+                continue
+            self.visited[new_diff] = True
+
+            node = (new_diff, parent, move)
+            if new_diff.has_no_diff():
+                return self._get_moves(node)
+
+            self._expand(node, depth, frontier, sequence)
+
+        if self.frontier_truncated:
+            self.logger.log_notice("No sorting found within the bounded frontier, sorting with memoization.")
+            return MemoizationSorter(self.move_wrapper).sort(diff)
+
+        return None
+
+    def _expand(self, node, depth, frontier, sequence):
+        diff = node[0]
+        for move in self.move_wrapper.generate(diff):
+            new_diff = self.move_wrapper.simulate(move, diff)
+            if new_diff in self.visited:
+                continue
+            estimate = self._estimate_moves_left(new_diff)
+            heapq.heappush(frontier, (depth + 1 + estimate, estimate, next(sequence), depth + 1, move, node, new_diff))
+
+        if len(frontier) > self.max_frontier_size:
+            self.logger.log_debug(f"Dropping {len(frontier) - self.max_frontier_size} configs from the frontier.")
+            self.frontier_truncated = True
+            # A sorted list is a valid heap
+            frontier[:] = heapq.nsmallest(self.max_frontier_size, frontier)
+
+    def _get_moves(self, node):
+        moves = []
+        while node[1] is not None:
+            moves.append(node[2])
+            node = node[1]
+        moves.reverse()
+        return moves
+
+    def _estimate_moves_left(self, diff):
+        estimate = self._count_different_leaves(diff.current_config, diff.target_config)
+        if self.path_addressing is not None:
+            for ref_path in self.ref_paths:
+                if self.path_addressing.has_path(diff.current_config, ref_path):
+                    estimate += 1
+        return estimate
+
+    def _count_different_leaves(self, current, target):
+        if isinstance(current, dict) and isinstance(target, dict):
+            count = 0
+            for key in current:
+                if key in target:
+                    if current[key] is not target[key]:
+                        count += self._count_different_leaves(current[key], target[key])
+                else:
+                    count += self._count_leaves(current[key])
+            for key in target:
+                if key not in current:
+                    count += self._count_leaves(target[key])
+            return count
+
+        return 0 if current == target else 1
+
+    def _count_leaves(self, value):
+        if isinstance(value, dict) and value:
+            return sum(self._count_leaves(item) for item in value.values())
+        return 1
+
+    def _find_deleted_keys_ref_paths(self, diff):
+        """
+        Finds the references to the tables and keys to be deleted, they have to be deleted or updated first.
+        """
+        if self.path_addressing is None:
+            return []
+
+        current_config, target_config = diff.current_config, diff.target_config
+        deleted_paths = []
+        for table in current_config:
+            if table not in target_config:
+                deleted_paths.append(self.path_addressing.create_path([table]))
+                continue
+            if not isinstance(current_config[table], dict) or not isinstance(target_config[table], dict):
+                continue
+            for key in current_config[table]:
+                if key not in target_config[table]:
+                    deleted_paths.append(self.path_addressing.create_path([table, key]))
+
+        ref_paths = set()
+        for path in deleted_paths:
+            ref_paths.update(self.path_addressing.find_ref_paths(path, current_config))
+        return sorted(ref_paths)
+
 class Algorithm(Enum):
     DFS = 1
     BFS = 2
     MEMOIZATION = 3
+    ASTAR = 4
 
 class SortAlgorithmFactory:
-    def __init__(self, operation_wrapper, config_wrapper, path_addressing):
+    def __init__(self, operation_wrapper, config_wrapper, path_addressing, incremental_validation=False):
         self.operation_wrapper = operation_wrapper
         self.config_wrapper = config_wrapper
         self.path_addressing = path_addressing
+        # Off by default until the incremental validation has been shown to accept and reject the same moves
+        # as the full validation with the YANG models of the device, see test_incremental_validation__same_results.
+        # It is turned on by the --incremental-validation option of the config apply-patch/replace/rollback commands
+        self.incremental_validation = incremental_validation
 
     def create(self, algorithm=Algorithm.DFS):
         move_generators = [RemoveCreateOnlyDependencyMoveGenerator(self.path_addressing),
@@ -1644,13 +1964,23 @@ class SortAlgorithmFactory:
                           UpperLevelMoveExtender(),
                           DeleteInsteadOfReplaceMoveExtender(),
                           DeleteRefsMoveExtender(self.path_addressing)]
-        move_validators = [DeleteWholeConfigMoveValidator(),
-                           FullConfigMoveValidator(self.config_wrapper),
-                           NoDependencyMoveValidator(self.path_addressing, self.config_wrapper),
-                           CreateOnlyMoveValidator(self.path_addressing),
-                           RequiredValueMoveValidator(self.path_addressing),
-                           RemoveCreateOnlyDependencyMoveValidator(self.path_addressing),
-                           NoEmptyTableMoveValidator(self.path_addressing)]
+        if algorithm == Algorithm.ASTAR:
+            # Cheaper validators first, most invalid moves are rejected before validating the full config
+            move_validators = [DeleteWholeConfigMoveValidator(),
+                               NoEmptyTableMoveValidator(self.path_addressing),
+                               CreateOnlyMoveValidator(self.path_addressing),
+                               RequiredValueMoveValidator(self.path_addressing),
+                               RemoveCreateOnlyDependencyMoveValidator(self.path_addressing),
+                               NoDependencyMoveValidator(self.path_addressing, self.config_wrapper),
+                               FullConfigMoveValidator(self.config_wrapper, incremental=self.incremental_validation)]
+        else:
+            move_validators = [DeleteWholeConfigMoveValidator(),
+                               FullConfigMoveValidator(self.config_wrapper, incremental=self.incremental_validation),
+                               NoDependencyMoveValidator(self.path_addressing, self.config_wrapper),
+                               CreateOnlyMoveValidator(self.path_addressing),
+                               RequiredValueMoveValidator(self.path_addressing),
+                               RemoveCreateOnlyDependencyMoveValidator(self.path_addressing),
+                               NoEmptyTableMoveValidator(self.path_addressing)]
 
         move_wrapper = MoveWrapper(move_generators, move_non_extendable_generators, move_extenders, move_validators)
 
@@ -1660,6 +1990,8 @@ class SortAlgorithmFactory:
             sorter = BfsSorter(move_wrapper)
         elif algorithm == Algorithm.MEMOIZATION:
             sorter = MemoizationSorter(move_wrapper)
+        elif algorithm == Algorithm.ASTAR:
+            sorter = BestFirstSorter(move_wrapper, self.path_addressing)
         else:
             raise ValueError(f"Algorithm {algorithm} is not supported")
 
@@ -1915,13 +2247,13 @@ class NonStrictPatchSorter:
         return changes
 
 class PatchSorter:
-    def __init__(self, config_wrapper, patch_wrapper, sort_algorithm_factory=None):
+    def __init__(self, config_wrapper, patch_wrapper, sort_algorithm_factory=None, incremental_validation=False):
         self.config_wrapper = config_wrapper
         self.patch_wrapper = patch_wrapper
         self.operation_wrapper = OperationWrapper()
         self.path_addressing = PathAddressing(self.config_wrapper)
         self.sort_algorithm_factory = sort_algorithm_factory if sort_algorithm_factory else \
-            SortAlgorithmFactory(self.operation_wrapper, config_wrapper, self.path_addressing)
+            SortAlgorithmFactory(self.operation_wrapper, config_wrapper, self.path_addressing, incremental_validation)
 
     def sort(self, patch, algorithm=Algorithm.DFS, preloaded_current_config=None):
         current_config = preloaded_current_config if preloaded_current_config else self.config_wrapper.get_config_db_as_json()
@@ -13,6 +13,8 @@ import syslog
 import traceback
 import ipaddress
 from builtins import str #for unicode conversion in python2
+from utilities_common import oid_resolver
+from utilities_common.oid_resolver import get_oid_resolver
 
 
 ARP_CHUNK = binascii.unhexlify('08060001080006040001') # defines a part of the packet for ARP Request
@@ -63,55 +65,54 @@ def get_vlan_ifaces():
 
 def get_bridge_port_id_2_port_id(db):
     bridge_port_id_2_port_id = {}
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = db.get_all(db.ASIC_DB, key)
+    bridge_ports = get_oid_resolver(db).get_objects(oid_resolver.BRIDGE_PORT)
+    for bridge_id, value in bridge_ports.items():
         port_type = value['SAI_BRIDGE_PORT_ATTR_TYPE']
         if port_type != 'SAI_BRIDGE_PORT_TYPE_PORT':
             continue
         port_id = value['SAI_BRIDGE_PORT_ATTR_PORT_ID']
         # ignore admin status
-        bridge_id = key.replace('ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:', '')
         bridge_port_id_2_port_id[bridge_id] = port_id
 
     return bridge_port_id_2_port_id
 
-def get_lag_by_member(member_name, app_db):
+
+def get_map_lag_member_2_lag_name(app_db):
+    lag_member_2_lag = {}
     keys = app_db.keys(app_db.APPL_DB, 'LAG_MEMBER_TABLE:*')
     keys = [] if keys is None else keys
     for key in keys:
         _, lag_name, lag_member_name = key.split(":")
-        if lag_member_name == member_name:
-            return lag_name
-    return None
+        lag_member_2_lag.setdefault(lag_member_name, lag_name)
+    return lag_member_2_lag
+
+
+def get_lag_by_member(member_name, app_db):
+    return get_map_lag_member_2_lag_name(app_db).get(member_name)
 
 def get_map_host_port_id_2_iface_name(asic_db):
     host_port_id_2_iface = {}
-    keys = asic_db.keys(asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = asic_db.get_all(asic_db.ASIC_DB, key)
+    hostifs = get_oid_resolver(asic_db).get_objects(oid_resolver.HOSTIF)
+    for value in hostifs.values():
         if value['SAI_HOSTIF_ATTR_TYPE'] != 'SAI_HOSTIF_TYPE_NETDEV':
             continue
         port_id = value['SAI_HOSTIF_ATTR_OBJ_ID']
         iface_name = value['SAI_HOSTIF_ATTR_NAME']
         host_port_id_2_iface[port_id] = iface_name
-    
+
     return host_port_id_2_iface
 
 def get_map_lag_port_id_2_portchannel_name(asic_db, app_db, host_port_id_2_iface):
     lag_port_id_2_iface = {}
-    keys = asic_db.keys(asic_db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_LAG_MEMBER:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = asic_db.get_all(asic_db.ASIC_DB, key)
+    lag_member_2_lag = get_map_lag_member_2_lag_name(app_db)
+    lag_members = get_oid_resolver(asic_db).get_objects(oid_resolver.LAG_MEMBER)
+    for value in lag_members.values():
         lag_id = value['SAI_LAG_MEMBER_ATTR_LAG_ID']
         if lag_id in lag_port_id_2_iface:
             continue
         member_id = value['SAI_LAG_MEMBER_ATTR_PORT_ID']
         member_name = host_port_id_2_iface[member_id]
-        lag_name = get_lag_by_member(member_name, app_db)
+        lag_name = lag_member_2_lag.get(member_name)
         if lag_name is not None:
             lag_port_id_2_iface[lag_id] = lag_name
 
@@ -141,14 +142,10 @@ def get_map_bridge_port_id_2_iface_name(asic_db, app_db):
     return bridge_port_id_2_iface_name
 
 def get_vlan_oid_by_vlan_id(db, vlan_id):
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = db.get_all(db.ASIC_DB, key)
-        if 'SAI_VLAN_ATTR_VLAN_ID' in value and int(value['SAI_VLAN_ATTR_VLAN_ID']) == vlan_id:
-            return key.replace('ASIC_STATE:SAI_OBJECT_TYPE_VLAN:', '')
-
-    raise Exception('Not found bvi oid for vlan_id: %d' % vlan_id)
+    vlan_oid = get_oid_resolver(db).get_vlan_oid(vlan_id)
+    if vlan_oid is None:
+        raise Exception('Not found bvi oid for vlan_id: %d' % vlan_id)
+    return vlan_oid
 
 def get_fdb(db, vlan_name, vlan_id, bridge_id_2_iface):
     fdb_types = {
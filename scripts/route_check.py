@@ -19,6 +19,11 @@ How:
     5) Rule out local interfaces & default routes
     6) If still outstanding diffs, report failure.
 
+    In daemon mode (-d), APPL-DB & ASIC-DB route tables are read once and
+    then kept in memory from the subscribe messages, so every interval only
+    the outstanding diffs are checked. The tables are read again if the
+    subscription fails.
+
 To verify:
     Run this tool in SONiC switch and watch the result. In case of failure
     checkout the result to validate the failure.
@@ -38,6 +43,7 @@ import argparse
 from enum import Enum
 import ipaddress
 import json
+import multiprocessing
 import os
 import re
 import sys
@@ -47,6 +53,7 @@ import signal
 import traceback
 import subprocess
 
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import ip_network
 from swsscommon import swsscommon
 from utilities_common import chassis
@@ -54,12 +61,22 @@ from sonic_py_common import multi_asic
 from utilities_common.general import load_db_config
 
 APPL_DB_NAME = 'APPL_DB'
+APPL_ROUTE_TABLE_NAME = 'ROUTE_TABLE'
 ASIC_DB_NAME = 'ASIC_DB'
 ASIC_TABLE_NAME = 'ASIC_STATE'
 ASIC_KEY_PREFIX = 'SAI_OBJECT_TYPE_ROUTE_ENTRY:'
 
 SUBSCRIBE_WAIT_SECS = 1
 
+# Daemon mode: max time to wait for updates of a namespace at once
+DAEMON_POLL_SECS = 1
+
+# Daemon mode: the resync after consecutive subscription errors is delayed
+# from 1 second, doubling up to 1 minute, and the daemon exits after 10
+SUBSCRIBE_BACKOFF_SECS = 1
+SUBSCRIBE_MAX_BACKOFF_SECS = 60
+SUBSCRIBE_MAX_ERRORS = 10
+
 # Max of 2 minutes
 TIMEOUT_SECONDS = 120
 
@@ -78,6 +95,10 @@ PRINT_MSG_LEN_MAX = 1000
 FRR_CHECK_RETRIES = 3
 FRR_WAIT_TIME = 15
 
+# Fields of the FRR route entries used by the checks
+FRR_ROUTE_FIELDS = ('prefix', 'vrfName', 'protocol', 'selected', 'offloaded', 'queued')
+FRR_READ_CHUNK_SIZE = 64 * 1024
+
 REDIS_TIMEOUT_MSECS = 0
 
 class Level(Enum):
@@ -280,6 +301,20 @@ def is_vrf(k):
     return k.startswith("Vrf")
 
 
+def checkout_appl_rt_entry(k):
+    """
+    helper to strip out the route of an APPL-DB ROUTE_TABLE key.
+    :param k: key to check as string
+    :return (True, route with prefix ensured) or (False, None)
+    """
+    if (is_vrf(k)):
+        k = k.split(":", 1)[1]
+
+    if not is_local(k):
+        return True, add_prefix_ifnot(k.lower())
+    return False, None
+
+
 def get_appdb_routes(namespace):
     """
     helper to read route table from APPL-DB.
@@ -287,16 +322,14 @@ def get_appdb_routes(namespace):
     """
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     print_message(syslog.LOG_DEBUG, "APPL DB connected for routes")
-    tbl = swsscommon.Table(db, 'ROUTE_TABLE')
+    tbl = swsscommon.Table(db, APPL_ROUTE_TABLE_NAME)
     keys = tbl.getKeys()
 
     valid_rt = []
     for k in keys:
-        if (is_vrf(k)):
-            k = k.split(":", 1)[1]
-
-        if not is_local(k):
-            valid_rt.append(add_prefix_ifnot(k.lower()))
+        res, e = checkout_appl_rt_entry(k)
+        if res:
+            valid_rt.append(e)
 
     print_message(syslog.LOG_DEBUG, json.dumps({"ROUTE_TABLE": sorted(valid_rt)}, indent=4))
     return sorted(valid_rt)
@@ -338,9 +371,120 @@ def is_suppress_fib_pending_enabled(namespace):
     return state == 'enabled'
 
 
-def get_frr_routes(namespace):
+class JsonStreamReader(object):
+    """
+    Minimal pull reader of a JSON document from a text stream. Values are
+    decoded one at a time, so only the current value is held in memory.
+    """
+    WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self, stream, chunk_size=FRR_READ_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+
+    def read(self):
+        data = self.stream.read(self.chunk_size)
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return bool(data)
+
+    def peek(self):
+        """
+        :return next non whitespace character, '' at the end of the stream
+        """
+        while True:
+            self.pos = self.WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.read():
+                return ''
+
+    def expect(self, chars):
+        """
+        Consume the next character, which must be one of chars
+        :return the character consumed
+        """
+        c = self.peek()
+        if not c or c not in chars:
+            raise ValueError("Unexpected {} in JSON output, expecting one of '{}'".format(
+                repr(c) if c else "end of data", chars))
+        self.pos += 1
+        return c
+
+    def decode(self):
+        """
+        Decode the next string, object or array
+        """
+        self.peek()
+        while True:
+            try:
+                value, self.pos = self.decoder.raw_decode(self.buf, self.pos)
+                return value
+            except json.JSONDecodeError:
+                if not self.read():
+                    raise
+
+
+def iter_frr_route_entries(stream, chunk_size=FRR_READ_CHUNK_SIZE):
+    """
+    Parse the output of "show ip route json" from stream, which is of the
+    form {<prefix>: [<entry>, ...], ...}, an entry at a time.
+    :return iterator of (prefix, entry) with only FRR_ROUTE_FIELDS kept in entry
+    """
+    reader = JsonStreamReader(stream, chunk_size)
+    reader.expect('{')
+    if reader.peek() == '}':
+        return
+    while True:
+        prefix = reader.decode()
+        reader.expect(':')
+        reader.expect('[')
+        if reader.peek() == ']':
+            reader.expect(']')
+        else:
+            while True:
+                entry = reader.decode()
+                yield prefix, {k: entry[k] for k in FRR_ROUTE_FIELDS if k in entry}
+                if reader.expect(',]') == ']':
+                    break
+        if reader.expect(',}') == '}':
+            return
+
+
+def read_frr_routes(cmd, entry_filter=None):
+    """
+    Run the FRR route command and parse its output as it is read
+    :param entry_filter: if set, keep only the entries it returns True for
+    :return frr routes dictionary
+    """
+    routes = {}
+    error = None
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    try:
+        for prefix, entry in iter_frr_route_entries(proc.stdout):
+            if entry_filter is None or entry_filter(entry):
+                routes.setdefault(prefix, []).append(entry)
+    except ValueError as e:
+        error = e
+    finally:
+        proc.stdout.close()
+        ret = proc.wait()
+    # A failed command is reported first, its output is likely incomplete
+    if ret:
+        raise subprocess.CalledProcessError(ret, cmd)
+    if error:
+        raise error
+    return routes
+
+
+def get_frr_routes(namespace, entry_filter=None):
     """
-    Read routes from zebra through CLI command
+    Read routes from zebra through CLI command. IPv4 & IPv6 routes are
+    read concurrently.
+    :param entry_filter: if set, keep only the entries it returns True for
     :return frr routes dictionary
     """
     if namespace == multi_asic.DEFAULT_NAMESPACE:
@@ -350,10 +494,11 @@ def get_frr_routes(namespace):
         v4_route_cmd = ['show', 'ip', 'route', '-n', namespace, 'json']
         v6_route_cmd = ['show', 'ipv6', 'route', '-n', namespace, 'json']
 
-    output = subprocess.check_output(v4_route_cmd, text=True)
-    routes = json.loads(output)
-    output = subprocess.check_output(v6_route_cmd, text=True)
-    routes.update(json.loads(output))
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        v4_routes = executor.submit(read_frr_routes, v4_route_cmd, entry_filter)
+        v6_routes = executor.submit(read_frr_routes, v6_route_cmd, entry_filter)
+        routes = v4_routes.result()
+        routes.update(v6_routes.result())
     print_message(syslog.LOG_DEBUG, "FRR Routes: namespace={}, routes={}".format(namespace, routes))
     return routes
 
@@ -383,156 +528,12 @@ def get_interfaces(namespace):
     return sorted(intf)
 
 
-def filter_out_local_interfaces(namespace, keys):
-    """
-    helper to filter out local interfaces
-    :param keys: APPL-DB:ROUTE_TABLE Routes to check.
-    :return keys filtered out of local
-    """
-    rt = []
-    local_if_lst = {'eth0', 'eth1', 'docker0'}  #eth1 is added to skip route installed in AAPL_DB on packet-chassis
-    local_if_lo = [r'tun0', r'lo', r'Loopback\d+']
-
-    chassis_local_intfs = chassis.get_chassis_local_interfaces()
-    local_if_lst.update(set(chassis_local_intfs))
-
-    db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
-    tbl = swsscommon.Table(db, 'ROUTE_TABLE')
-
-    for k in keys:
-        e = dict(tbl.get(k)[1])
-
-        ifname = e.get('ifname', '')
-        if ifname in local_if_lst:
-            continue
-
-        if any([re.match(x, ifname) for x in local_if_lo]):
-            nh = e.get('nexthop')
-            if not nh or ipaddress.ip_address(nh).is_unspecified:
-                continue
-
-        rt.append(k)
-
-    return rt
-
-
-def filter_out_voq_neigh_routes(namespace, keys):
-    """
-    helper to filter out voq neigh routes. These are the
-    routes statically added for the voq neighbors. We skip
-    writing route entries in asic db for these. We filter
-    out reporting error on all the host routes written on
-    inband interface prefixed with "Ethernte-IB"
-    :param namespace: Asic namespace, keys: APPL-DB:ROUTE_TABLE Routes to check.
-    :return keys filtered out for voq neigh routes
-    """
-    rt = []
-    local_if_re = [r'Ethernet-IB\d+']
-
-    db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
-    tbl = swsscommon.Table(db, 'ROUTE_TABLE')
-
-    for k in keys:
-        prefix = k.split("/")
-        e = dict(tbl.get(k)[1])
-        if not e:
-            # Prefix might have been added. So try w/o it.
-            e = dict(tbl.get(prefix[0])[1])
-        if not e or all([not (re.match(x, e['ifname']) and
-            ((prefix[1] == "32" and e['nexthop'] == "0.0.0.0") or
-                (prefix[1] == "128" and e['nexthop'] == "::"))) for x in local_if_re]):
-            rt.append(k)
-
-    return rt
-
-
-def filter_out_default_routes(lst):
-    """
-    helper to filter out default routes
-    :param lst: list to filter
-    :return filtered list.
-    """
-    upd = []
-
-    for rt in lst:
-        if not is_default_route(rt):
-            upd.append(rt)
-
-    return upd
-
-
-def filter_out_vnet_routes(namespace, routes):
-    """
-    Helper to filter out VNET routes
-    :param routes: list of routes to filter
-    :return filtered list of routes.
-    """
-    db = swsscommon.DBConnector('APPL_DB', REDIS_TIMEOUT_MSECS, True, namespace)
-
-    vnet_route_table = swsscommon.Table(db, 'VNET_ROUTE_TABLE')
-    vnet_route_tunnel_table = swsscommon.Table(db, 'VNET_ROUTE_TUNNEL_TABLE')
-
-    vnet_routes_db_keys = vnet_route_table.getKeys() + vnet_route_tunnel_table.getKeys()
-
-    vnet_routes = []
-
-    for vnet_route_db_key in vnet_routes_db_keys:
-        vnet_route_attrs = vnet_route_db_key.split(':', 1)
-        vnet_name = vnet_route_attrs[0]
-        vnet_route = vnet_route_attrs[1]
-        vnet_routes.append(vnet_route)
-
-    updated_routes = []
-
-    for route in routes:
-        if not (route in vnet_routes):
-            updated_routes.append(route)
-
-    return updated_routes
-
-
 def is_dualtor(config_db):
     device_metadata = config_db.get_table('DEVICE_METADATA')
     subtype = device_metadata['localhost'].get('subtype', '')
     return subtype.lower() == 'dualtor'
 
 
-def filter_out_standalone_tunnel_routes(namespace, routes):
-
-    config_db = multi_asic.connect_config_db_for_ns(namespace)
-
-    if not is_dualtor(config_db):
-        return routes
-
-    app_db = swsscommon.DBConnector('APPL_DB', REDIS_TIMEOUT_MSECS, True, namespace)
-    neigh_table = swsscommon.Table(app_db, 'NEIGH_TABLE')
-    neigh_keys = neigh_table.getKeys()
-    standalone_tunnel_route_ips = []
-    updated_routes = []
-
-    for neigh in neigh_keys:
-        _, mac = neigh_table.hget(neigh, 'neigh')
-        if mac == '00:00:00:00:00:00':
-            # remove preceding 'VlanXXXX' to get just the neighbor IP
-            neigh_ip = ':'.join(neigh.split(':')[1:])
-            standalone_tunnel_route_ips.append(neigh_ip)
-
-    if not standalone_tunnel_route_ips:
-        return routes
-
-    for route in routes:
-        ip, subnet = route.split('/')
-        ip_version = ipaddress.ip_address(ip).version
-
-        # we want to keep the route if it is not a standalone tunnel route.
-        # if the route subnet contains more than one address, it is not a
-        # standalone tunnel route
-        if (ip not in standalone_tunnel_route_ips) or \
-           ((ip_version == 6 and subnet != '128') or (ip_version == 4 and subnet != '32')):
-            updated_routes.append(route)
-
-    return updated_routes
-
 def is_feature_bgp_enabled(namespace):
     """
     Check if bgp feature is enabled or disabled.
@@ -546,6 +547,26 @@ def is_feature_bgp_enabled(namespace):
             bgp_enabled = True
     return bgp_enabled
 
+
+def is_frr_route_pending(entry):
+    """
+    Check if a FRR route entry is expected to be offloaded but is not
+    """
+    if entry['protocol'] in ('connected', 'kernel'):
+        return False
+
+    # TODO: Also handle VRF routes. Currently this script does not check for VRF routes so it would be incorrect for us
+    # to assume they are installed in ASIC_DB, so we don't handle them.
+    if entry['vrfName'] != 'default':
+        return False
+
+    # skip if this bgp source prefix is not selected as best
+    if not entry.get('selected', False):
+        return False
+
+    return not entry.get('offloaded', False)
+
+
 def check_frr_pending_routes(namespace):
     """
     Check FRR routes for offload flag presence by executing "show ip route json"
@@ -555,25 +576,8 @@ def check_frr_pending_routes(namespace):
     missed_rt = []
     retries = FRR_CHECK_RETRIES
     for i in range(retries):
-        missed_rt = []
-        frr_routes = get_frr_routes(namespace)
-
-        for _, entries in frr_routes.items():
-            for entry in entries:
-                if entry['protocol'] in ('connected', 'kernel'):
-                    continue
-
-                # TODO: Also handle VRF routes. Currently this script does not check for VRF routes so it would be incorrect for us
-                # to assume they are installed in ASIC_DB, so we don't handle them.
-                if entry['vrfName'] != 'default':
-                    continue
-
-                # skip if this bgp source prefix is not selected as best
-                if not entry.get('selected', False):
-                    continue
-
-                if not entry.get('offloaded', False):
-                    missed_rt.append(entry)
+        frr_routes = get_frr_routes(namespace, is_frr_route_pending)
+        missed_rt = [entry for entries in frr_routes.values() for entry in entries]
 
         if not missed_rt:
             break
@@ -618,34 +622,6 @@ def get_soc_ips(config_db):
     return soc_ips
 
 
-def filter_out_soc_ip_routes(namespace, routes):
-    """
-    Ignore ASIC only routes for SOC IPs
-
-    For active-active cables, we want the tunnel route for SOC IPs
-    to only be programmed to the ASIC and not to the kernel. This is to allow
-    gRPC connections coming from ycabled to always use the direct link (since this
-    will use the kernel routing table), but still provide connectivity to any external
-    traffic in case of a link issue (since this traffic will be forwarded by the ASIC).
-    """
-    config_db = multi_asic.connect_config_db_for_ns(namespace)
-
-    if not is_dualtor(config_db):
-        return routes
-
-    soc_ips = get_soc_ips(config_db)
-
-    if not soc_ips:
-        return routes
-
-    updated_routes = []
-    for route in routes:
-        if route not in soc_ips:
-            updated_routes.append(route)
-
-    return updated_routes
-
-
 def get_vlan_neighbors(namespace):
     """Return a list of VLAN neighbors."""
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
@@ -664,32 +640,253 @@ def get_vlan_neighbors(namespace):
     return valid_neighs
 
 
-def filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss):
-    """Ignore any route miss for vlan neighbor IPs."""
+def get_check_namespaces(namespace):
+    """
+    :return list of namespaces to check for the namespace option
+    """
+    namespace_list = []
+    if namespace is not multi_asic.DEFAULT_NAMESPACE and namespace in multi_asic.get_namespace_list():
+        namespace_list.append(namespace)
+    else:
+        namespace_list = multi_asic.get_namespace_list()
+        print_message(syslog.LOG_INFO, "Checking routes for namespaces: ", namespace_list)
+    return namespace_list
+
 
-    def _filter_out_neigh_route(routes, neighs):
-        updated_routes = []
-        ignored_routes = []
-        for route in routes:
-            if route in neighs:
-                ignored_routes.append(route)
-            else:
-                updated_routes.append(route)
-        return updated_routes, ignored_routes
+class RouteFilter(object):
+    """
+    Rules out the expected route misses of a namespace:
+    - APPL-DB routes of local interfaces and VOQ neighbors
+    - ASIC-DB default, VNET, standalone tunnel (dualtor) & SOC IP routes
+    - VLAN neighbors (dualtor)
+    The tables used are read on first use only, into lookup sets, with
+    a single connection per DB.
+    """
+    # eth1 is added to skip route installed in AAPL_DB on packet-chassis
+    LOCAL_INTFS = {'eth0', 'eth1', 'docker0'}
+    LOCAL_INTF_LO_RE = re.compile(r'tun0|lo|Loopback\d+')
+    VOQ_INBAND_INTF_RE = re.compile(r'Ethernet-IB\d+')
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self._appl_db = None
+        self._config_db = None
+        self._route_table = None
+        self._lookups = {}
+
+    @property
+    def appl_db(self):
+        if self._appl_db is None:
+            self._appl_db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, self.namespace)
+        return self._appl_db
+
+    @property
+    def config_db(self):
+        if self._config_db is None:
+            self._config_db = multi_asic.connect_config_db_for_ns(self.namespace)
+        return self._config_db
+
+    def _lookup(self, name, build):
+        if name not in self._lookups:
+            self._lookups[name] = build()
+        return self._lookups[name]
+
+    def is_dualtor(self):
+        return self._lookup('dualtor', lambda: is_dualtor(self.config_db))
+
+    def get_local_intfs(self):
+        return self._lookup('local_intfs', lambda: self.LOCAL_INTFS | set(chassis.get_chassis_local_interfaces()))
+
+    def get_vnet_routes(self):
+        def build():
+            vnet_route_table = swsscommon.Table(self.appl_db, 'VNET_ROUTE_TABLE')
+            vnet_route_tunnel_table = swsscommon.Table(self.appl_db, 'VNET_ROUTE_TUNNEL_TABLE')
+            keys = vnet_route_table.getKeys() + vnet_route_tunnel_table.getKeys()
+            # Keys are <vnet name>:<route>
+            return {key.split(':', 1)[1] for key in keys}
+        return self._lookup('vnet_routes', build)
+
+    def get_standalone_tunnel_route_ips(self):
+        def build():
+            if not self.is_dualtor():
+                return set()
+            neigh_table = swsscommon.Table(self.appl_db, 'NEIGH_TABLE')
+            ips = set()
+            for neigh in neigh_table.getKeys():
+                _, mac = neigh_table.hget(neigh, 'neigh')
+                if mac == '00:00:00:00:00:00':
+                    # remove preceding 'VlanXXXX' to get just the neighbor IP
+                    ips.add(':'.join(neigh.split(':')[1:]))
+            return ips
+        return self._lookup('standalone_tunnel_route_ips', build)
+
+    def get_soc_ips(self):
+        """
+        ASIC only routes for SOC IPs
+
+        For active-active cables, we want the tunnel route for SOC IPs
+        to only be programmed to the ASIC and not to the kernel. This is to allow
+        gRPC connections coming from ycabled to always use the direct link (since this
+        will use the kernel routing table), but still provide connectivity to any external
+        traffic in case of a link issue (since this traffic will be forwarded by the ASIC).
+        """
+        return self._lookup('soc_ips', lambda: set(get_soc_ips(self.config_db)) if self.is_dualtor() else set())
+
+    def get_vlan_neighbors(self):
+        return self._lookup('vlan_neighbors', lambda: set(get_vlan_neighbors(self.namespace)))
+
+    def is_standalone_tunnel_route(self, route):
+        ips = self.get_standalone_tunnel_route_ips()
+        if not ips:
+            return False
+        ip, subnet = route.split('/')
+        if ip not in ips:
+            return False
+        # if the route subnet contains more than one address, it is not a
+        # standalone tunnel route
+        ip_version = ipaddress.ip_address(ip).version
+        return (ip_version == 6 and subnet == '128') or (ip_version == 4 and subnet == '32')
+
+    def is_expected_asic_route(self, route):
+        """
+        :param route: ASIC-DB route missing in APPL-DB
+        """
+        return is_default_route(route) or \
+            route in self.get_vnet_routes() or \
+            self.is_standalone_tunnel_route(route) or \
+            route in self.get_soc_ips()
+
+    def is_expected_appl_route(self, route):
+        """
+        :param route: APPL-DB route missing in ASIC-DB
+        """
+        if self._route_table is None:
+            self._route_table = swsscommon.Table(self.appl_db, APPL_ROUTE_TABLE_NAME)
+
+        e = dict(self._route_table.get(route)[1])
+
+        # Local interfaces
+        ifname = e.get('ifname', '')
+        if ifname in self.get_local_intfs():
+            return True
+
+        if self.LOCAL_INTF_LO_RE.match(ifname):
+            nh = e.get('nexthop')
+            if not nh or ipaddress.ip_address(nh).is_unspecified:
+                return True
+
+        # Routes statically added for the voq neighbors, on the inband
+        # interface. These are not written in ASIC-DB.
+        prefix = route.split("/")
+        if not e:
+            # Prefix might have been added. So try w/o it.
+            e = dict(self._route_table.get(prefix[0])[1])
+        return bool(e) and bool(self.VOQ_INBAND_INTF_RE.match(e['ifname'])) and \
+            ((prefix[1] == "32" and e['nexthop'] == "0.0.0.0") or
+             (prefix[1] == "128" and e['nexthop'] == "::"))
 
-    config_db = multi_asic.connect_config_db_for_ns(namespace)
 
-    if is_dualtor(config_db):
-        vlan_neighs = set(get_vlan_neighbors(namespace))
-        rt_appl_miss, ignored_rt_appl_miss = _filter_out_neigh_route(rt_appl_miss, vlan_neighs)
+def filter_out_route_misses(namespace, intf_appl, rt_appl_miss, rt_asic_miss, route_filter=None):
+    """
+    Rule out the route misses that are expected, in a single pass over each list.
+    :param intf_appl: APPL-DB INTF_TABLE entries
+    :param rt_appl_miss: sorted APPL-DB routes missing in ASIC-DB
+    :param rt_asic_miss: sorted ASIC-DB routes missing in APPL-DB
+    :param route_filter: RouteFilter of the namespace, to reuse its lookups
+    :return (rt_appl_miss, rt_asic_miss) filtered
+    """
+    if route_filter is None:
+        route_filter = RouteFilter(namespace)
+
+    # Check missed ASIC routes against APPL-DB INTF_TABLE
+    intf_appl = set(intf_appl)
+    rt_asic_miss = [rt for rt in rt_asic_miss
+                    if rt not in intf_appl and not route_filter.is_expected_asic_route(rt)]
+    rt_appl_miss = [rt for rt in rt_appl_miss if not route_filter.is_expected_appl_route(rt)]
+
+    # NOTE: On dualtor environment, ignore any route miss for the
+    # neighbors learned from the vlan subnet.
+    if (rt_appl_miss or rt_asic_miss) and route_filter.is_dualtor():
+        vlan_neighs = route_filter.get_vlan_neighbors()
+        ignored_rt_appl_miss = [rt for rt in rt_appl_miss if rt in vlan_neighs]
+        rt_appl_miss = [rt for rt in rt_appl_miss if rt not in vlan_neighs]
         print_message(syslog.LOG_DEBUG, "Ignored appl route miss:",  json.dumps(ignored_rt_appl_miss, indent=4))
-        rt_asic_miss, ignored_rt_asic_miss = _filter_out_neigh_route(rt_asic_miss, vlan_neighs)
+        ignored_rt_asic_miss = [rt for rt in rt_asic_miss if rt in vlan_neighs]
+        rt_asic_miss = [rt for rt in rt_asic_miss if rt not in vlan_neighs]
         print_message(syslog.LOG_DEBUG, "Ignored asic route miss:",  json.dumps(ignored_rt_asic_miss, indent=4))
 
     return rt_appl_miss, rt_asic_miss
 
 
-def check_routes(namespace):
+def get_namespace_results(namespace, rt_appl_miss, intf_appl_miss, rt_asic_miss, rt_appl):
+    """
+    Collect the unjustifiable entries of a namespace, along with the FRR
+    routes not offloaded. Those are mitigated if APPL & ASIC DB routes are
+    in sync.
+    :param rt_appl: APPL-DB routes, used for the mitigation
+    :return results dictionary of the namespace, empty if all good
+    """
+    results = {}
+    if rt_appl_miss:
+        results["missed_ROUTE_TABLE_routes"] = rt_appl_miss
+
+    if intf_appl_miss:
+        results["missed_INTF_TABLE_entries"] = intf_appl_miss
+
+    if rt_asic_miss:
+        results["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss
+
+    rt_frr_miss = check_frr_pending_routes(namespace)
+
+    if rt_frr_miss:
+        results["missed_FRR_routes"] = rt_frr_miss
+
+    if rt_frr_miss and not rt_appl_miss and not rt_asic_miss:
+        print_message(syslog.LOG_ERR, "Some routes are not set offloaded in FRR{} "
+                      "but all routes in APPL_DB and ASIC_DB are in sync".format(namespace))
+        if is_suppress_fib_pending_enabled(namespace):
+            mitigate_installed_not_offloaded_frr_routes(namespace, rt_frr_miss, rt_appl)
+
+    return results
+
+
+def check_namespace_routes(namespace):
+    """
+    Run the checks of check_routes() for a namespace.
+    :return (results, adds, deletes) where results holds the unjustifiable
+    entries of the namespace and adds/deletes the subscribe updates seen.
+    """
+    adds = []
+    deletes = []
+
+    selector, subs, rt_asic = get_asicdb_routes(namespace)
+
+    rt_appl = get_appdb_routes(namespace)
+    intf_appl = get_interfaces(namespace)
+
+    # Diff APPL-DB routes & ASIC-DB routes
+    rt_appl_miss, rt_asic_miss = diff_sorted_lists(rt_appl, rt_asic)
+
+    # Check APPL-DB INTF_TABLE with ASIC table route entries
+    intf_appl_miss, _ = diff_sorted_lists(intf_appl, rt_asic)
+
+    rt_appl_miss, rt_asic_miss = filter_out_route_misses(namespace, intf_appl, rt_appl_miss, rt_asic_miss)
+
+    if rt_appl_miss or rt_asic_miss:
+        # Look for subscribe updates for a second
+        adds, deletes = get_subscribe_updates(selector, subs)
+
+    # Drop all those for which SET received
+    rt_appl_miss, _ = diff_sorted_lists(rt_appl_miss, adds)
+
+    # Drop all those for which DEL received
+    rt_asic_miss, _ = diff_sorted_lists(rt_asic_miss, deletes)
+
+    results = get_namespace_results(namespace, rt_appl_miss, intf_appl_miss, rt_asic_miss, rt_appl)
+    return results, adds, deletes
+
+
+def check_routes(namespace, max_workers=1):
     """
     The heart of this script which runs the checks.
     Read APPL-DB & ASIC-DB, the relevant tables for route checking.
@@ -705,105 +902,262 @@ def check_routes(namespace):
     If there are FRR routes that aren't marked offloaded but all APPL & ASIC DB
     routes are in sync report failure and perform a mitigation action.
 
+    Namespaces are checked in up to max_workers processes.
+
     :return (0, None) on sucess, else (-1, results) where results holds
     the unjustifiable entries.
     """
-    namespace_list = []
-    if namespace is not multi_asic.DEFAULT_NAMESPACE and namespace in multi_asic.get_namespace_list():
-        namespace_list.append(namespace)
+    namespace_list = get_check_namespaces(namespace)
+
+    if max_workers > 1 and len(namespace_list) > 1:
+        # One worker process per namespace; the pool is terminated on exit,
+        # including upon timeout.
+        with multiprocessing.Pool(processes=min(max_workers, len(namespace_list))) as pool:
+            ns_results = pool.map(check_namespace_routes, namespace_list)
     else:
-        namespace_list = multi_asic.get_namespace_list()
-        print_message(syslog.LOG_INFO, "Checking routes for namespaces: ", namespace_list)
+        ns_results = [check_namespace_routes(ns) for ns in namespace_list]
 
     results = {}
     adds = {}
     deletes = {}
-    for namespace in namespace_list:
-        intf_appl_miss = []
-        rt_appl_miss = []
-        rt_asic_miss = []
-        rt_frr_miss = []
-        adds[namespace] = []
-        deletes[namespace] = []
-
-        selector, subs, rt_asic = get_asicdb_routes(namespace)
+    for namespace, (ns_result, adds[namespace], deletes[namespace]) in zip(namespace_list, ns_results):
+        if ns_result:
+            results[namespace] = ns_result
 
-        rt_appl = get_appdb_routes(namespace)
-        intf_appl = get_interfaces(namespace)
-
-        # Diff APPL-DB routes & ASIC-DB routes
-        rt_appl_miss, rt_asic_miss = diff_sorted_lists(rt_appl, rt_asic)
+    if results:
+        print_message(syslog.LOG_WARNING, "Failure results: {",  json.dumps(results, indent=4), "}")
+        print_message(syslog.LOG_WARNING, "Failed. Look at reported mismatches above")
+        print_message(syslog.LOG_WARNING, "add: ", json.dumps(adds, indent=4))
+        print_message(syslog.LOG_WARNING, "del: ", json.dumps(deletes, indent=4))
+        return -1, results
+    else:
+        print_message(syslog.LOG_INFO, "All good!")
+        return 0, None
 
-        # Check missed ASIC routes against APPL-DB INTF_TABLE
-        _, rt_asic_miss = diff_sorted_lists(intf_appl, rt_asic_miss)
-        rt_asic_miss = filter_out_default_routes(rt_asic_miss)
-        rt_asic_miss = filter_out_vnet_routes(namespace, rt_asic_miss)
-        rt_asic_miss = filter_out_standalone_tunnel_routes(namespace, rt_asic_miss)
-        rt_asic_miss = filter_out_soc_ip_routes(namespace, rt_asic_miss)
 
+class RouteSet(object):
+    """
+    Routes of one table, indexed by the table key. The same route may be
+    present under several keys (e.g. in different VRFs); it is dropped
+    when the last of them is deleted.
+    """
+    def __init__(self):
+        self.keys = {}
+        self.refs = {}
+
+    def add(self, key, route):
+        """
+        :return True if the route was not present before
+        """
+        if key in self.keys:
+            return False
+        self.keys[key] = route
+        cnt = self.refs.get(route, 0)
+        self.refs[route] = cnt + 1
+        return cnt == 0
+
+    def remove(self, key):
+        """
+        :return the route if it is no longer present, else None
+        """
+        route = self.keys.pop(key, None)
+        if route is None:
+            return None
+        self.refs[route] -= 1
+        if self.refs[route]:
+            return None
+        del self.refs[route]
+        return route
+
+    def __contains__(self, route):
+        return route in self.refs
+
+    def __len__(self):
+        return len(self.refs)
+
+
+class RouteTableCache(object):
+    """
+    In-memory copy of the APPL-DB ROUTE_TABLE & ASIC-DB route entries of
+    a namespace, kept up to date from subscriptions to both tables.
+    The routes present in one table only are tracked on every update, so
+    a check does not need to read or diff the full tables.
+    """
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.selector = None
+        self.subs = {}
+        self.routes = {}
+        self.missed = {}
+        self.syncs = 0
+        self.errors = 0
+        self.resync_time = None
+
+    def sync(self):
+        """
+        Full resync. New subscriptions replay the current content of the
+        tables as SET operations.
+        """
+        self.routes = {APPL_DB_NAME: RouteSet(), ASIC_DB_NAME: RouteSet()}
+        self.missed = {APPL_DB_NAME: set(), ASIC_DB_NAME: set()}
+        self.subs = {}
+        self.selector = swsscommon.Select()
+        for db_name, table in ((APPL_DB_NAME, APPL_ROUTE_TABLE_NAME), (ASIC_DB_NAME, ASIC_TABLE_NAME)):
+            db = swsscommon.DBConnector(db_name, REDIS_TIMEOUT_MSECS, True, self.namespace)
+            self.subs[db_name] = swsscommon.SubscriberStateTable(db, table)
+            self.selector.addSelectable(self.subs[db_name])
+        self.drain()
+        self.syncs += 1
+        self.resync_time = None
+        print_message(syslog.LOG_INFO,
+                      "Route tables synced for namespace {}: APPL-DB {} routes, ASIC-DB {} routes".format(
+                          self.namespace, len(self.routes[APPL_DB_NAME]), len(self.routes[ASIC_DB_NAME])))
+
+    def drain(self):
+        """
+        Apply all the updates popped from the subscriptions
+        """
+        for db_name, subs in self.subs.items():
+            while True:
+                key, op, _ = subs.pop()
+                if not key:
+                    break
+                self.update(db_name, key, op)
+
+    def update(self, db_name, key, op):
+        other = ASIC_DB_NAME if db_name == APPL_DB_NAME else APPL_DB_NAME
+        if op == "SET":
+            if db_name == APPL_DB_NAME:
+                res, route = checkout_appl_rt_entry(key)
+            else:
+                res, route = checkout_rt_entry(key)
+            if res and self.routes[db_name].add(key, route):
+                if route in self.routes[other]:
+                    self.missed[other].discard(route)
+                else:
+                    self.missed[db_name].add(route)
+        elif op == "DEL":
+            route = self.routes[db_name].remove(key)
+            if route is not None:
+                self.missed[db_name].discard(route)
+                if route in self.routes[other]:
+                    self.missed[other].add(route)
+
+    def wait_updates(self, timeout):
+        """
+        Apply the updates received within timeout seconds.
+        Any subscription error triggers a full resync, as updates may be lost.
+        The resync after consecutive errors is delayed by an exponential
+        backoff, and RuntimeError is raised after SUBSCRIBE_MAX_ERRORS.
+        """
+        t_end = time.time() + timeout
+        while True:
+            try:
+                if self.resync_time is not None:
+                    time.sleep(max(min(self.resync_time, t_end) - time.time(), 0))
+                    if time.time() < self.resync_time:
+                        return
+                    self.sync()
+                state, _ = self.selector.select(max(int((t_end - time.time()) * 1000), 0))
+                if state == swsscommon.Select.ERROR:
+                    raise RuntimeError("select error")
+                self.drain()
+                self.errors = 0
+            except RuntimeError as e:
+                self.errors += 1
+                if self.errors >= SUBSCRIBE_MAX_ERRORS:
+                    raise RuntimeError("Route subscription failed {} times in a row for namespace {}: {}".format(
+                        self.errors, self.namespace, e))
+                backoff = 0
+                if self.errors > 1:
+                    backoff = min(SUBSCRIBE_BACKOFF_SECS * 2 ** (self.errors - 2), SUBSCRIBE_MAX_BACKOFF_SECS)
+                print_message(syslog.LOG_WARNING,
+                              "Route subscription failed for namespace {}: {}; resyncing in {} seconds".format(
+                                  self.namespace, e, backoff))
+                self.resync_time = time.time() + backoff
+                continue
+            if time.time() >= t_end:
+                return
 
-        # Check APPL-DB INTF_TABLE with ASIC table route entries
-        intf_appl_miss, _ = diff_sorted_lists(intf_appl, rt_asic)
+    def get_misses(self):
+        """
+        :return (<APPL-DB routes missing in ASIC-DB>, <ASIC-DB routes missing in APPL-DB>) as sorted lists
+        """
+        return sorted(self.missed[APPL_DB_NAME]), sorted(self.missed[ASIC_DB_NAME])
 
-        if rt_appl_miss:
-            rt_appl_miss = filter_out_local_interfaces(namespace, rt_appl_miss)
 
-        if rt_appl_miss:
-            rt_appl_miss = filter_out_voq_neigh_routes(namespace, rt_appl_miss)
+def check_cached_routes(caches):
+    """
+    Same checks as check_routes(), against the route tables cached by
+    RouteTableCache. The small tables used by the filters (interfaces,
+    neighbors, VNET routes, ...) and the FRR routes are still read on
+    every check.
+    :return (0, None) on sucess, else (-1, results) where results holds
+    the unjustifiable entries.
+    """
+    results = {}
+    for cache in caches:
+        namespace = cache.namespace
+        intf_appl = get_interfaces(namespace)
 
-        # NOTE: On dualtor environment, ignore any route miss for the
-        # neighbors learned from the vlan subnet.
-        if rt_appl_miss or rt_asic_miss:
-            rt_appl_miss, rt_asic_miss = filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss)
+        route_filter = RouteFilter(namespace)
 
+        rt_appl_miss, rt_asic_miss = cache.get_misses()
+        rt_appl_miss, rt_asic_miss = filter_out_route_misses(namespace, intf_appl, rt_appl_miss, rt_asic_miss,
+                                                             route_filter)
         if rt_appl_miss or rt_asic_miss:
-            # Look for subscribe updates for a second
-            adds[namespace], deletes[namespace] = get_subscribe_updates(selector, subs)
-
-        # Drop all those for which SET received
-        rt_appl_miss, _ = diff_sorted_lists(rt_appl_miss, adds[namespace])
-
-        # Drop all those for which DEL received
-        rt_asic_miss, _ = diff_sorted_lists(rt_asic_miss, deletes[namespace])
-
-        if rt_appl_miss:
-            if namespace not in results:
-                results[namespace] = {}
-            results[namespace]["missed_ROUTE_TABLE_routes"] = rt_appl_miss
+            # Give the in-flight updates a second to settle
+            cache.wait_updates(SUBSCRIBE_WAIT_SECS)
+            rt_appl_miss, rt_asic_miss = cache.get_misses()
+            rt_appl_miss, rt_asic_miss = filter_out_route_misses(namespace, intf_appl, rt_appl_miss, rt_asic_miss,
+                                                                 route_filter)
 
-        if intf_appl_miss:
-            if namespace not in results:
-                results[namespace] = {}
-            results[namespace]["missed_INTF_TABLE_entries"] = intf_appl_miss
+        intf_appl_miss = [ip for ip in intf_appl if ip not in cache.routes[ASIC_DB_NAME]]
 
-        if rt_asic_miss:
-            if namespace not in results:
-                results[namespace] = {}
-            results[namespace]["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss
-
-        rt_frr_miss = check_frr_pending_routes(namespace)
-
-        if rt_frr_miss:
-            if namespace not in results:
-                results[namespace] = {}
-            results[namespace]["missed_FRR_routes"] = rt_frr_miss
-
-        if results:
-            if rt_frr_miss and not rt_appl_miss and not rt_asic_miss:
-                print_message(syslog.LOG_ERR, "Some routes are not set offloaded in FRR{} but all routes in APPL_DB and ASIC_DB are in sync".format(namespace))
-                if is_suppress_fib_pending_enabled(namespace):
-                    mitigate_installed_not_offloaded_frr_routes(namespace, rt_frr_miss, rt_appl)
+        ns_result = get_namespace_results(namespace, rt_appl_miss, intf_appl_miss, rt_asic_miss,
+                                          cache.routes[APPL_DB_NAME])
+        if ns_result:
+            results[namespace] = ns_result
 
     if results:
         print_message(syslog.LOG_WARNING, "Failure results: {",  json.dumps(results, indent=4), "}")
         print_message(syslog.LOG_WARNING, "Failed. Look at reported mismatches above")
-        print_message(syslog.LOG_WARNING, "add: ", json.dumps(adds, indent=4))
-        print_message(syslog.LOG_WARNING, "del: ", json.dumps(deletes, indent=4))
         return -1, results
     else:
         print_message(syslog.LOG_INFO, "All good!")
         return 0, None
 
+
+def run_daemon(namespace, interval):
+    """
+    Check routes every interval against route tables kept in memory.
+    The tables are fully read once at start and then updated from the
+    subscriptions; they are read again only if a subscription fails.
+    :return Same return value as check_cached_routes, in unit testing only.
+    """
+    signal.alarm(TIMEOUT_SECONDS)
+    caches = []
+    for ns in get_check_namespaces(namespace):
+        cache = RouteTableCache(ns)
+        cache.sync()
+        caches.append(cache)
+    signal.alarm(0)
+
+    while True:
+        signal.alarm(TIMEOUT_SECONDS)
+        ret, res = check_cached_routes(caches)
+        print_message(syslog.LOG_DEBUG, "ret={}, res={}".format(ret, res))
+        signal.alarm(0)
+
+        if UNIT_TESTING:
+            return ret, res
+
+        t_end = time.time() + interval
+        while time.time() < t_end:
+            for cache in caches:
+                cache.wait_updates(min(DAEMON_POLL_SECS, t_end - time.time()) / len(caches))
+
+
 def main():
     """
     main entry point, which mainly parses the args and call check_routes
@@ -817,6 +1171,11 @@ def main():
     parser.add_argument("-i", "--interval", type=int, default=0, help="Scan interval in seconds")
     parser.add_argument("-s", "--log_to_syslog", action="store_true", default=True, help="Write message to syslog")
     parser.add_argument('-n','--namespace',   default=multi_asic.DEFAULT_NAMESPACE, help='Verify routes for this specific namespace')
+    parser.add_argument("-w", "--max-workers", type=int, default=1,
+                        help="Check up to this many namespaces in parallel worker processes")
+    parser.add_argument("-d", "--daemon", action="store_true", default=False,
+                        help="Keep the route tables in memory, updated from subscriptions, "
+                             "and verify them every interval")
     args = parser.parse_args()
 
     namespace = args.namespace
@@ -847,9 +1206,12 @@ def main():
         print_message(syslog.LOG_INFO, "BGP feature is disabled, exiting without checking routes!!")
         return 0, None
 
+    if args.daemon:
+        return run_daemon(namespace, interval or MIN_SCAN_INTERVAL)
+
     while True:
         signal.alarm(TIMEOUT_SECONDS)
-        ret, res= check_routes(namespace)
+        ret, res = check_routes(namespace, args.max_workers)
         print_message(syslog.LOG_DEBUG, "ret={}, res={}".format(ret, res))
         signal.alarm(0)
 
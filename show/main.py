@@ -39,33 +39,8 @@ try:
 except KeyError:
     pass
 
-from . import acl
 from . import bgp_common
-from . import chassis_modules
-from . import dropcounters
-from . import fabric
-from . import feature
-from . import fgnhg
-from . import flow_counters
-from . import gearbox
-from . import interfaces
-from . import kdump
-from . import kube
-from . import muxcable
-from . import nat
-from . import platform
-from . import p4_table
-from . import processes
-from . import reboot_cause
-from . import sflow
-from . import vlan
-from . import vnet
-from . import vxlan
-from . import system_health
-from . import warm_restart
 from . import plugins
-from . import syslog
-from . import dns
 
 # Global Variables
 PLATFORM_JSON = 'platform.json'
@@ -93,10 +68,6 @@ def get_routing_stack():
 
     return result
 
-
-# Global Routing-Stack variable
-routing_stack = get_routing_stack()
-
 # Read given JSON file
 def readJsonFile(fileName):
     try:
@@ -291,39 +262,39 @@ def cli(ctx):
     ctx.obj = Db()
 
 
-# Add groups from other modules
-cli.add_command(acl.acl)
-cli.add_command(chassis_modules.chassis)
-cli.add_command(dropcounters.dropcounters)
-cli.add_command(fabric.fabric)
-cli.add_command(feature.feature)
-cli.add_command(fgnhg.fgnhg)
-cli.add_command(flow_counters.flowcnt_route)
-cli.add_command(flow_counters.flowcnt_trap)
-cli.add_command(kdump.kdump)
-cli.add_command(interfaces.interfaces)
-cli.add_command(kdump.kdump)
-cli.add_command(kube.kubernetes)
-cli.add_command(muxcable.muxcable)
-cli.add_command(nat.nat)
-cli.add_command(platform.platform)
-cli.add_command(p4_table.p4_table)
-cli.add_command(processes.processes)
-cli.add_command(reboot_cause.reboot_cause)
-cli.add_command(sflow.sflow)
-cli.add_command(vlan.vlan)
-cli.add_command(vnet.vnet)
-cli.add_command(vxlan.vxlan)
-cli.add_command(system_health.system_health)
-cli.add_command(warm_restart.warm_restart)
-cli.add_command(dns.dns)
-
-# syslog module
-cli.add_command(syslog.syslog)
+# Groups from other modules, the modules are only imported when their group is invoked
+SUBCOMMANDS = {
+    'acl': 'show.acl:acl',
+    'chassis': 'show.chassis_modules:chassis',
+    'dns': 'show.dns:dns',
+    'dropcounters': 'show.dropcounters:dropcounters',
+    'fabric': 'show.fabric:fabric',
+    'feature': 'show.feature:feature',
+    'fgnhg': 'show.fgnhg:fgnhg',
+    'flowcnt-route': 'show.flow_counters:flowcnt_route',
+    'flowcnt-trap': 'show.flow_counters:flowcnt_trap',
+    'interfaces': 'show.interfaces:interfaces',
+    'kdump': 'show.kdump:kdump',
+    'kubernetes': 'show.kube:kubernetes',
+    'muxcable': 'show.muxcable:muxcable',
+    'nat': 'show.nat:nat',
+    'p4-table': 'show.p4_table:p4_table',
+    'platform': 'show.platform:platform',
+    'processes': 'show.processes:processes',
+    'reboot-cause': 'show.reboot_cause:reboot_cause',
+    'sflow': 'show.sflow:sflow',
+    'syslog': 'show.syslog:syslog',
+    'system-health': 'show.system_health:system_health',
+    'vlan': 'show.vlan:vlan',
+    'vnet': 'show.vnet:vnet',
+    'vxlan': 'show.vxlan:vxlan',
+    'warm_restart': 'show.warm_restart:warm_restart',
+}
+
+cli.add_lazy_commands(SUBCOMMANDS)
 
 # Add greabox commands only if GEARBOX is configured
-if is_gearbox_configured():
-    cli.add_command(gearbox.gearbox)
+cli.add_lazy_command('gearbox', 'show.gearbox:gearbox', condition=is_gearbox_configured)
 
 
 #
@@ -1170,20 +1141,23 @@ def protocol(verbose):
     cmd = ['sudo', constants.RVTYSH_COMMAND, '-c', "show ipv6 protocol"]
     run_command(cmd, display_cmd=verbose)
 
+
 #
 # Inserting BGP functionality into cli's show parse-chain.
 # BGP commands are determined by the routing-stack being elected.
 #
-if routing_stack == "quagga":
-    from .bgp_quagga_v4 import bgp
-    ip.add_command(bgp)
-    from .bgp_quagga_v6 import bgp
-    ipv6.add_command(bgp)
-elif routing_stack == "frr":
-    from .bgp_frr_v4 import bgp
-    ip.add_command(bgp)
-    from .bgp_frr_v6 import bgp
-    ipv6.add_command(bgp)
+def get_bgp_command(ip_version):
+    """
+    Returns the 'bgp' group of the routing stack for ip_version, 'v4' or 'v6'
+    """
+    routing_stack = get_routing_stack()
+    if routing_stack not in ["quagga", "frr"]:
+        return None
+    return clicommon.load_command('show.bgp_{}_{}:bgp'.format(routing_stack, ip_version))
+
+
+ip.add_lazy_command('bgp', lambda: get_bgp_command('v4'))
+ipv6.add_lazy_command('bgp', lambda: get_bgp_command('v6'))
 
 #
 # 'link-local-mode' subcommand ("show ipv6 link-local-mode")
@@ -1317,7 +1291,8 @@ def version(verbose):
     """Show version information"""
     version_info = device_info.get_sonic_version_info()
     platform_info = device_info.get_platform_info()
-    chassis_info = platform.get_chassis_info()
+    from .platform import get_chassis_info
+    chassis_info = get_chassis_info()
 
     sys_uptime_cmd = ["uptime"]
     sys_uptime = subprocess.Popen(sys_uptime_cmd, text=True, stdout=subprocess.PIPE)
@@ -2256,7 +2231,7 @@ def received(db, namespace):
 
 # Load plugins and register them
 helper = util_base.UtilHelper()
-helper.load_and_register_plugins(plugins, cli)
+helper.load_and_register_plugins(plugins, cli, lazy=True)
 
 if __name__ == '__main__':
     cli()
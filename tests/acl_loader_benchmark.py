@@ -0,0 +1,116 @@
+"""
+Measures the time taken by acl-loader to load and program large ACL tables: the parsing of the openconfig
+file with and without pybind, the initial full update, a full update changing 1% of the rules, and the same
+update written one rule at a time as acl-loader used to do. The rules of a dataplane table are all deleted and
+added again by a full update, only the changed rules are written with --priority_order. Run it on a SONiC
+device, with an existing L3 ACL table, from the repository root:
+
+    python3 -m tests.acl_loader_benchmark [--table DATAACL] [--rules 10000 50000] [--priority_order]
+
+The rules of the table are removed when the benchmark completes.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from tabulate import tabulate
+
+from acl_loader.main import AclLoader
+
+
+def acl_entry(sequence_id, destination_port):
+    return {
+        "config": {"sequence-id": sequence_id},
+        "actions": {"config": {"forwarding-action": "ACCEPT"}},
+        "ip": {"config": {"protocol": "IP_TCP",
+                          "source-ip-address": "10.{}.{}.0/24".format(sequence_id // 256 % 256, sequence_id % 256)}},
+        "transport": {"config": {"destination-port": str(destination_port)}}
+    }
+
+
+def write_acl_file(path, table_name, rules, changed_every=0):
+    entries = {}
+    for sequence_id in range(1, rules + 1):
+        changed = changed_every and sequence_id % changed_every == 0
+        entries[str(sequence_id)] = acl_entry(sequence_id, 443 if changed else 22)
+    acl = {"acl": {"acl-sets": {"acl-set": {table_name: {
+        "config": {"name": table_name},
+        "acl-entries": {"acl-entry": entries}
+    }}}}}
+    with open(path, 'w') as acl_file:
+        json.dump(acl, acl_file)
+
+
+def create_acl_loader(table_name, rules, priority_order):
+    acl_loader = AclLoader()
+    acl_loader.set_table_name(table_name)
+    acl_loader.set_max_priority(rules + 1)
+    acl_loader.set_priority_order(priority_order)
+    return acl_loader
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def legacy_full_update(acl_loader):
+    for key in acl_loader.rules_db_info:
+        if acl_loader.current_table == key[0]:
+            acl_loader.configdb.mod_entry(acl_loader.ACL_RULE, key, None)
+    for key, rule in acl_loader.rules_info.items():
+        acl_loader.configdb.mod_entry(acl_loader.ACL_RULE, key, rule)
+
+
+def benchmark(table_name, rules, priority_order, directory):
+    initial_file = os.path.join(directory, 'acl_initial.json')
+    changed_file = os.path.join(directory, 'acl_changed.json')
+    write_acl_file(initial_file, table_name, rules)
+    write_acl_file(changed_file, table_name, rules, changed_every=100)
+    body = []
+
+    acl_loader = create_acl_loader(table_name, rules, priority_order)
+    _, duration = timed(acl_loader.load_rules_from_file, initial_file, False, True)
+    body.append([rules, 'parse with pybind', len(acl_loader.rules_info), f"{duration:.3f}"])
+
+    acl_loader = create_acl_loader(table_name, rules, priority_order)
+    _, duration = timed(acl_loader.load_rules_from_file, initial_file)
+    body.append([rules, 'parse', len(acl_loader.rules_info), f"{duration:.3f}"])
+    _, duration = timed(acl_loader.full_update)
+    body.append([rules, 'initial full update', len(acl_loader.rules_info), f"{duration:.3f}"])
+
+    acl_loader = create_acl_loader(table_name, rules, priority_order)
+    acl_loader.load_rules_from_file(changed_file)
+    diff, duration = timed(acl_loader.full_update)
+    body.append([rules, '1% change full update', len(diff), f"{duration:.3f}"])
+
+    acl_loader = create_acl_loader(table_name, rules, priority_order)
+    acl_loader.load_rules_from_file(initial_file)
+    _, duration = timed(legacy_full_update, acl_loader)
+    body.append([rules, '1% change one rule at a time', len(acl_loader.rules_info), f"{duration:.3f}"])
+
+    create_acl_loader(table_name, rules, priority_order).delete(table_name)
+    return body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the programming of large ACL tables by acl-loader")
+    parser.add_argument('--table', default='DATAACL', help='Existing L3 ACL table to program')
+    parser.add_argument('--rules', nargs='+', type=int, default=[10000, 50000], help='Numbers of rules')
+    parser.add_argument('--priority_order', action='store_true', help='Update the rules in priority order')
+    args = parser.parse_args()
+
+    body = []
+    with tempfile.TemporaryDirectory() as directory:
+        for rules in args.rules:
+            body += benchmark(args.table, rules, args.priority_order, directory)
+
+    print(tabulate(body, ['Rules', 'Operation', 'Rules written', 'Secs']))
+
+
+if __name__ == '__main__':
+    main()
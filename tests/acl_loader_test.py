@@ -1,4 +1,5 @@
 import importlib
+import json
 import sys
 import os
 import pytest
@@ -28,6 +29,24 @@ class TestAclLoader(object):
         with pytest.raises(AclLoaderException):
             yang_acl = AclLoader.parse_acl_json(os.path.join(test_path, 'acl_input/acl2.json'))
 
+    def test_invalid__json(self):
+        with pytest.raises(AclLoaderException):
+            AclLoader.load_acl_json(os.path.join(test_path, 'acl_input/acl2.json'))
+
+    @pytest.mark.parametrize('filename', sorted(os.listdir(os.path.join(test_path, 'acl_input'))))
+    def test_json_rules_same_as_pybind(self, acl_loader, filename):
+        acl_loader.get_session_name = mock.MagicMock(return_value="everflow_session_mock")
+        results = []
+        for use_pybind in (True, False):
+            acl_loader.rules_info = {}
+            try:
+                acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input', filename), use_pybind=use_pybind)
+                results.append(acl_loader.rules_info)
+            except (AclLoaderException, ValueError, AttributeError) as e:
+                results.append(type(e))
+
+        assert results[0] == results[1]
+
     def test_validate_mirror_action(self, acl_loader):
         ingress_mirror_rule_props = {
             "MIRROR_INGRESS_ACTION": "everflow0"
@@ -110,6 +129,60 @@ class TestAclLoader(object):
             acl_loader.rules_info = {}
             acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input/illegal_vlan_9000.json'))
 
+    @pytest.mark.parametrize('filename', ['illegal_unknown_leaf.json', 'illegal_unknown_acl_set_child.json'])
+    def test_unknown_child(self, acl_loader, filename):
+        with pytest.raises(AttributeError):
+            acl_loader.rules_info = {}
+            acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input', filename))
+
+    @staticmethod
+    def write_acl_file(path, acl_sets):
+        with open(path, 'w') as f:
+            json.dump({"acl": {"acl-sets": {"acl-set": acl_sets}}}, f)
+        return str(path)
+
+    @staticmethod
+    def acl_set(*vlan_ids):
+        entries = {}
+        for index, vlan_id in enumerate(vlan_ids, 1):
+            entries[str(index)] = {
+                "config": {"sequence-id": index},
+                "actions": {"config": {"forwarding-action": "ACCEPT"}},
+                "l2": {"config": {"vlan-id": vlan_id}},
+                "ip": {"config": {"protocol": "IP_TCP"}}
+            }
+        return {"acl-entries": {"acl-entry": entries}}
+
+    def test_json_rules__converted_as_loaded(self, acl_loader, tmp_path):
+        filename = self.write_acl_file(tmp_path / "acl.json", {"DATAACL": self.acl_set("100", "200")})
+        load = importlib.import_module("acl_loader.main").load_openconfig_container
+        events = []
+
+        def load_openconfig_container(data, schema):
+            if schema is acl_loader.openconfig_acl_entry:
+                events.append("load")
+            return load(data, schema)
+
+        def convert_rule_to_db_schema(*args):
+            events.append("convert")
+            return convert(*args)
+
+        convert = acl_loader.convert_rule_to_db_schema
+        acl_loader.rules_info = {}
+        with mock.patch("acl_loader.main.load_openconfig_container", side_effect=load_openconfig_container), \
+                mock.patch.object(acl_loader, "convert_rule_to_db_schema", side_effect=convert_rule_to_db_schema):
+            acl_loader.load_rules_from_file(filename)
+
+        assert events == ["load", "convert", "load", "convert"]
+        assert acl_loader.rules_info[("DATAACL", "RULE_2")]["VLAN_ID"] == 200
+
+    def test_json_rules__set_not_converted__validated(self, acl_loader, tmp_path):
+        filename = self.write_acl_file(tmp_path / "acl.json", {"DATAACL": self.acl_set("100"),
+                                                               "NOT_A_TABLE": self.acl_set("100", "0")})
+        with pytest.raises(ValueError):
+            acl_loader.rules_info = {}
+            acl_loader.load_rules_from_file(filename)
+
     def test_vlan_id_not_a_number(self, acl_loader):
         with pytest.raises(ValueError):
             acl_loader.rules_info = {}
@@ -324,6 +397,150 @@ class TestAclLoader(object):
         acl_loader.incremental_update()
         assert acl_loader.rules_info[(('NTP_ACL', 'RULE_1'))]["PACKET_ACTION"] == "DROP"
 
+    def test_rules_diff(self):
+        current_rules = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP', 'L4_SRC_PORT': '22'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_4'): {'PRIORITY': '9996', 'PACKET_ACTION': 'DROP'},
+        }
+        new_rules = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'FORWARD'},
+            ('DATAACL', 'RULE_5'): {'PRIORITY': '9995', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_6'): {'PRIORITY': '9994', 'PACKET_ACTION': 'DROP'},
+        }
+        diff = AclRulesDiff(current_rules, new_rules)
+
+        assert list(diff.deleted) == [('DATAACL', 'RULE_4')]
+        assert list(diff.added) == [('DATAACL', 'RULE_5'), ('DATAACL', 'RULE_6')]
+        assert list(diff.modified) == [('DATAACL', 'RULE_3')]
+        assert list(diff.replaced) == [('DATAACL', 'RULE_2')]
+        assert len(diff) == 5
+
+        deleted, updated = diff.get_batches()
+        assert deleted == {('DATAACL', 'RULE_2'): None, ('DATAACL', 'RULE_4'): None}
+        assert list(updated) == [('DATAACL', 'RULE_2'), ('DATAACL', 'RULE_3'),
+                                 ('DATAACL', 'RULE_5'), ('DATAACL', 'RULE_6')]
+
+        updated, deleted, replaced = diff.get_batches(priority_order=True)
+        assert list(updated) == [('DATAACL', 'RULE_3'), ('DATAACL', 'RULE_5'), ('DATAACL', 'RULE_6')]
+        assert deleted == {('DATAACL', 'RULE_4'): None, ('DATAACL', 'RULE_2'): None}
+        assert replaced == {('DATAACL', 'RULE_2'): new_rules[('DATAACL', 'RULE_2')]}
+
+    def test_rules_diff__no_change(self):
+        rules = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'}}
+
+        diff = AclRulesDiff(rules, dict(rules))
+
+        assert len(diff) == 0
+        assert diff.get_batches() == []
+        assert diff.get_batches(priority_order=True) == []
+
+    def test_rules_diff__replaced_tables(self):
+        current_rules = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+            ('NTP_ACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+        }
+
+        diff = AclRulesDiff(current_rules, dict(current_rules), replaced_tables={'DATAACL'})
+
+        assert diff.replaced == {('DATAACL', 'RULE_1'): current_rules[('DATAACL', 'RULE_1')]}
+        assert diff.get_batches() == [{('DATAACL', 'RULE_1'): None}, diff.replaced]
+
+    def test_rules_diff__config_db_values(self):
+        new_rules = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP', 'IP_PROTOCOL': 6}}
+        current_rules = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP', 'IP_PROTOCOL': '6'}}
+
+        assert len(AclRulesDiff(current_rules, new_rules)) == 0
+
+    @pytest.mark.parametrize('filename', ['acl1.json', 'acl_egress.json', 'incremental_1.json'])
+    def test_full_update__no_change__nothing_written(self, acl_loader, filename):
+        acl_loader.per_npu_configdb = None
+        acl_loader.get_session_name = mock.MagicMock(return_value="everflow_session_mock")
+        acl_loader.rules_info = {}
+        acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input', filename))
+        # Rules as read back from Config DB
+        acl_loader.rules_db_info = {key: acl_loader.configdb.raw_to_typed(acl_loader.configdb.typed_to_raw(rule))
+                                    for key, rule in acl_loader.rules_info.items()}
+        acl_loader.set_priority_order(True)
+        try:
+            with mock.patch('acl_loader.main.ConfigDBPipeConnector') as pipe_connector:
+                diff = acl_loader.full_update()
+        finally:
+            acl_loader.set_priority_order(False)
+
+        assert acl_loader.rules_info
+        assert len(diff) == 0
+        pipe_connector.return_value.mod_config.assert_not_called()
+
+    def test_full_update__dataplane_rules_replaced(self, acl_loader):
+        acl_loader.per_npu_configdb = None
+        acl_loader.current_table = 'DATAACL'
+        acl_loader.rules_db_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'},
+            ('EVERFLOW', 'RULE_1'): {'PRIORITY': '9999', 'MIRROR_ACTION': 'everflow0'},
+        }
+        acl_loader.rules_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'FORWARD'},
+        }
+        try:
+            with mock.patch('acl_loader.main.ConfigDBPipeConnector') as pipe_connector, \
+                    mock.patch.object(acl_loader, 'rules_batch_size', 1):
+                acl_loader.full_update()
+        finally:
+            acl_loader.current_table = None
+
+        pipe_connector.assert_called_once_with()
+        pipe_connector.return_value.connect.assert_called_once_with()
+        assert pipe_connector.return_value.mod_config.call_args_list == [
+            mock.call({'ACL_RULE': {('DATAACL', 'RULE_1'): None}}),
+            mock.call({'ACL_RULE': {('DATAACL', 'RULE_2'): None}}),
+            mock.call({'ACL_RULE': {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'}}}),
+            mock.call({'ACL_RULE': {('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'FORWARD'}}}),
+        ]
+
+    def test_full_update__priority_order__pipelined_diff(self, acl_loader):
+        acl_loader.per_npu_configdb = None
+        acl_loader.current_table = 'DATAACL'
+        acl_loader.rules_db_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'},
+            ('EVERFLOW', 'RULE_1'): {'PRIORITY': '9999', 'MIRROR_ACTION': 'everflow0'},
+        }
+        acl_loader.rules_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'FORWARD'},
+        }
+        acl_loader.set_priority_order(True)
+        try:
+            with mock.patch('acl_loader.main.ConfigDBPipeConnector') as pipe_connector, \
+                    mock.patch.object(acl_loader, 'rules_batch_size', 1):
+                acl_loader.full_update()
+        finally:
+            acl_loader.current_table = None
+            acl_loader.set_priority_order(False)
+
+        assert pipe_connector.return_value.mod_config.call_args_list == [
+            mock.call({'ACL_RULE': {('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'FORWARD'}}}),
+            mock.call({'ACL_RULE': {('DATAACL', 'RULE_2'): None}}),
+        ]
+
+    def test_delete__pipelined(self, acl_loader):
+        acl_loader.per_npu_configdb = None
+        acl_loader.rules_db_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'},
+            ('EVERFLOW', 'RULE_1'): {'PRIORITY': '9999', 'MIRROR_ACTION': 'everflow0'},
+        }
+        with mock.patch('acl_loader.main.ConfigDBPipeConnector') as pipe_connector:
+            acl_loader.delete('DATAACL')
+
+        pipe_connector.return_value.mod_config.assert_called_once_with(
+            {'ACL_RULE': {('DATAACL', 'RULE_1'): None, ('DATAACL', 'RULE_2'): None}})
 
 
 class TestMasicAclLoader(object):
@@ -363,3 +580,15 @@ class TestMasicAclLoader(object):
         acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input/incremental_2.json'))
         acl_loader.incremental_update()
         assert acl_loader.rules_info[(('NTP_ACL', 'RULE_1'))]["PACKET_ACTION"] == "DROP"
+
+    def test_full_update__all_namespaces(self, acl_loader):
+        acl_loader.rules_db_info = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'}}
+        acl_loader.rules_info = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'}}
+        with mock.patch('acl_loader.main.ConfigDBPipeConnector') as pipe_connector:
+            acl_loader.full_update()
+
+        assert pipe_connector.call_args_list == [mock.call(), mock.call(namespace='asic0'),
+                                                 mock.call(namespace='asic1')]
+        # The rule is deleted and added again in every namespace
+        assert pipe_connector.return_value.mod_config.call_count == 6
+        pipe_connector.return_value.mod_config.assert_called_with({'ACL_RULE': acl_loader.rules_info})
@@ -0,0 +1,85 @@
+"""
+Measures the time taken by aclshow to read and display the counters of a large number of ACL rules, on a
+synthetic CONFIG_DB and COUNTERS_DB held by the mock redis of the unit tests. Run it from the repository root:
+
+    python3 -m tests.aclshow_benchmark [--rules 50000] [--tables 10] [--runs 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from unittest import mock
+
+from tabulate import tabulate
+
+from utilities_common.general import load_module_from_source
+
+from .mock_tables import dbconnector
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+scripts_path = os.path.join(os.path.dirname(test_path), "scripts")
+aclshow = load_module_from_source('aclshow', os.path.join(scripts_path, 'aclshow'))
+
+
+def populate_rules(num_rules, num_tables):
+    db = dbconnector.SonicV2Connector(use_unix_socket_path=False)
+    db.connect(db.CONFIG_DB)
+    db.connect(db.COUNTERS_DB)
+    for index in range(num_rules):
+        table = "BENCH_{}".format(index % num_tables)
+        rule = "RULE_{}".format(index)
+        oid = "oid:0x9{:015x}".format(index)
+        db.hmset(db.CONFIG_DB, "ACL_RULE|{}|{}".format(table, rule),
+                 {"PRIORITY": str(10000 - index % 10000), "PACKET_ACTION": "FORWARD"})
+        db.set(db.COUNTERS_DB, aclshow.ACL_COUNTER_RULE_MAP, table + ":" + rule, oid)
+        db.hmset(db.COUNTERS_DB, aclshow.COUNTERS + ":" + oid,
+                 {aclshow.COUNTER_PACKETS_ATTR: str(index + 1), aclshow.COUNTER_BYTES_ATTR: str(index * 100)})
+    return db
+
+
+def run_aclshow(db, rules=None, tables=None, display_all=False, clear=False):
+    with mock.patch.object(aclshow, 'SonicV2Connector', return_value=db), contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        acls = aclshow.AclStat(rules, tables)
+        acls.redis_acl_read(False)
+        if clear:
+            acls.clear_counters()
+        else:
+            acls.previous_counters()
+            acls.display_acl_stat(display_all)
+        duration = time.perf_counter() - start
+    return duration, acls.counters_reader.round_trips + acls.config_reader.round_trips
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark aclshow on a synthetic COUNTERS_DB")
+    parser.add_argument('--rules', type=int, default=50000, help='Number of ACL rules')
+    parser.add_argument('--tables', type=int, default=10, help='Number of ACL tables the rules are spread in')
+    parser.add_argument('--runs', type=int, default=3, help='Number of runs per command, the fastest is reported')
+    args = parser.parse_args()
+
+    db = populate_rules(args.rules, args.tables)
+    commands = [
+        ('aclshow -a', {'display_all': True}),
+        ('aclshow -t BENCH_0', {'tables': 'BENCH_0'}),
+        ('aclshow -r RULE_1', {'rules': 'RULE_1'}),
+        ('aclshow -c', {'clear': True}),
+        ('aclshow -a (after clear)', {'display_all': True}),
+    ]
+
+    body = []
+    with tempfile.TemporaryDirectory() as directory, \
+            mock.patch.object(aclshow, 'COUNTERS_CACHE', os.path.join(directory, 'aclstat')):
+        for command, kwargs in commands:
+            results = [run_aclshow(db, **kwargs) for _ in range(args.runs)]
+            duration, round_trips = min(results)
+            body.append([command, round_trips, f"{duration:.3f}"])
+
+    print(tabulate(body, ['Command', 'Bulk reads', 'Secs']))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ import sys
 from io import StringIO
 from unittest import mock
 
+from utilities_common.counter_snapshot import SNAPSHOT_MAGIC
 from utilities_common.general import load_module_from_source
 
 test_path = os.path.dirname(os.path.abspath(__file__))
@@ -319,3 +320,31 @@ def test_clear_and_populate_counters_db():
     with mock.patch('aclshow.SonicV2Connector', return_value=conn):
         test = Aclshow(nullify_on_start, nullify_on_exit, all=True, clear=False, rules=None, tables=None, verbose=None)
     assert test.result.getvalue() == all_after_clear_and_populate_output
+
+
+def test_clear_saves_snapshot():
+    test = Aclshow(True, False, all=True, clear=True, rules=None, tables=None, verbose=None)
+    assert test.result.getvalue() == clear_output
+    with open(aclshow.COUNTERS_CACHE, 'rb') as fp:
+        assert fp.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+
+    test = Aclshow(False, True, all=True, clear=False, rules=None, tables=None, verbose=None)
+    assert test.result.getvalue() == all_after_clear_output
+
+
+def test_filtered_counters_read():
+    acls = aclshow.AclStat('RULE_1,RULE_6', 'DATAACL')
+    acls.redis_acl_read(False)
+
+    assert list(acls.acl_rules) == [('DATAACL', 'RULE_1')]
+    assert list(acls.acl_counters) == [('DATAACL', 'RULE_1')]
+    # One HMGET on ACL_COUNTER_RULE_MAP, and one pipelined read of the counters
+    assert acls.counters_reader.round_trips == 2
+
+
+def test_table_name_key_pattern_escaped():
+    acls = aclshow.AclStat(None, 'DATA*')
+    with mock.patch.object(acls.db, 'keys', return_value=[]) as mock_keys:
+        acls.redis_acl_read(False)
+
+    mock_keys.assert_called_once_with(acls.db.CONFIG_DB, 'ACL_RULE|DATA\\*|*')
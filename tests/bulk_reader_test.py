@@ -0,0 +1,145 @@
+import math
+from unittest import mock
+
+import pytest
+
+from utilities_common.db import Db
+from utilities_common.bulk_reader import BulkReader, get_counters_and_rates, BULK_READ_BATCH_SIZE
+
+
+def populate_ports(db, num_ports):
+    name_map = {}
+    for index in range(num_ports):
+        port = "EthernetBulk{}".format(index)
+        oid = "oid:0x10000{:08x}".format(index)
+        name_map[port] = oid
+        db.set(db.COUNTERS_DB, "COUNTERS:" + oid, "SAI_PORT_STAT_IF_IN_ERRORS", str(index))
+        db.set(db.COUNTERS_DB, "RATES:" + oid, "RX_BPS", str(index * 10))
+    return name_map
+
+
+class TestBulkReader(object):
+
+    @classmethod
+    def setup_class(cls):
+        print("SETUP")
+
+    @pytest.mark.parametrize("num_ports", [64, 256, 1024])
+    def test_get_counters_and_rates(self, num_ports):
+        db = Db().db
+        name_map = populate_ports(db, num_ports)
+
+        reader = BulkReader(db, db.COUNTERS_DB)
+        counters, rates = get_counters_and_rates(db, name_map, reader=reader)
+
+        for port, oid in name_map.items():
+            assert counters[port] == db.get_all(db.COUNTERS_DB, "COUNTERS:" + oid)
+            assert rates[port] == db.get_all(db.COUNTERS_DB, "RATES:" + oid)
+        # One pipelined request per batch instead of one request per hash
+        assert reader.round_trips == math.ceil(num_ports * 2 / BULK_READ_BATCH_SIZE)
+
+    def test_get_counters_only(self):
+        db = Db().db
+        name_map = populate_ports(db, 4)
+
+        reader = BulkReader(db, db.COUNTERS_DB)
+        counters, rates = get_counters_and_rates(db, name_map, with_rates=False, reader=reader)
+
+        assert len(counters) == 4
+        assert rates == {}
+        assert reader.round_trips == 1
+
+    def test_missing_keys(self):
+        db = Db().db
+        reader = BulkReader(db, db.COUNTERS_DB)
+        counters, rates = get_counters_and_rates(db, {"EthernetMissing": "oid:0xdeadbeef"}, reader=reader)
+        assert counters == {"EthernetMissing": {}}
+        assert rates == {"EthernetMissing": {}}
+
+    def test_no_pipeline_fallback(self):
+        db = Db().db
+        name_map = populate_ports(db, 8)
+
+        reader = BulkReader(db, db.COUNTERS_DB)
+        with mock.patch.object(reader, "_get_pipeline", return_value=None):
+            counters, rates = get_counters_and_rates(db, name_map, reader=reader)
+
+        for port, oid in name_map.items():
+            assert counters[port] == db.get_all(db.COUNTERS_DB, "COUNTERS:" + oid)
+            assert rates[port] == db.get_all(db.COUNTERS_DB, "RATES:" + oid)
+        assert reader.round_trips == 16
+
+    def test_unix_socket_client(self):
+        db = Db().db
+        name_map = populate_ports(db, 8)
+        client = db.get_redis_client(db.COUNTERS_DB)
+        # swsscommon DBConnector has no pipeline()
+        swss_client = mock.Mock(spec=["getNamespace", "getDbId"])
+        swss_client.getNamespace.return_value = ""
+        swss_client.getDbId.return_value = 2
+
+        reader = BulkReader(db, db.COUNTERS_DB)
+        with mock.patch.object(db, "get_redis_client", return_value=swss_client), \
+                mock.patch("utilities_common.bulk_reader.SonicDBConfig.getDbSock",
+                           return_value="/var/run/redis/redis.sock") as mock_get_db_sock, \
+                mock.patch("utilities_common.bulk_reader.redis.Redis", return_value=client) as mock_redis:
+            counters, rates = get_counters_and_rates(db, name_map, reader=reader)
+            fields = reader.get_fields("COUNTERS:" + name_map["EthernetBulk1"], ["SAI_PORT_STAT_IF_IN_ERRORS"])
+
+        mock_get_db_sock.assert_called_once_with(db.COUNTERS_DB, "")
+        mock_redis.assert_called_once_with(unix_socket_path="/var/run/redis/redis.sock", db=2, decode_responses=True)
+        for port, oid in name_map.items():
+            assert counters[port] == db.get_all(db.COUNTERS_DB, "COUNTERS:" + oid)
+            assert rates[port] == db.get_all(db.COUNTERS_DB, "RATES:" + oid)
+        assert fields == {"SAI_PORT_STAT_IF_IN_ERRORS": "1"}
+        assert reader.round_trips == 2
+
+    def test_scan_keys(self):
+        db = Db().db
+        populate_ports(db, 300)
+
+        reader = BulkReader(db, db.COUNTERS_DB)
+        keys = list(reader.scan_keys("RATES:oid:0x10000*", count=100))
+        assert sorted(keys) == sorted(db.keys(db.COUNTERS_DB, "RATES:oid:0x10000*"))
+        assert len(keys) == 300
+        # SCAN walks the keyspace in several requests instead of one KEYS
+        assert reader.round_trips > 1
+
+        with mock.patch.object(db, "get_redis_client", return_value=object()):
+            reader = BulkReader(db, db.COUNTERS_DB)
+            assert sorted(reader.scan_keys("RATES:oid:0x10000*")) == sorted(keys)
+            assert reader.round_trips == 1
+
+    def test_iter_all(self):
+        db = Db().db
+        name_map = populate_ports(db, 20)
+        keys = ("COUNTERS:" + oid for oid in name_map.values())
+
+        reader = BulkReader(db, db.COUNTERS_DB, batch_size=8)
+        for count, (key, value) in enumerate(reader.iter_all(keys), 1):
+            assert value == db.get_all(db.COUNTERS_DB, key)
+            # Batches are read as the iteration goes
+            assert reader.round_trips == math.ceil(count / 8)
+        assert count == 20
+
+    def test_get_fields(self):
+        db = Db().db
+        name_map = populate_ports(db, 20)
+        for port, oid in name_map.items():
+            db.set(db.COUNTERS_DB, "COUNTERS_BULK_NAME_MAP", port, oid)
+        ports = ["EthernetBulk{}".format(index) for index in range(0, 20, 2)] + ["EthernetMissing"]
+
+        reader = BulkReader(db, db.COUNTERS_DB, batch_size=4)
+        fields = reader.get_fields("COUNTERS_BULK_NAME_MAP", ports)
+
+        assert fields == {port: name_map[port] for port in ports[:-1]}
+        assert reader.round_trips == 3
+
+        with mock.patch.object(db, "get_redis_client", return_value=object()):
+            reader = BulkReader(db, db.COUNTERS_DB, batch_size=4)
+            assert reader.get_fields("COUNTERS_BULK_NAME_MAP", ports) == fields
+            assert reader.round_trips == 1
+
+    @classmethod
+    def teardown_class(cls):
+        print("TEARDOWN")
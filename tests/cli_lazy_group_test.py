@@ -0,0 +1,146 @@
+import sys
+
+import click
+from click.testing import CliRunner
+from unittest import mock
+
+import utilities_common.cli as clicommon
+
+
+@click.command()
+def lazy():
+    """Lazy command"""
+    click.echo("lazy")
+
+
+@click.command()
+def plugin():
+    """Plugin command"""
+    click.echo("plugin")
+
+
+def create_cli():
+    @click.group(cls=clicommon.AbbreviationGroup)
+    def cli():
+        pass
+
+    @cli.group(cls=clicommon.AliasedGroup)
+    def eager():
+        pass
+
+    return cli
+
+
+class TestLazyGroup(object):
+    def test_lazy_command__imported_when_resolved(self):
+        cli = create_cli()
+        with mock.patch('utilities_common.cli.importlib.import_module',
+                        return_value=sys.modules[__name__]) as import_module:
+            cli.add_lazy_commands({'lazy': 'tests.cli_lazy_group_test:lazy'})
+            import_module.assert_not_called()
+
+            result = CliRunner().invoke(cli, ['lazy'])
+
+        import_module.assert_called_once_with('tests.cli_lazy_group_test')
+        assert result.exit_code == 0
+        assert result.output == "lazy\n"
+
+    def test_lazy_command__abbreviation(self):
+        cli = create_cli()
+        cli.add_lazy_command('lazy', lambda: lazy)
+
+        result = CliRunner().invoke(cli, ['la'])
+
+        assert result.exit_code == 0
+        assert result.output == "lazy\n"
+
+    def test_lazy_command__condition_false__not_registered(self):
+        cli = create_cli()
+        cli.add_lazy_command('lazy', lambda: lazy, condition=lambda: False)
+
+        result = CliRunner().invoke(cli, ['--help'])
+
+        assert result.exit_code == 0
+        assert "eager" in result.output
+        assert "lazy" not in result.output
+        assert 'lazy' not in cli.commands
+
+    def test_lazy_command__returns_none__not_registered(self):
+        cli = create_cli()
+        cli.add_lazy_command('lazy', lambda: None)
+
+        result = CliRunner().invoke(cli, ['lazy'])
+
+        assert result.exit_code != 0
+        assert list(cli.commands) == ['eager']
+
+    def test_commands_loader__run_once_for_unknown_command(self):
+        cli = create_cli()
+        loader = mock.Mock(side_effect=lambda: cli.add_command(plugin))
+        cli.add_commands_loader(loader)
+
+        result = CliRunner().invoke(cli, ['plugin'])
+        assert 'plugin' in cli.commands
+
+        loader.assert_called_once_with()
+        assert result.exit_code == 0
+        assert result.output == "plugin\n"
+
+    def test_commands_loader__not_run_for_registered_command(self):
+        cli = create_cli()
+        loader = mock.Mock()
+        cli.add_lazy_command('lazy', lambda: lazy)
+        cli.add_commands_loader(loader)
+
+        result = CliRunner().invoke(cli, ['lazy'])
+
+        loader.assert_not_called()
+        assert result.output == "lazy\n"
+
+    def test_commands_loader__run_for_group(self):
+        cli = create_cli()
+        cli.add_commands_loader(lambda: cli.commands['eager'].add_command(plugin))
+
+        result = CliRunner().invoke(cli, ['eager', 'plugin'])
+
+        assert result.exit_code == 0
+        assert result.output == "plugin\n"
+
+    def test_commands_loader__run_for_lazy_group(self):
+        cli = create_cli()
+
+        @click.group(cls=clicommon.AliasedGroup)
+        def platform():
+            pass
+
+        cli.add_lazy_command('platform', lambda: platform)
+        cli.add_commands_loader(lambda: cli.commands['platform'].add_command(plugin))
+
+        result = CliRunner().invoke(cli, ['platform', 'plugin'])
+
+        assert result.exit_code == 0
+        assert result.output == "plugin\n"
+
+    def test_commands_loader__run_when_listing_commands(self):
+        cli = create_cli()
+        cli.add_commands_loader(lambda: cli.add_command(plugin))
+
+        result = CliRunner().invoke(cli, ['--help'])
+
+        assert result.exit_code == 0
+        assert "Plugin command" in result.output
+
+    def test_load_and_register_plugins__lazy(self):
+        from utilities_common.util_base import UtilHelper
+        cli = create_cli()
+        helper = UtilHelper()
+        plugins = mock.Mock()
+        with mock.patch.object(helper, 'load_plugins', return_value=[mock.Mock()]) as load_plugins, \
+                mock.patch.object(helper, 'register_plugin') as register_plugin:
+            helper.load_and_register_plugins(plugins, cli, lazy=True)
+            load_plugins.assert_not_called()
+
+            assert 'plugin' not in cli.commands
+
+        load_plugins.assert_called_once_with(plugins)
+        register_plugin.assert_called_once_with(load_plugins.return_value[0], cli)
@@ -0,0 +1,76 @@
+"""
+Measures the startup time of each top-level command of the show and config CLIs, that is the time taken by
+a new python process to import the CLI and print the help of the command. Run it on a SONiC device or a build
+environment from the repository root:
+
+    python3 -m tests.cli_startup_benchmark [--clis show config] [--commands interfaces vlan] [--runs 3]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+from tabulate import tabulate
+
+CLIS = {
+    'show': 'show.main',
+    'config': 'config.main',
+}
+
+COMMAND_SCRIPT = """
+import sys
+from click.testing import CliRunner
+import {module} as cli_module
+sys.exit(CliRunner().invoke(cli_module.{group}, sys.argv[1:]).exit_code)
+"""
+
+LIST_SCRIPT = """
+import {module} as cli_module
+print('\\n'.join(cli_module.{group}.list_commands(None)))
+"""
+
+
+def run_script(script, args=()):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', script] + list(args), stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, text=True)
+    return result, time.perf_counter() - start
+
+
+def list_commands(cli):
+    group = 'cli' if cli == 'show' else 'config'
+    result, _ = run_script(LIST_SCRIPT.format(module=CLIS[cli], group=group))
+    return result.stdout.split()
+
+
+def benchmark_command(cli, args, runs):
+    group = 'cli' if cli == 'show' else 'config'
+    script = COMMAND_SCRIPT.format(module=CLIS[cli], group=group)
+    durations = []
+    for _ in range(runs):
+        result, duration = run_script(script, args)
+        durations.append(duration)
+    return result.returncode, min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the startup time of the show and config commands")
+    parser.add_argument('--clis', nargs='+', choices=list(CLIS), default=list(CLIS), help='CLIs to benchmark')
+    parser.add_argument('--commands', nargs='+', help='Top-level commands to benchmark, all of them by default')
+    parser.add_argument('--runs', type=int, default=3, help='Number of runs per command, the fastest is reported')
+    args = parser.parse_args()
+
+    body = []
+    for cli in args.clis:
+        returncode, duration = benchmark_command(cli, ['--help'], args.runs)
+        body.append([cli, '--help', returncode, f"{duration:.3f}"])
+        for command in args.commands or list_commands(cli):
+            returncode, duration = benchmark_command(cli, [command, '--help'], args.runs)
+            body.append([cli, command, returncode, f"{duration:.3f}"])
+
+    print(tabulate(body, ['CLI', 'Command', 'Exit code', 'Secs']))
+
+
+if __name__ == '__main__':
+    main()
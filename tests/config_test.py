@@ -10,6 +10,7 @@ import sys
 import unittest
 import ipaddress
 import shutil
+import tempfile
 from unittest import mock
 from jsonpatch import JsonPatchConflict
 
@@ -1341,6 +1342,24 @@ class TestGenericUpdateCommands(unittest.TestCase):
         mock_generic_updater.apply_patch.assert_called_once()
         mock_generic_updater.apply_patch.assert_has_calls([expected_call_with_non_default_values])
 
+    @patch('config.main.validate_patch', mock.Mock(return_value=True))
+    def test_apply_patch__incremental_validation__passed_to_generic_updater(self):
+        # Arrange
+        mock_generic_updater = mock.Mock()
+        with mock.patch('config.main.GenericUpdater', return_value=mock_generic_updater) as mock_generic_updater_class:
+            with mock.patch('builtins.open', mock.mock_open(read_data=self.any_patch_as_text)):
+
+                # Act
+                result = self.runner.invoke(config.config.commands["apply-patch"],
+                                            [self.any_path, "--incremental-validation"],
+                                            catch_exceptions=False)
+
+        # Assert
+        self.assertEqual(0, result.exit_code)
+        mock_generic_updater_class.assert_called_once_with(namespace=multi_asic.DEFAULT_NAMESPACE,
+                                                           incremental_validation=True)
+        mock_generic_updater.apply_patch.assert_called_once()
+
     @patch('config.main.validate_patch', mock.Mock(return_value=True))
     def test_apply_patch__exception_thrown__error_displayed_error_code_returned(self):
         # Arrange
@@ -1468,6 +1487,22 @@ class TestGenericUpdateCommands(unittest.TestCase):
         mock_generic_updater.replace.assert_called_once()
         mock_generic_updater.replace.assert_has_calls([expected_call_with_non_default_values])
 
+    def test_replace__incremental_validation__passed_to_generic_updater(self):
+        # Arrange
+        mock_generic_updater = mock.Mock()
+        with mock.patch('config.main.GenericUpdater', return_value=mock_generic_updater) as mock_generic_updater_class:
+            with mock.patch('builtins.open', mock.mock_open(read_data=self.any_target_config_as_text)):
+
+                # Act
+                result = self.runner.invoke(config.config.commands["replace"],
+                                            [self.any_path, "--incremental-validation"],
+                                            catch_exceptions=False)
+
+        # Assert
+        self.assertEqual(0, result.exit_code)
+        mock_generic_updater_class.assert_called_once_with(incremental_validation=True)
+        mock_generic_updater.replace.assert_called_once()
+
     def test_replace__exception_thrown__error_displayed_error_code_returned(self):
         # Arrange
         unexpected_exit_code = 0
@@ -1589,6 +1624,21 @@ class TestGenericUpdateCommands(unittest.TestCase):
         mock_generic_updater.rollback.assert_called_once()
         mock_generic_updater.rollback.assert_has_calls([expected_call_with_non_default_values])
 
+    def test_rollback__incremental_validation__passed_to_generic_updater(self):
+        # Arrange
+        mock_generic_updater = mock.Mock()
+        with mock.patch('config.main.GenericUpdater', return_value=mock_generic_updater) as mock_generic_updater_class:
+
+            # Act
+            result = self.runner.invoke(config.config.commands["rollback"],
+                                        [self.any_checkpoint_name, "--incremental-validation"],
+                                        catch_exceptions=False)
+
+        # Assert
+        self.assertEqual(0, result.exit_code)
+        mock_generic_updater_class.assert_called_once_with(incremental_validation=True)
+        mock_generic_updater.rollback.assert_called_once()
+
     def test_rollback__exception_thrown__error_displayed_error_code_returned(self):
         # Arrange
         unexpected_exit_code = 0
@@ -2992,6 +3042,42 @@ class TestApplyPatchMultiAsic(unittest.TestCase):
                     # Ensure ConfigDBConnector was never instantiated or called
                     mock_config_db_connector.assert_not_called()
 
+    @patch('config.main.validate_patch', mock.Mock(return_value=True))
+    @patch('config.main.ConfigWrapper', mock.Mock())
+    def test_apply_patch_parallel_multiasic(self):
+        def create_generic_updater(namespace):
+            generic_updater = MagicMock()
+            if namespace == "asic1":
+                generic_updater.apply_patch.side_effect = Exception("asic1 failure")
+            return generic_updater
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            patch_file_path = os.path.join(tmp_dir, "patch.json")
+            with open(patch_file_path, "w") as f:
+                json.dump(self.patch_content, f)
+
+            with patch('config.main.GenericUpdater', mock.Mock(side_effect=lambda namespace: MagicMock())):
+                result = self.runner.invoke(config.config.commands["apply-patch"],
+                                            [patch_file_path, "--parallel", "--verbose"],
+                                            catch_exceptions=False)
+
+            print("Exit Code: {}, output: {}".format(result.exit_code, result.output))
+            self.assertEqual(result.exit_code, 0, "Command should succeed")
+            self.assertIn("Patch applied successfully.", result.output)
+            for scope in ["localhost", "asic0", "asic1"]:
+                self.assertIn("Scope {}: succeeded in".format(scope), result.output)
+
+            # Failures of the workers are aggregated as in sequential mode
+            with patch('config.main.GenericUpdater', mock.Mock(side_effect=create_generic_updater)):
+                result = self.runner.invoke(config.config.commands["apply-patch"],
+                                            [patch_file_path, "--parallel"],
+                                            catch_exceptions=True)
+
+            print("Exit Code: {}, output: {}".format(result.exit_code, result.output))
+            self.assertNotEqual(result.exit_code, 0, "Command should fail")
+            self.assertIn("Failed to apply patch on the following scopes:\n- asic1: asic1 failure", result.output)
+            self.assertNotIn("- asic0", result.output)
+
     @patch('config.main.subprocess.Popen')
     @patch('config.main.SonicYangCfgDbGenerator.validate_config_db_json', mock.Mock(return_value=True))
     def test_apply_patch_validate_patch_multiasic(self, mock_subprocess_popen):
@@ -0,0 +1,83 @@
+import datetime
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+from utilities_common.cli import json_serial
+from utilities_common.counter_snapshot import dump_snapshot, load_snapshot, CounterSnapshot, SNAPSHOT_MAGIC
+
+
+def build_cnstat_dict():
+    cnstat_dict = OrderedDict()
+    cnstat_dict['time'] = datetime.datetime(2023, 1, 1, 12, 0, 0)
+    cnstat_dict['Ethernet0'] = OrderedDict(
+        [('queueindex', '0'), ('queuetype', 'UC'), ('totalpacket', '18446744073709551613'),
+         ('totalbytes', 'N/A'), ('droppacket', '0')])
+    cnstat_dict['Ethernet4'] = OrderedDict(
+        [('queueindex', '1'), ('queuetype', 'MC'), ('totalpacket', '12'),
+         ('totalbytes', '0012'), ('droppacket', '7')])
+    cnstat_dict['Ethernet8'] = OrderedDict([('queueindex', '2')])
+    return cnstat_dict
+
+
+def as_json(cnstat_dict):
+    return json.loads(json.dumps(cnstat_dict, default=json_serial))
+
+
+def snapshot_as_json(snapshot):
+    return {key: (dict(value) if key != 'time' else value) for key, value in snapshot.items()}
+
+
+class TestCounterSnapshot(object):
+    def setup_method(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'portstat')
+
+    def teardown_method(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        cnstat_dict = build_cnstat_dict()
+        dump_snapshot(cnstat_dict, self.path)
+
+        snapshot = load_snapshot(self.path)
+        assert isinstance(snapshot, CounterSnapshot)
+        # The snapshot reads back the same content as the JSON baseline did
+        assert snapshot_as_json(snapshot) == as_json(cnstat_dict)
+        assert snapshot.get('time') == '2023-01-01T12:00:00'
+        assert snapshot['Ethernet0']['totalbytes'] == 'N/A'
+        assert snapshot['Ethernet4']['totalbytes'] == '0012'
+        assert 'totalpacket' not in snapshot['Ethernet8']
+        assert snapshot.get('Ethernet12') is None
+        assert list(snapshot) == ['time', 'Ethernet0', 'Ethernet4', 'Ethernet8']
+
+    def test_json_migration(self):
+        cnstat_dict = build_cnstat_dict()
+        with open(self.path, 'w') as f:
+            json.dump(cnstat_dict, f, default=json_serial)
+
+        # Old JSON baseline is loaded as is and converted in place
+        data = load_snapshot(self.path)
+        assert data == as_json(cnstat_dict)
+        with open(self.path, 'rb') as f:
+            assert f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+
+        snapshot = load_snapshot(self.path)
+        assert snapshot_as_json(snapshot) == as_json(cnstat_dict)
+
+    def test_update_snapshot(self):
+        dump_snapshot(build_cnstat_dict(), self.path)
+
+        data = dict(load_snapshot(self.path))
+        data['Ethernet4'] = {'queueindex': '1', 'totalpacket': '100'}
+        dump_snapshot(data, self.path)
+
+        snapshot = load_snapshot(self.path)
+        assert dict(snapshot['Ethernet4']) == {'queueindex': '1', 'totalpacket': '100'}
+        assert snapshot['Ethernet0']['queuetype'] == 'UC'
+
+    def test_empty(self):
+        dump_snapshot({'time': '2023-01-01T12:00:00'}, self.path)
+        snapshot = load_snapshot(self.path)
+        assert dict(snapshot) == {'time': '2023-01-01T12:00:00'}
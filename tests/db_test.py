@@ -0,0 +1,60 @@
+import os
+import sys
+from unittest import mock
+
+from .mock_tables import dbconnector
+
+import utilities_common.db as db_module
+from utilities_common.db import Db
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+modules_path = os.path.dirname(test_path)
+sys.path.insert(0, modules_path)
+
+
+class TestDb(object):
+    def setup_method(self):
+        del db_module.opened_connections[:]
+
+    def test_init__no_connection(self):
+        with mock.patch.object(dbconnector.SonicV2Connector, 'connect') as mock_connect, \
+                mock.patch.object(dbconnector.ConfigDBConnector, 'connect') as mock_cfgdb_connect:
+            Db()
+
+        mock_connect.assert_not_called()
+        mock_cfgdb_connect.assert_not_called()
+        assert db_module.opened_connections == []
+
+    def test_db__connects_on_first_access(self):
+        db = Db()
+
+        assert db.db.get_all(db.db.APPL_DB, 'PORT_TABLE:Ethernet0')
+        assert db.db.keys(db.db.APPL_DB, 'PORT_TABLE:*')
+        assert db.db.get(db.db.STATE_DB, 'PORT_TABLE|Ethernet0', 'speed') == '100000'
+
+        assert db.db.connected_dbs == {'APPL_DB', 'STATE_DB'}
+        assert db_module.opened_connections == [('', 'APPL_DB'), ('', 'STATE_DB')]
+
+    def test_cfgdb__created_once(self):
+        db = Db()
+
+        assert db.cfgdb is db.cfgdb
+        assert db.cfgdb is db.cfgdb_clients['']
+        assert db.get_data('PORT', 'Ethernet0')
+        assert db_module.opened_connections == [('', 'CONFIG_DB')]
+
+    def test_clients__single_asic(self):
+        db = Db()
+
+        assert list(db.cfgdb_clients) == ['']
+        assert list(db.db_clients) == ['']
+        assert db.cfgdb_clients.get('asic0') is None
+        assert db_module.opened_connections == []
+
+    def test_report_connections(self, capsys):
+        db_module.record_connection('', 'APPL_DB')
+        db_module.record_connection('asic0', 'CONFIG_DB')
+
+        db_module.report_connections()
+
+        assert capsys.readouterr().err == "2 DB connection(s) opened: default/APPL_DB, asic0/CONFIG_DB\n"
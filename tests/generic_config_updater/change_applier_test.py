@@ -1,6 +1,7 @@
 import copy
 import json
 import jsondiff
+import jsonpatch
 import os
 import unittest
 from collections import defaultdict
@@ -9,10 +10,12 @@ from unittest.mock import patch, Mock, call
 import generic_config_updater.change_applier
 import generic_config_updater.services_validator
 import generic_config_updater.gu_common
+from ..mock_tables import dbconnector
 
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 DATA_FILE =  os.path.join(SCRIPT_DIR, "files", "change_applier_test.data.json")
 CONF_FILE =  os.path.join(SCRIPT_DIR, "files", "change_applier_test.conf.json")
+CONFIG_DB_FILE = os.path.join(SCRIPT_DIR, "files", "change_applier_config_db")
 #
 # Datafile is structured as 
 # "running_config": {....}
@@ -73,29 +76,20 @@ def debug_print(msg):
     print(msg)
 
 
-# Mimics os.system call for sonic-cfggen -d --print-data > filename
-def subprocess_Popen_cfggen(cmd, *args, **kwargs):
+# Mimics reading the running config from redis
+def read_config_db(config_db, tables=None):
     global running_config
 
-    # Extract file name from kwargs if 'stdout' is a file object
-    stdout = kwargs.get('stdout')
-    if hasattr(stdout, 'name'):
-        fname = stdout.name
-    else:
-        raise ValueError("stdout is not a file")
-
-    # Write the running configuration to the file specified in stdout
-    with open(fname, "w") as s:
-        json.dump(running_config, s, indent=4)
-    
-    class MockPopen:
-        def __init__(self):
-            self.returncode = 0  # Simulate successful command execution
+    if tables is None:
+        return copy.deepcopy(running_config)
+    return {tbl: copy.deepcopy(running_config[tbl]) for tbl in tables if tbl in running_config}
 
-        def communicate(self):
-            return "", ""  # Simulate empty stdout and stderr
 
-    return MockPopen()
+# mimics set_config, writing the entries one at a time
+#
+def set_config(config_db, entries):
+    for tbl, key, _, data in entries:
+        set_entry(config_db, tbl, key, data)
 
 
 # mimics config_db.set_entry
@@ -131,7 +125,7 @@ def set_entry(config_db, tbl, key, data):
 # mimics JsonChange.apply
 #
 class mock_obj:
-    def apply(self, config):
+    def apply(self, config, in_place=False):
         json_change = json_changes[json_change_index]
 
         update = copy.deepcopy(json_change["update"])
@@ -225,16 +219,18 @@ def vlan_validate(old_cfg, new_cfg, keys):
 
 class TestChangeApplier(unittest.TestCase):
 
-    @patch("generic_config_updater.change_applier.subprocess.Popen")
+    @patch("generic_config_updater.change_applier.read_config_db")
+    @patch("generic_config_updater.change_applier.get_config_db_pipe_connector")
     @patch("generic_config_updater.change_applier.get_config_db")
     @patch("generic_config_updater.change_applier.set_config")
-    def test_change_apply(self, mock_set, mock_db, mock_subprocess_Popen):
+    def test_change_apply(self, mock_set, mock_db, mock_pipe_db, mock_read_config_db):
         global read_data, running_config, json_changes, json_change_index
         global start_running_config
 
-        mock_subprocess_Popen.side_effect = subprocess_Popen_cfggen
+        mock_read_config_db.side_effect = read_config_db
         mock_db.return_value = DB_HANDLE
-        mock_set.side_effect = set_entry
+        mock_pipe_db.return_value = DB_HANDLE
+        mock_set.side_effect = set_config
 
         with open(DATA_FILE, "r") as s:
             read_data = json.load(s)
@@ -283,6 +279,177 @@ class TestChangeApplier(unittest.TestCase):
 
         debug_print("all good for applier")
 
+        # The whole running config is read once, then only the updated tables
+        full_reads = [c for c in mock_read_config_db.call_args_list if len(c[0]) == 1]
+        assert len(full_reads) == 1
+
+        # The keys updated by a change are written at once
+        assert mock_set.call_count <= len(json_changes)
+
+
+class TestChangeApplierRunningConfig(unittest.TestCase):
+    def setUp(self):
+        dbconnector.dedicated_dbs['CONFIG_DB'] = CONFIG_DB_FILE
+
+    def tearDown(self):
+        dbconnector.dedicated_dbs['CONFIG_DB'] = None
+
+    @patch("generic_config_updater.change_applier.ChangeApplier._services_validate", Mock(return_value=0))
+    @patch("subprocess.Popen")
+    def test_apply__multiple_changes__running_config_read_in_process(self, mock_popen):
+        # Arrange
+        applier = generic_config_updater.change_applier.ChangeApplier()
+        changes = [
+            {"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "1500"},
+            {"op": "remove", "path": "/VLAN_MEMBER/Vlan1000|Ethernet4"},
+            {"op": "add", "path": "/VLAN_MEMBER/Vlan1000|Ethernet8", "value": {"tagging_mode": "tagged"}},
+        ]
+        expected = {
+            "PORT": {
+                "Ethernet0": {"admin_status": "up", "lanes": "0,1,2,3", "mtu": "1500"},
+                "Ethernet4": {"admin_status": "up", "lanes": "4,5,6,7", "mtu": "9100"}
+            },
+            "VLAN": {"Vlan1000": {"vlanid": "1000"}},
+            "VLAN_MEMBER": {
+                "Vlan1000|Ethernet0": {"tagging_mode": "untagged"},
+                "Vlan1000|Ethernet8": {"tagging_mode": "tagged"}
+            }
+        }
+
+        # Act
+        with patch.object(applier, "_get_running_config", wraps=applier._get_running_config) as mock_get_running_config:
+            for change in changes:
+                ret = applier.apply(generic_config_updater.gu_common.JsonChange(jsonpatch.JsonPatch([change])))
+                self.assertEqual(0, ret)
+
+        # Assert
+        mock_popen.assert_not_called()
+        mock_get_running_config.assert_called_once()
+        self.assertEqual(expected, applier.running_config)
+        self.assertEqual(expected, generic_config_updater.gu_common.read_config_db(applier.config_db))
+
+    @patch("generic_config_updater.change_applier.ChangeApplier._services_validate", Mock(return_value=0))
+    def test_apply__multiple_keys__written_in_one_transaction(self):
+        # Arrange
+        applier = generic_config_updater.change_applier.ChangeApplier()
+        client = applier.config_db.get_redis_client(applier.config_db.db_name)
+        change = generic_config_updater.gu_common.JsonChange(jsonpatch.JsonPatch([
+            {"op": "remove", "path": "/PORT/Ethernet0/admin_status"},
+            {"op": "replace", "path": "/PORT/Ethernet4/mtu", "value": "1500"},
+            {"op": "remove", "path": "/VLAN_MEMBER/Vlan1000|Ethernet0"},
+            {"op": "add", "path": "/VLAN_MEMBER/Vlan1000|Ethernet8", "value": {}},
+        ]))
+
+        # Act
+        with patch.object(client, "pipeline", wraps=client.pipeline) as mock_pipeline, \
+                patch.object(applier.config_db, "set_entry") as mock_set_entry:
+            self.assertEqual(0, applier.apply(change))
+
+        # Assert
+        mock_pipeline.assert_called_once_with(transaction=True)
+        mock_set_entry.assert_not_called()
+        self.assertEqual({"lanes": "0,1,2,3", "mtu": "9100"}, client.hgetall("PORT|Ethernet0"))
+        self.assertEqual({"admin_status": "up", "lanes": "4,5,6,7", "mtu": "1500"}, client.hgetall("PORT|Ethernet4"))
+        self.assertFalse(client.hgetall("VLAN_MEMBER|Vlan1000|Ethernet0"))
+        self.assertEqual({"NULL": "NULL"}, client.hgetall("VLAN_MEMBER|Vlan1000|Ethernet8"))
+
+    @patch("generic_config_updater.change_applier.ChangeApplier._services_validate", Mock(return_value=0))
+    def test_apply__backend_table_changed_between_changes__read_again(self):
+        # Arrange
+        applier = generic_config_updater.change_applier.ChangeApplier()
+        client = applier.config_db.get_redis_client(applier.config_db.db_name)
+        profile_key = "BUFFER_PROFILE|pg_lossless_100000_5m_profile"
+        client.hmset(profile_key, {"pool": "ingress_lossless_pool", "size": "1248", "xoff": "15000",
+                                   "dynamic_th": "0"})
+        changes = [
+            {"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "1500"},
+            {"op": "replace", "path": "/BUFFER_PROFILE/pg_lossless_100000_5m_profile/dynamic_th", "value": "1"},
+        ]
+
+        # Act
+        self.assertEqual(0, applier.apply(generic_config_updater.gu_common.JsonChange(
+            jsonpatch.JsonPatch([changes[0]]))))
+        # The buffer manager updates the profile after the MTU change
+        client.hmset(profile_key, {"size": "2496", "xoff": "30000"})
+        self.assertEqual(0, applier.apply(generic_config_updater.gu_common.JsonChange(
+            jsonpatch.JsonPatch([changes[1]]))))
+
+        # Assert
+        self.assertEqual({"pool": "ingress_lossless_pool", "size": "2496", "xoff": "30000", "dynamic_th": "1"},
+                         client.hgetall(profile_key))
+        self.assertNotIn("BUFFER_PROFILE", applier.running_config)
+        self.assertEqual("1500", applier.running_config["PORT"]["Ethernet0"]["mtu"])
+
+    @patch("generic_config_updater.change_applier.ChangeApplier._services_validate", Mock(return_value=0))
+    def test_apply__running_config_mismatch__running_config_read_again(self):
+        # Arrange
+        applier = generic_config_updater.change_applier.ChangeApplier()
+        change = generic_config_updater.gu_common.JsonChange(jsonpatch.JsonPatch(
+            [{"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "1500"}]))
+
+        # Act
+        with patch("generic_config_updater.change_applier.set_config"):
+            ret = applier.apply(change)
+
+        # Assert
+        self.assertEqual(-1, ret)
+        self.assertIsNone(applier.running_config)
+
+
+class TestSetConfig(unittest.TestCase):
+    def test_set_config__removed_fields__deleted_in_same_transaction(self):
+        # Arrange
+        config_db = dbconnector.ConfigDBPipeConnector()
+        config_db.connect()
+        client = Mock(spec=["pipeline", "hdel"])
+        pipe = client.pipeline.return_value
+        entries = [
+            ("PORT", "Ethernet0", {"admin_status": "up", "mtu": "9100", "speed": "100000"}, {"mtu": "1500"}),
+            ("PORT", "Ethernet4", None, {"mtu": "9100"}),
+            ("VLAN_MEMBER", ("Vlan1000", "Ethernet0"), {"tagging_mode": "untagged"}, None),
+        ]
+
+        # Act
+        with patch.object(config_db, "mod_config") as mock_mod_config, \
+                patch.object(config_db, "get_redis_client", return_value=client):
+            generic_config_updater.change_applier.set_config(config_db, entries)
+
+        # Assert
+        client.pipeline.assert_called_once_with(transaction=True)
+        self.assertEqual([
+            call.hmset("PORT|Ethernet0", {"mtu": "1500"}),
+            call.hdel("PORT|Ethernet0", "admin_status", "speed"),
+            call.hmset("PORT|Ethernet4", {"mtu": "9100"}),
+            call.delete("VLAN_MEMBER|Vlan1000|Ethernet0"),
+            call.execute()
+        ], pipe.method_calls)
+        client.hdel.assert_not_called()
+        mock_mod_config.assert_not_called()
+
+    def test_set_config__client_without_pipeline__written_with_mod_config(self):
+        # Arrange
+        config_db = dbconnector.ConfigDBPipeConnector()
+        config_db.connect()
+        # swsscommon DBConnector has no pipeline()
+        client = Mock(spec=["hdel"])
+        entries = [
+            ("PORT", "Ethernet0", {"admin_status": "up", "mtu": "9100"}, {"mtu": "1500"}),
+            ("PORT", "Ethernet4", None, {"mtu": "9100"}),
+            ("VLAN_MEMBER", ("Vlan1000", "Ethernet0"), {"tagging_mode": "untagged"}, None),
+        ]
+
+        # Act
+        with patch.object(config_db, "mod_config") as mock_mod_config, \
+                patch.object(config_db, "get_redis_client", return_value=client):
+            generic_config_updater.change_applier.set_config(config_db, entries)
+
+        # Assert
+        mock_mod_config.assert_called_once_with({
+            "PORT": {"Ethernet0": {"mtu": "1500"}, "Ethernet4": {"mtu": "9100"}},
+            "VLAN_MEMBER": {("Vlan1000", "Ethernet0"): None}
+        })
+        client.hdel.assert_called_once_with("PORT|Ethernet0", "admin_status")
+
 
 class TestDryRunChangeApplier(unittest.TestCase):
     def test_apply__calls_apply_change_to_config_db(self):
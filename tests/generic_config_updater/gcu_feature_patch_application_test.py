@@ -26,6 +26,11 @@ def set_entry(config_db, tbl, key, data):
         if not running_config[tbl]:
             running_config.pop(tbl)
 
+
+def set_config(config_db, entries):
+    for tbl, key, _, data in entries:
+        set_entry(config_db, tbl, key, data)
+
 def get_running_config():
     return running_config
 
@@ -99,7 +104,7 @@ class TestFeaturePatchApplication(unittest.TestCase):
         patch = jsonpatch.JsonPatch(data["patch"])
         
         # Test patch applier
-        mock_set.side_effect = set_entry
+        mock_set.side_effect = set_config
         patch_applier = self.create_patch_applier(current_config)
         patch_applier.apply(patch)
         result_config = patch_applier.config_wrapper.get_config_db_as_json()
@@ -391,6 +391,25 @@ class TestGenericUpdateFactory(unittest.TestCase):
         # Act and assert
         self.recursively_test_create_func(options, 0, {}, [], self.validate_create_config_rollbacker)
 
+    def test_create_patch_applier__incremental_validation__used_by_patch_sorter(self):
+        for incremental_validation in [True, False]:
+            for ignore_non_yang_tables in [True, False]:
+                with self.subTest(incremental_validation=incremental_validation,
+                                  ignore_non_yang_tables=ignore_non_yang_tables):
+                    # Arrange
+                    factory = gu.GenericUpdateFactory(incremental_validation=incremental_validation)
+
+                    # Act
+                    patch_applier = factory.create_patch_applier(gu.ConfigFormat.CONFIGDB,
+                                                                 self.any_verbose,
+                                                                 self.any_dry_run,
+                                                                 ignore_non_yang_tables,
+                                                                 [])
+
+                    # Assert
+                    sort_algorithm_factory = patch_applier.patchsorter.inner_patch_sorter.sort_algorithm_factory
+                    self.assertEqual(incremental_validation, sort_algorithm_factory.incremental_validation)
+
     def recursively_test_create_func(self, options, cur_option, params, expected_decorators, create_func):
         if cur_option == len(options):
             create_func(params, expected_decorators)
@@ -523,6 +542,13 @@ class TestGenericUpdater(unittest.TestCase):
         self.any_ignore_non_yang_tables = True
         self.any_ignore_paths = ["", "/ACL_TABLE"]
 
+    def test_ctor__incremental_validation__passed_to_factory(self):
+        # Act
+        generic_updater = gu.GenericUpdater(incremental_validation=True)
+
+        # Assert
+        self.assertTrue(generic_updater.generic_update_factory.incremental_validation)
+
     def test_apply_patch__creates_applier_and_apply(self):
         # Arrange
         patch_applier = Mock()
@@ -1,6 +1,7 @@
 import copy
 import json
 import jsonpatch
+import os
 import sonic_yang
 import unittest
 import mock
@@ -8,20 +9,26 @@ import mock
 from unittest.mock import MagicMock, Mock
 from mock import patch
 from .gutest_helpers import create_side_effect_dict, Files
+from ..mock_tables import dbconnector
 import generic_config_updater.gu_common as gu_common
 
 class TestDryRunConfigWrapper(unittest.TestCase):
-    @patch('generic_config_updater.gu_common.subprocess.Popen')
+    @patch('subprocess.Popen')
     def test_get_config_db_as_json(self, mock_popen):
-        config_wrapper = gu_common.DryRunConfigWrapper()
-        mock_proc = MagicMock()
-        mock_proc.communicate = MagicMock(
-            return_value=('{"PORT": {}, "bgpraw": ""}', None))
-        mock_proc.returncode = 0
-        mock_popen.return_value = mock_proc
-        actual = config_wrapper.get_config_db_as_json()
-        expected = {"PORT": {}}
-        self.assertDictEqual(actual, expected)
+        dbconnector.dedicated_dbs['CONFIG_DB'] = os.path.join(os.path.dirname(__file__), "files",
+                                                              "change_applier_config_db")
+        try:
+            config_wrapper = gu_common.DryRunConfigWrapper()
+            actual = config_wrapper.get_config_db_as_json()
+        finally:
+            dbconnector.dedicated_dbs['CONFIG_DB'] = None
+        self.assertDictEqual({"Ethernet0": {"admin_status": "up", "lanes": "0,1,2,3", "mtu": "9100"},
+                              "Ethernet4": {"admin_status": "up", "lanes": "4,5,6,7", "mtu": "9100"}},
+                             actual["PORT"])
+        self.assertDictEqual({"Vlan1000|Ethernet0": {"tagging_mode": "untagged"},
+                              "Vlan1000|Ethernet4": {"tagging_mode": "untagged"}},
+                             actual["VLAN_MEMBER"])
+        mock_popen.assert_not_called()
 
     def test_get_config_db_as_json__returns_imitated_config_db(self):
         # Arrange
@@ -66,6 +73,19 @@ class TestDryRunConfigWrapper(unittest.TestCase):
             # Assert
             self.assertDictEqual(expected, actual)
 
+    def test_apply_change_to_config_db__previously_returned_config_not_modified(self):
+        # Arrange
+        config_wrapper = gu_common.DryRunConfigWrapper(Files.CONFIG_DB_AS_JSON)
+        old_config = config_wrapper.get_config_db_as_json()
+        change = gu_common.JsonChange(jsonpatch.JsonPatch([{'op': 'remove', 'path': '/VLAN'}]))
+
+        # Act
+        config_wrapper.apply_change_to_config_db(change)
+
+        # Assert
+        self.assertDictEqual(Files.CONFIG_DB_AS_JSON, old_config)
+        self.assertNotIn("VLAN", config_wrapper.get_config_db_as_json())
+
 class TestConfigWrapper(unittest.TestCase):
     def setUp(self):
         self.config_wrapper_mock = gu_common.ConfigWrapper()
@@ -472,6 +492,79 @@ class TestConfigWrapper(unittest.TestCase):
         check(sy1, config_wrapper.sonic_yang_with_loaded_models)
         check(sy2, config_wrapper.sonic_yang_with_loaded_models)
 
+    def test_create_sonic_yang_with_loaded_models__different_config_wrappers__models_loaded_once(self):
+        # Arrange
+        config_wrapper1 = gu_common.ConfigWrapper()
+        config_wrapper2 = gu_common.ConfigWrapper()
+
+        # Act
+        sy1 = config_wrapper1.create_sonic_yang_with_loaded_models()
+        sy2 = config_wrapper2.create_sonic_yang_with_loaded_models()
+
+        # Assert
+        self.assertIsNot(sy1, sy2)
+        self.assertIs(config_wrapper1.sonic_yang_with_loaded_models, config_wrapper2.sonic_yang_with_loaded_models)
+        self.assertIs(sy1.ctx, sy2.ctx)
+
+    def test_get_table_dependencies__yang_models__referenced_tables(self):
+        # Arrange
+        config_wrapper = gu_common.ConfigWrapper()
+
+        # Act
+        actual = config_wrapper.get_table_dependencies()
+
+        # Assert
+        self.assertTrue({"VLAN_MEMBER", "VLAN", "PORT"}.issubset(actual["VLAN_MEMBER"]))
+        self.assertTrue({"ACL_TABLE", "PORT"}.issubset(actual["ACL_TABLE"]))
+        self.assertIn("PORT", actual["PORT"])
+
+    def test_get_table_dependencies__imports_and_augments__referenced_tables(self):
+        # Arrange
+        config_wrapper = gu_common.ConfigWrapper()
+        port_module = {"@name": "sonic-port", "container": {"@name": "sonic-port", "container": {"@name": "PORT"}}}
+        port_xpath = "/port:sonic-port/port:PORT/port:PORT_LIST/port:name"
+        types_module = {"@name": "sonic-types",
+                        "typedef": {"@name": "port-ref",
+                                    "type": {"@name": "leafref", "path": {"@value": port_xpath}}}}
+        vlan_module = {"@name": "sonic-vlan", "import": [{"@module": "sonic-types"}],
+                       "container": {"@name": "sonic-vlan", "container": {"@name": "VLAN",
+                                                                          "description": {"text": "Not a LOOPBACK"}}}}
+        acl_module = {"@name": "sonic-acl", "import": {"@module": "sonic-vlan"},
+                      "augment": {"@target-node": "/port:sonic-port/port:PORT"},
+                      "container": {"@name": "sonic-acl",
+                                    "container": {"@name": "ACL_TABLE",
+                                                  "must": {"@condition": "count(/vlan:sonic-vlan/vlan:VLAN) > 0"}}}}
+        loopback_module = {"@name": "sonic-loopback",
+                           "container": {"@name": "sonic-loopback", "container": {"@name": "LOOPBACK"}}}
+        sy = Mock()
+        sy.confDbYangMap = {
+            "PORT": {"module": "sonic-port", "yangModule": port_module},
+            "VLAN": {"module": "sonic-vlan", "yangModule": vlan_module},
+            "ACL_TABLE": {"module": "sonic-acl", "yangModule": acl_module},
+            "LOOPBACK": {"module": "sonic-loopback", "yangModule": loopback_module},
+            "sonic-types": types_module,
+        }
+        config_wrapper.create_sonic_yang_with_loaded_models = MagicMock(return_value=sy)
+
+        # Act
+        actual = config_wrapper.get_table_dependencies()
+
+        # Assert
+        self.assertEqual({"VLAN", "PORT"}, actual["VLAN"])
+        self.assertEqual({"ACL_TABLE", "VLAN", "PORT"}, actual["ACL_TABLE"])
+        self.assertEqual({"VLAN", "PORT"}, actual["PORT"])
+        self.assertEqual({"LOOPBACK"}, actual["LOOPBACK"])
+
+    def test_get_table_dependencies__unexpected_yang_models__returns_none(self):
+        # Arrange
+        config_wrapper = gu_common.ConfigWrapper()
+        sy = Mock()
+        sy.confDbYangMap = {"PORT": {"unexpected": {}}}
+        config_wrapper.create_sonic_yang_with_loaded_models = MagicMock(return_value=sy)
+
+        # Act and Assert
+        self.assertIsNone(config_wrapper.get_table_dependencies())
+
 class TestPatchWrapper(unittest.TestCase):
     def setUp(self):
         self.config_wrapper_mock = gu_common.ConfigWrapper()
@@ -655,6 +748,191 @@ class TestPatchWrapper(unittest.TestCase):
 
         self.assertTrue(patch_wrapper.verify_same_json(after_update_config_db_cropped, after_update_sonic_yang_as_config_db))
 
+
+class TestRefPathsIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = gu_common.RefPathsIndex()
+        self.index.add("/PORT/Ethernet0", "/VLAN_MEMBER/Vlan1000|Ethernet0")
+        self.index.add("/PORT/Ethernet0", "/ACL_TABLE/DATAACL/ports/0")
+        self.index.add("/PORT/Ethernet4", "/VLAN_MEMBER/Vlan1000|Ethernet4")
+        self.index.add("/PORT/Ethernet40", "/VLAN_MEMBER/Vlan1000|Ethernet40")
+        self.index.add("/VLAN/Vlan1000", "/VLAN_MEMBER/Vlan1000|Ethernet0")
+        self.index.add("/VLAN/Vlan1000", "/VLAN_MEMBER/Vlan1000|Ethernet4")
+        self.index.add("/BUFFER_PROFILE/profile/pool", "/BUFFER_PG/Ethernet0|3/profile")
+
+    def test_find_ref_paths__key__returns_ref_paths(self):
+        self.assertEqual(["/ACL_TABLE/DATAACL/ports/0", "/VLAN_MEMBER/Vlan1000|Ethernet0"],
+                         self.index.find_ref_paths("/PORT/Ethernet0"))
+
+    def test_find_ref_paths__leaf__returns_leaf_ref_paths_only(self):
+        self.assertEqual(["/BUFFER_PG/Ethernet0|3/profile"], self.index.find_ref_paths("/BUFFER_PROFILE/profile/pool"))
+        self.assertEqual([], self.index.find_ref_paths("/BUFFER_PROFILE/profile/size"))
+        self.assertEqual([], self.index.find_ref_paths("/BUFFER_PROFILE/profile/poo"))
+
+    def test_find_ref_paths__table__returns_ref_paths(self):
+        self.assertEqual(["/ACL_TABLE/DATAACL/ports/0",
+                          "/VLAN_MEMBER/Vlan1000|Ethernet0",
+                          "/VLAN_MEMBER/Vlan1000|Ethernet4",
+                          "/VLAN_MEMBER/Vlan1000|Ethernet40"],
+                         self.index.find_ref_paths("/PORT"))
+
+    def test_find_ref_paths__whole_config__returns_all_ref_paths(self):
+        self.assertEqual(["/ACL_TABLE/DATAACL/ports/0",
+                          "/BUFFER_PG/Ethernet0|3/profile",
+                          "/VLAN_MEMBER/Vlan1000|Ethernet0",
+                          "/VLAN_MEMBER/Vlan1000|Ethernet4",
+                          "/VLAN_MEMBER/Vlan1000|Ethernet40"],
+                         self.index.find_ref_paths(""))
+
+    def test_find_ref_paths__no_refs__returns_empty_list(self):
+        self.assertEqual([], self.index.find_ref_paths("/PORT/Ethernet8"))
+        self.assertEqual([], self.index.find_ref_paths("/LOOPBACK_INTERFACE"))
+
+    def test_remove_paths__referenced_path__refs_dropped(self):
+        # Act
+        actual = self.index.remove_paths(["/PORT/Ethernet0", "/BUFFER_PROFILE/profile/pool"])
+
+        # Assert
+        self.assertEqual([], actual.find_ref_paths("/PORT/Ethernet0"))
+        self.assertEqual([], actual.find_ref_paths("/BUFFER_PROFILE"))
+        self.assertEqual(["/VLAN_MEMBER/Vlan1000|Ethernet4", "/VLAN_MEMBER/Vlan1000|Ethernet40"],
+                         actual.find_ref_paths("/PORT"))
+        # The original index is not modified
+        self.assertEqual(["/ACL_TABLE/DATAACL/ports/0", "/VLAN_MEMBER/Vlan1000|Ethernet0"],
+                         self.index.find_ref_paths("/PORT/Ethernet0"))
+
+    def test_remove_paths__referencing_path__refs_dropped(self):
+        # Act
+        actual = self.index.remove_paths(["/VLAN_MEMBER/Vlan1000|Ethernet4"])
+
+        # Assert
+        self.assertEqual([], actual.find_ref_paths("/PORT/Ethernet4"))
+        self.assertEqual(["/VLAN_MEMBER/Vlan1000|Ethernet40"], actual.find_ref_paths("/PORT/Ethernet40"))
+        self.assertEqual(["/VLAN_MEMBER/Vlan1000|Ethernet0"], actual.find_ref_paths("/VLAN/Vlan1000"))
+        self.assertEqual(["/VLAN_MEMBER/Vlan1000|Ethernet0", "/VLAN_MEMBER/Vlan1000|Ethernet4"],
+                         self.index.find_ref_paths("/VLAN/Vlan1000"))
+
+    def test_remove_paths__tables__refs_dropped(self):
+        # Act
+        actual = self.index.remove_paths(["/VLAN_MEMBER", "/ACL_TABLE"])
+
+        # Assert
+        self.assertEqual(["/BUFFER_PG/Ethernet0|3/profile"], actual.find_ref_paths(""))
+
+    def test_remove_paths__whole_config__empty_index(self):
+        self.assertEqual([], self.index.remove_paths([""]).find_ref_paths(""))
+
+
+class TestPathAddressingRefPathsIndexes(unittest.TestCase):
+    def setUp(self):
+        self.path_addressing = gu_common.PathAddressing(gu_common.ConfigWrapper())
+        self.config = {
+            "PORT": {"Ethernet0": {"lanes": "0"}, "Ethernet4": {"lanes": "4"}},
+            "VLAN": {"Vlan1000": {"vlanid": "1000"}},
+            "VLAN_MEMBER": {"Vlan1000|Ethernet0": {"tagging_mode": "untagged"},
+                            "Vlan1000|Ethernet4": {"tagging_mode": "untagged"}},
+        }
+        self.index = gu_common.RefPathsIndex()
+        self.index.add("/PORT/Ethernet0", "/VLAN_MEMBER/Vlan1000|Ethernet0")
+        self.index.add("/PORT/Ethernet4", "/VLAN_MEMBER/Vlan1000|Ethernet4")
+        self.index.add("/VLAN/Vlan1000", "/VLAN_MEMBER/Vlan1000|Ethernet0")
+        self.index.add("/VLAN/Vlan1000", "/VLAN_MEMBER/Vlan1000|Ethernet4")
+        self.path_addressing._build_ref_paths_index = MagicMock(return_value=self.index)
+
+    def test_find_ref_paths__same_config__index_built_once(self):
+        # Act
+        self.path_addressing.find_ref_paths("/PORT/Ethernet0", self.config)
+        actual = self.path_addressing.find_ref_paths("/VLAN/Vlan1000", self.config)
+
+        # Assert
+        self.assertEqual(["/VLAN_MEMBER/Vlan1000|Ethernet0", "/VLAN_MEMBER/Vlan1000|Ethernet4"], actual)
+        self.path_addressing._build_ref_paths_index.assert_called_once_with(self.config)
+
+    def test_find_ref_paths__equal_config__index_reused(self):
+        # Act
+        self.path_addressing.find_ref_paths("/PORT/Ethernet0", self.config)
+        actual = self.path_addressing.find_ref_paths("/PORT/Ethernet0", copy.deepcopy(self.config))
+
+        # Assert
+        self.assertEqual(["/VLAN_MEMBER/Vlan1000|Ethernet0"], actual)
+        self.path_addressing._build_ref_paths_index.assert_called_once()
+
+    def test_find_ref_paths__removed_paths__index_derived(self):
+        # Arrange
+        self.path_addressing.find_ref_paths("", self.config)
+        new_config = dict(self.config)
+        new_config["VLAN_MEMBER"] = {"Vlan1000|Ethernet4": self.config["VLAN_MEMBER"]["Vlan1000|Ethernet4"]}
+
+        # Act
+        actual = self.path_addressing.find_ref_paths("", new_config)
+
+        # Assert
+        self.assertEqual(["/VLAN_MEMBER/Vlan1000|Ethernet4"], actual)
+        self.path_addressing._build_ref_paths_index.assert_called_once()
+
+    def test_find_ref_paths__added_paths__index_built(self):
+        # Arrange
+        self.path_addressing.find_ref_paths("", self.config)
+        new_config = dict(self.config)
+        new_config["PORT"] = dict(self.config["PORT"], Ethernet8={"lanes": "8"})
+
+        # Act
+        self.path_addressing.find_ref_paths("", new_config)
+
+        # Assert
+        self.assertEqual(2, self.path_addressing._build_ref_paths_index.call_count)
+
+    def test_find_ref_paths__modified_value__index_built(self):
+        # Arrange
+        self.path_addressing.find_ref_paths("", self.config)
+        new_config = copy.deepcopy(self.config)
+        new_config["PORT"]["Ethernet0"]["lanes"] = "1"
+
+        # Act
+        self.path_addressing.find_ref_paths("", new_config)
+
+        # Assert
+        self.assertEqual(2, self.path_addressing._build_ref_paths_index.call_count)
+
+    def test_find_ref_paths__config_modified_in_place__index_built(self):
+        # Arrange
+        self.path_addressing.find_ref_paths("", self.config)
+        del self.config["VLAN_MEMBER"]["Vlan1000|Ethernet0"]
+
+        # Act
+        self.path_addressing.find_ref_paths("", self.config)
+
+        # Assert
+        self.assertEqual(2, self.path_addressing._build_ref_paths_index.call_count)
+
+    def test_find_ref_paths__indexed_config_modified_in_place__index_not_derived(self):
+        # Arrange
+        self.path_addressing.find_ref_paths("", self.config)
+        new_config = dict(self.config)
+        del new_config["VLAN"]
+        self.config["VLAN_MEMBER"]["Vlan1000|Ethernet0"]["tagging_mode"] = "tagged"
+
+        # Act
+        self.path_addressing.find_ref_paths("", new_config)
+
+        # Assert
+        self.assertEqual(2, self.path_addressing._build_ref_paths_index.call_count)
+
+    def test_find_ref_paths__indexes_bounded(self):
+        # Arrange
+        self.path_addressing._build_ref_paths_index = MagicMock(side_effect=lambda config: gu_common.RefPathsIndex())
+        configs = [{"PORT": {f"Ethernet{i}": {}}} for i in range(gu_common.PathAddressing.MAX_REF_PATHS_INDEXES + 1)]
+
+        # Act
+        for config in configs:
+            self.path_addressing.find_ref_paths("", config)
+
+        # Assert
+        self.assertEqual(gu_common.PathAddressing.MAX_REF_PATHS_INDEXES,
+                         len(self.path_addressing._ref_paths_indexes))
+        self.assertNotIn(id(configs[0]), self.path_addressing._ref_paths_indexes)
+
+
 class TestPathAddressing(unittest.TestCase):
     def setUp(self):
         self.path_addressing = gu_common.PathAddressing(gu_common.ConfigWrapper())
@@ -884,6 +1162,39 @@ class TestPathAddressing(unittest.TestCase):
         # Assert
         self.assertEqual(expected, actual)
 
+    def test_find_ref_paths__test_corpus__same_as_find_data_dependencies(self):
+        configs = [Files.CROPPED_CONFIG_DB_AS_JSON,
+                   Files.CONFIG_DB_WITH_INTERFACE,
+                   Files.CONFIG_DB_WITH_PORTCHANNEL_AND_ACL,
+                   Files.CONFIG_DB_WITH_LOOPBACK_INTERFACES,
+                   Files.CONFIG_DB_WITH_PROFILE_LIST,
+                   Files.DPB_4_SPLITS_FULL_CONFIG]
+        for config in configs:
+            paths = [""]
+            for table in config:
+                paths.append(self.path_addressing.create_path([table]))
+                for key in config[table]:
+                    paths.append(self.path_addressing.create_path([table, key]))
+
+            for path in paths:
+                with self.subTest(path=path):
+                    self.assertEqual(self.find_ref_paths_by_data_dependencies(path, config),
+                                     self.path_addressing.find_ref_paths(path, config))
+
+    def find_ref_paths_by_data_dependencies(self, path, config):
+        sy = gu_common.ConfigWrapper().create_sonic_yang_with_loaded_models()
+        sy.loadData(copy.deepcopy(config))
+        xpath = self.path_addressing.convert_path_to_xpath(path, config, sy)
+        nodes = sy.root.tree_for() if xpath == "/" else sy.root.find_path(xpath).data()
+
+        ref_paths = set()
+        for node in nodes:
+            for inner_node in node.tree_dfs():
+                if self.path_addressing._is_leaf_node(inner_node):
+                    for ref_xpath in sy.find_data_dependencies(inner_node.path()):
+                        ref_paths.add(self.path_addressing.convert_xpath_to_path(ref_xpath, config, sy))
+        return sorted(ref_paths)
+
     def test_convert_path_to_xpath(self):
         def check(path, xpath, config=None):
             if not config:
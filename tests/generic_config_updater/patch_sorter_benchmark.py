@@ -0,0 +1,214 @@
+"""
+Compares the time taken by the patch sorting algorithms, and the number of changes they generate.
+With --incremental-validation, every algorithm also sorts the patches validating only the tables affected by
+each move, and the speedup over validating the full config is reported.
+Also compares finding the references of each port using SonicYang.find_data_dependencies for each path,
+and using the references index of PathAddressing.
+
+The patches are the success test-cases of files/patch_sorter_test_success.json, and synthetic patches adding
+and removing ports with their VLAN members and ACL table bindings. It needs the YANG models, run it on a
+SONiC device or a build environment from the repository root:
+
+    python3 -m tests.generic_config_updater.patch_sorter_benchmark [--ports 8 32] [--algorithms DFS ASTAR]
+    python3 -m tests.generic_config_updater.patch_sorter_benchmark --incremental-validation
+    python3 -m tests.generic_config_updater.patch_sorter_benchmark --ref-ports 256 1024
+"""
+
+import argparse
+import copy
+import signal
+import time
+
+import jsonpatch
+from tabulate import tabulate
+
+import generic_config_updater.patch_sorter as ps
+from generic_config_updater.gu_common import ConfigWrapper, PatchWrapper, OperationWrapper, PathAddressing
+from .gutest_helpers import Files
+
+
+class SortTimeout(Exception):
+    pass
+
+
+def create_port(index):
+    lanes = ','.join(str(lane) for lane in range(index * 4 + 1, index * 4 + 5))
+    return {
+        "admin_status": "up",
+        "alias": f"fortyGigE0/{index * 4}",
+        "description": f"Servers{index}:eth0",
+        "index": str(index),
+        "lanes": lanes,
+        "mtu": "9100",
+        "speed": "40000"
+    }
+
+
+def create_synthetic_config(ports_count):
+    ports = [f"Ethernet{index * 4}" for index in range(ports_count)]
+    return {
+        "PORT": {port: create_port(index) for index, port in enumerate(ports)},
+        "VLAN": {"Vlan1000": {"vlanid": "1000"}},
+        "VLAN_MEMBER": {f"Vlan1000|{port}": {"tagging_mode": "untagged"} for port in ports},
+        "ACL_TABLE": {
+            "DATAACL": {
+                "policy_desc": "DATAACL",
+                "ports": ports,
+                "stage": "ingress",
+                "type": "L3"
+            }
+        }
+    }
+
+
+def create_references_config(ports_count):
+    """
+    Returns a config where the first half of the ports are PortChannel members, the second half are VLAN members,
+    and all the ports are bound to an ACL table.
+    """
+    config = create_synthetic_config(ports_count)
+    ports = list(config["PORT"])
+    lag_ports, vlan_ports = ports[:ports_count // 2], ports[ports_count // 2:]
+    config["VLAN_MEMBER"] = {f"Vlan1000|{port}": {"tagging_mode": "untagged"} for port in vlan_ports}
+    config["PORTCHANNEL"] = {}
+    config["PORTCHANNEL_MEMBER"] = {}
+    for index, port in enumerate(lag_ports):
+        portchannel = f"PortChannel{index // 2 + 1:04}"
+        config["PORTCHANNEL"][portchannel] = {"admin_status": "up", "min_links": "1", "mtu": "9100", "lacp_key": "auto"}
+        config["PORTCHANNEL_MEMBER"][f"{portchannel}|{port}"] = {}
+    return config
+
+
+def find_ref_paths_by_data_dependencies(path_addressing, path, config):
+    sy = path_addressing.config_wrapper.create_sonic_yang_with_loaded_models()
+    sy.loadData(copy.deepcopy(config))
+    xpath = path_addressing.convert_path_to_xpath(path, config, sy)
+    nodes = sy.root.tree_for() if xpath == "/" else sy.root.find_path(xpath).data()
+
+    ref_paths = set()
+    for node in nodes:
+        for inner_node in node.tree_dfs():
+            if path_addressing._is_leaf_node(inner_node):
+                for ref_xpath in sy.find_data_dependencies(inner_node.path()):
+                    ref_paths.add(path_addressing.convert_xpath_to_path(ref_xpath, config, sy))
+    return sorted(ref_paths)
+
+
+def benchmark_ref_paths(config_wrapper, ports_count):
+    config = create_references_config(ports_count)
+    paths = [PathAddressing().create_path(["PORT", port]) for port in config["PORT"]]
+
+    start = time.perf_counter()
+    expected = [find_ref_paths_by_data_dependencies(PathAddressing(config_wrapper), path, config) for path in paths]
+    data_dependencies_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    path_addressing = PathAddressing(config_wrapper)
+    actual = [path_addressing.find_ref_paths(path, config) for path in paths]
+    index_duration = time.perf_counter() - start
+
+    refs_count = sum(len(ref_paths) for ref_paths in actual)
+    return [ports_count, refs_count, f"{data_dependencies_duration:.2f}", f"{index_duration:.2f}", expected == actual]
+
+
+def create_synthetic_cases(ports_count):
+    """
+    Returns the test-cases adding ports_count ports with their dependencies to a config of ports_count ports,
+    and removing them.
+    """
+    small_config = create_synthetic_config(ports_count)
+    large_config = create_synthetic_config(ports_count * 2)
+    add_patch = jsonpatch.make_patch(small_config, large_config)
+    remove_patch = jsonpatch.make_patch(large_config, small_config)
+    return {
+        f"SYNTHETIC_ADD_{ports_count}_PORTS": {"current_config": small_config, "patch": list(add_patch)},
+        f"SYNTHETIC_REMOVE_{ports_count}_PORTS": {"current_config": large_config, "patch": list(remove_patch)},
+    }
+
+
+def create_patch_sorter(config_wrapper, incremental_validation=False):
+    patch_wrapper = PatchWrapper(config_wrapper)
+    operation_wrapper = OperationWrapper()
+    path_addressing = PathAddressing(config_wrapper)
+    sort_algorithm_factory = ps.SortAlgorithmFactory(operation_wrapper, config_wrapper, path_addressing,
+                                                     incremental_validation)
+    return ps.PatchSorter(config_wrapper, patch_wrapper, sort_algorithm_factory)
+
+
+def raise_timeout(signum, frame):
+    raise SortTimeout()
+
+
+def run_case(config_wrapper, data, algorithm, timeout, incremental_validation=False):
+    current_config = data["current_config"]
+    patch = jsonpatch.JsonPatch(data["patch"])
+    sorter = create_patch_sorter(config_wrapper, incremental_validation)
+
+    signal.signal(signal.SIGALRM, raise_timeout)
+    signal.alarm(timeout)
+    start = time.perf_counter()
+    try:
+        changes = sorter.sort(patch, algorithm, copy.deepcopy(current_config))
+        result = len(changes)
+    except SortTimeout:
+        result = "timeout"
+    except Exception as ex:
+        result = f"error: {type(ex).__name__}"
+    finally:
+        signal.alarm(0)
+    duration = time.perf_counter() - start
+
+    return result, duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the patch sorting algorithms")
+    parser.add_argument('--algorithms', nargs='+', choices=[algorithm.name for algorithm in ps.Algorithm],
+                        default=[algorithm.name for algorithm in ps.Algorithm], help='Algorithms to compare')
+    parser.add_argument('--ports', nargs='*', type=int, default=[4, 16],
+                        help='Number of ports added and removed by the synthetic patches')
+    parser.add_argument('--timeout', type=int, default=300, help='Maximum seconds to sort a single patch')
+    parser.add_argument('--incremental-validation', action='store_true',
+                        help='Also sort the patches with the incremental validation, and report the speedup')
+    parser.add_argument('--ref-ports', nargs='+', type=int,
+                        help='Only compare finding the references of each port of configs with that many ports')
+    args = parser.parse_args()
+
+    if args.ref_ports:
+        body = [benchmark_ref_paths(ConfigWrapper(), ports_count) for ports_count in args.ref_ports]
+        print(tabulate(body, ['Ports', 'References', 'find_data_dependencies secs', 'Index secs', 'Same references']))
+        return
+
+    cases = {name: data for name, data in Files.PATCH_SORTER_TEST_SUCCESS.items() if data["patch"]}
+    for ports_count in args.ports:
+        cases.update(create_synthetic_cases(ports_count))
+
+    config_wrapper = ConfigWrapper()
+    algorithms = [ps.Algorithm[name] for name in args.algorithms]
+    validations = [False, True] if args.incremental_validation else [False]
+    runs = [(algorithm, incremental_validation) for algorithm in algorithms for incremental_validation in validations]
+
+    header = ['Patch', 'Operations'] + \
+        [f"{algorithm.name}{' incremental' if incremental_validation else ''} changes/secs"
+         for algorithm, incremental_validation in runs]
+    body = []
+    totals = [0.0] * len(runs)
+    for name, data in cases.items():
+        row = [name, len(data["patch"])]
+        for index, (algorithm, incremental_validation) in enumerate(runs):
+            result, duration = run_case(config_wrapper, data, algorithm, args.timeout, incremental_validation)
+            totals[index] += duration
+            row.append(f"{result}/{duration:.2f}")
+        body.append(row)
+    body.append(['Total', ''] + [f"{total:.2f}" for total in totals])
+    if args.incremental_validation:
+        # The incremental run of an algorithm directly follows its full validation run
+        speedups = [f"x{full / incremental:.2f}" if incremental else ''
+                    for full, incremental in zip(totals[::2], totals[1::2])]
+        body.append(['Speedup', ''] + [cell for speedup in speedups for cell in ['', speedup]])
+
+    print(tabulate(body, header))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,8 @@
+import copy
 from collections import OrderedDict
 import jsonpatch
 import unittest
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import generic_config_updater.patch_sorter as ps
 from .gutest_helpers import Files, create_side_effect_dict
@@ -81,6 +82,38 @@ class TestDiff(unittest.TestCase):
         # Assert
         self.assertNotEqual(hash1, hash2)
 
+    def test_hash__after_apply_move__same_as_new_diff(self):
+        # Arrange
+        diff = ps.Diff(current_config=Files.CROPPED_CONFIG_DB_AS_JSON, target_config=Files.ANY_CONFIG_DB)
+        move = ps.JsonMove.from_patch(Files.SINGLE_OPERATION_CONFIG_DB_PATCH)
+        hash(diff)
+
+        # Act
+        actual = diff.apply_move(move)
+
+        # Assert
+        expected = ps.Diff(current_config=Files.CONFIG_DB_AFTER_SINGLE_OPERATION, target_config=Files.ANY_CONFIG_DB)
+        self.assertEqual(hash(expected), hash(actual))
+        self.assertEqual(expected, actual)
+
+    def test_apply_move__current_config_not_modified(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"mtu": "9100"}}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}}
+        target_config = {"PORT": {"Ethernet0": {"mtu": "1500"}}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}}
+        diff = ps.Diff(current_config, target_config)
+        expected_current_config = copy.deepcopy(current_config)
+        move = ps.JsonMove(diff, OperationType.REPLACE, ["PORT", "Ethernet0", "mtu"], ["PORT", "Ethernet0", "mtu"])
+
+        # Act
+        actual = diff.apply_move(move)
+
+        # Assert
+        self.assertEqual(expected_current_config, diff.current_config)
+        self.assertEqual(target_config, actual.current_config)
+        self.assertTrue(actual.has_no_diff())
+        # Tables not on the path of the move are shared
+        self.assertIs(diff.current_config["VLAN"], actual.current_config["VLAN"])
+
     def test_eq__different_current_config__returns_false(self):
         # Arrange
         diff = ps.Diff(Files.ANY_CONFIG_DB, Files.ANY_CONFIG_DB)
@@ -108,6 +141,53 @@ class TestDiff(unittest.TestCase):
         self.assertEqual(diff, other_diff)
         self.assertTrue(diff == other_diff)
 
+
+class TestConfigHasher(unittest.TestCase):
+    def _create_config(self, ports, vlan_members, acl_rules):
+        config = {"PORT": {}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}, "VLAN_MEMBER": {}, "ACL_RULE": {}}
+        for index in range(ports):
+            config["PORT"][f"Ethernet{index*4}"] = {"lanes": f"{index*4}", "mtu": "9100", "admin_status": "up"}
+        for index in range(vlan_members):
+            config["VLAN_MEMBER"][f"Vlan1000|Ethernet{index*4}"] = {"tagging_mode": "untagged"}
+        for index in range(acl_rules):
+            config["ACL_RULE"][f"DATAACL|RULE_{index}"] = {"PRIORITY": str(index), "PACKET_ACTION": "DROP"}
+        return config
+
+    def test_hash_config__empty_and_missing_table__different_hashes(self):
+        self.assertNotEqual(ps.ConfigHasher.hash_config({"PORT": {}}), ps.ConfigHasher.hash_config({}))
+        self.assertNotEqual(ps.ConfigHasher.hash_config({"PORT": {"Ethernet0": {}}}),
+                            ps.ConfigHasher.hash_config({"PORT": {}, "Ethernet0": {}}))
+
+    def test_hash_config__key_order__same_hashes(self):
+        config1 = OrderedDict([("PORT", {"Ethernet0": {"mtu": "9100"}}), ("VLAN", {"Vlan1000": {}})])
+        config2 = OrderedDict([("VLAN", {"Vlan1000": {}}), ("PORT", {"Ethernet0": {"mtu": "9100"}})])
+        self.assertEqual(ps.ConfigHasher.hash_config(config1), ps.ConfigHasher.hash_config(config2))
+
+    def test_update_hash__large_config__same_as_hash_config(self):
+        # Arrange
+        current_config = self._create_config(ports=1000, vlan_members=4000, acl_rules=10000)
+        target_config = self._create_config(ports=1000, vlan_members=3990, acl_rules=10000)
+        target_config["PORT"]["Ethernet0"]["mtu"] = "1500"
+        target_config["ACL_RULE"]["DATAACL|RULE_10000"] = {"PRIORITY": "10000", "PACKET_ACTION": "FORWARD"}
+        target_config["LOOPBACK_INTERFACE"] = {"Loopback0": {}}
+        diff = ps.Diff(current_config, target_config)
+        hash(diff)
+
+        # Act
+        moves = [ps.JsonMove(diff, OperationType.REPLACE, ["PORT", "Ethernet0", "mtu"], ["PORT", "Ethernet0", "mtu"]),
+                 ps.JsonMove(diff, OperationType.ADD, ["ACL_RULE", "DATAACL|RULE_10000"],
+                             ["ACL_RULE", "DATAACL|RULE_10000"]),
+                 ps.JsonMove(diff, OperationType.ADD, ["LOOPBACK_INTERFACE"], ["LOOPBACK_INTERFACE"])]
+        for index in range(3990, 4000):
+            moves.append(ps.JsonMove(diff, OperationType.REMOVE, ["VLAN_MEMBER", f"Vlan1000|Ethernet{index*4}"]))
+        for move in moves:
+            diff = diff.apply_move(move)
+            self.assertEqual(ps.ConfigHasher.hash_config(diff.current_config), diff.current_config_hash)
+
+        # Assert
+        self.assertEqual(hash(ps.Diff(target_config, target_config)), hash(diff))
+        self.assertTrue(diff.has_no_diff())
+
 class TestJsonMove(unittest.TestCase):
     def setUp(self):
         self.operation_wrapper = OperationWrapper()
@@ -933,6 +1013,133 @@ class TestFullConfigMoveValidator(unittest.TestCase):
         # Act and assert
         self.assertTrue(validator.validate(self.any_move, self.any_diff))
 
+    def test_validate__incremental__only_affected_tables_validated(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"mtu": "9100"}},
+                          "VLAN": {"Vlan1000": {"vlanid": "1000"}},
+                          "VLAN_MEMBER": {"Vlan1000|Ethernet0": {"tagging_mode": "untagged"}},
+                          "LOOPBACK_INTERFACE": {"Loopback0": {}}}
+        target_config = copy.deepcopy(current_config)
+        target_config["VLAN_MEMBER"]["Vlan1000|Ethernet0"]["tagging_mode"] = "tagged"
+        diff = ps.Diff(current_config, target_config)
+        move = ps.JsonMove(diff, OperationType.REPLACE, ["VLAN_MEMBER"], ["VLAN_MEMBER"])
+        config_wrapper = Mock()
+        config_wrapper.validate_config_db_config.return_value = (True, None)
+        config_wrapper.get_table_dependencies.return_value = {"PORT": set(),
+                                                              "VLAN": set(),
+                                                              "VLAN_MEMBER": {"PORT", "VLAN"},
+                                                              "LOOPBACK_INTERFACE": set()}
+        validator = ps.FullConfigMoveValidator(config_wrapper, incremental=True)
+
+        # Act
+        self.assertTrue(validator.validate(move, diff))
+        self.assertTrue(validator.validate(move, diff))
+
+        # Assert
+        validated_configs = [args[0] for args, _ in config_wrapper.validate_config_db_config.call_args_list]
+        self.assertEqual([current_config,
+                          {"PORT": target_config["PORT"],
+                           "VLAN": target_config["VLAN"],
+                           "VLAN_MEMBER": target_config["VLAN_MEMBER"]}],
+                         validated_configs)
+
+    def test_validate__incremental__referring_tables_validated(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"mtu": "9100"}},
+                          "VLAN_MEMBER": {"Vlan1000|Ethernet0": {"tagging_mode": "untagged"}},
+                          "LOOPBACK_INTERFACE": {"Loopback0": {}}}
+        target_config = copy.deepcopy(current_config)
+        target_config["PORT"]["Ethernet0"]["mtu"] = "1500"
+        diff = ps.Diff(current_config, target_config)
+        move = ps.JsonMove(diff, OperationType.REPLACE, ["PORT", "Ethernet0", "mtu"], ["PORT", "Ethernet0", "mtu"])
+        config_wrapper = Mock()
+        config_wrapper.validate_config_db_config.return_value = (True, None)
+        config_wrapper.get_table_dependencies.return_value = {"PORT": set(),
+                                                              "VLAN_MEMBER": {"PORT"},
+                                                              "LOOPBACK_INTERFACE": set()}
+        validator = ps.FullConfigMoveValidator(config_wrapper, incremental=True)
+
+        # Act
+        self.assertTrue(validator.validate(move, diff))
+
+        # Assert
+        config_wrapper.validate_config_db_config.assert_called_with(
+            {"PORT": target_config["PORT"], "VLAN_MEMBER": target_config["VLAN_MEMBER"]})
+
+    def test_validate__incremental__invalid_current_config__full_config_validated(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"mtu": "9100"}}, "LOOPBACK_INTERFACE": {"Loopback0": {}}}
+        target_config = {"PORT": {"Ethernet0": {"mtu": "1500"}}, "LOOPBACK_INTERFACE": {"Loopback0": {}}}
+        diff = ps.Diff(current_config, target_config)
+        move = ps.JsonMove(diff, OperationType.REPLACE, ["PORT", "Ethernet0", "mtu"], ["PORT", "Ethernet0", "mtu"])
+        config_wrapper = Mock()
+        config_wrapper.validate_config_db_config.side_effect = \
+            create_side_effect_dict({(str(current_config),): (False, None),
+                                     (str(target_config),): (True, None)})
+        config_wrapper.get_table_dependencies.return_value = {"PORT": set(), "LOOPBACK_INTERFACE": set()}
+        validator = ps.FullConfigMoveValidator(config_wrapper, incremental=True)
+
+        # Act and assert
+        self.assertTrue(validator.validate(move, diff))
+        config_wrapper.validate_config_db_config.assert_called_with(target_config)
+
+    def test_validate__incremental__unknown_table__full_config_validated(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"mtu": "9100"}}}
+        target_config = {"PORT": {"Ethernet0": {"mtu": "9100"}}, "NEW_TABLE": {"key": {}}}
+        diff = ps.Diff(current_config, target_config)
+        move = ps.JsonMove(diff, OperationType.ADD, ["NEW_TABLE"], ["NEW_TABLE"])
+        config_wrapper = Mock()
+        config_wrapper.validate_config_db_config.return_value = (False, None)
+        config_wrapper.get_table_dependencies.return_value = {"PORT": set()}
+        validator = ps.FullConfigMoveValidator(config_wrapper, incremental=True)
+
+        # Act and assert
+        self.assertFalse(validator.validate(move, diff))
+        config_wrapper.validate_config_db_config.assert_called_once_with(target_config)
+
+    def test_validate__incremental__same_config_hash__configs_compared(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"mtu": "9100"}}}
+        target_config = {"PORT": {"Ethernet0": {"mtu": "1500"}}}
+        diff = ps.Diff(current_config, target_config)
+        valid_move = ps.JsonMove.from_operation({"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "1500"})
+        invalid_move = ps.JsonMove.from_operation({"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "0"})
+        config_wrapper = Mock()
+        config_wrapper.validate_config_db_config.side_effect = \
+            create_side_effect_dict({(str(current_config),): (True, None),
+                                     (str(target_config),): (True, None),
+                                     (str({"PORT": {"Ethernet0": {"mtu": "0"}}}),): (False, None)})
+        config_wrapper.get_table_dependencies.return_value = {"PORT": set()}
+        validator = ps.FullConfigMoveValidator(config_wrapper, incremental=True)
+
+        # Act and assert
+        with patch.object(ps.ConfigHasher, "update_hash", return_value=0):
+            self.assertTrue(validator.validate(valid_move, diff))
+            self.assertFalse(validator.validate(invalid_move, diff))
+
+    def test_validate__max_validation_results__least_recently_used_dropped(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"mtu": "9100"}}}
+        target_config = {"PORT": {"Ethernet0": {"mtu": "1500"}}}
+        diff = ps.Diff(current_config, target_config)
+        moves = [ps.JsonMove.from_operation({"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": mtu})
+                 for mtu in ["1500", "1400", "1300"]]
+        config_wrapper = Mock()
+        config_wrapper.validate_config_db_config.return_value = (True, None)
+        config_wrapper.get_table_dependencies.return_value = {"PORT": set()}
+        validator = ps.FullConfigMoveValidator(config_wrapper, incremental=True, max_validation_results=2)
+        for move in moves:
+            validator.validate(move, diff)
+        validations_count = config_wrapper.validate_config_db_config.call_count
+
+        # Act and assert
+        self.assertEqual(2, len(validator.validation_results))
+        self.assertTrue(validator.validate(moves[2], diff))
+        self.assertEqual(validations_count, config_wrapper.validate_config_db_config.call_count)
+        self.assertTrue(validator.validate(moves[0], diff))
+        self.assertEqual(validations_count + 1, config_wrapper.validate_config_db_config.call_count)
+
 class TestCreateOnlyMoveValidator(unittest.TestCase):
     def setUp(self):
         self.validator = ps.CreateOnlyMoveValidator(ps.PathAddressing())
@@ -3245,6 +3452,144 @@ class DeleteRefsMoveExtender(unittest.TestCase):
         moves_ops = [list(move.patch)[0] for move in moves]
         self.assertCountEqual(ex_ops, moves_ops)
 
+
+class TestBestFirstSorter(unittest.TestCase):
+    def setUp(self):
+        self.current_config = {"TABLE": {"key1": {"field": "1"}, "key2": {"field": "2"}}}
+        self.target_config = {"TABLE": {"key1": {"field": "3"}}}
+        self.diff = ps.Diff(self.current_config, self.target_config)
+        self.path_addressing = PathAddressing(ConfigWrapper())
+        self.validator = Mock()
+        self.validator.validate.return_value = True
+
+    def test_sort__no_diff__returns_empty_list(self):
+        # Arrange
+        sorter = self.create_sorter()
+
+        # Act
+        actual = sorter.sort(ps.Diff(self.current_config, self.current_config))
+
+        # Assert
+        self.assertEqual([], actual)
+        self.validator.validate.assert_not_called()
+
+    def test_sort__moves_lead_to_target_config(self):
+        # Arrange
+        sorter = self.create_sorter()
+
+        # Act
+        moves = sorter.sort(self.diff)
+
+        # Assert
+        self.assertEqual(self.target_config, self.simulate(moves))
+        # The whole config is replaced at once by the move extended to the upper level
+        self.assertEqual(1, len(moves))
+
+    def test_sort__only_explored_moves_are_validated(self):
+        # Arrange
+        sorter = self.create_sorter()
+
+        # Act
+        moves = sorter.sort(self.diff)
+
+        # Assert
+        self.assertEqual(len(moves), self.validator.validate.call_count)
+
+    def test_sort__invalid_move__not_used(self):
+        # Arrange
+        self.validator.validate.side_effect = lambda move, diff: move.path != "/TABLE/key1/field"
+        sorter = self.create_sorter()
+
+        # Act
+        moves = sorter.sort(self.diff)
+
+        # Assert
+        self.assertEqual(self.target_config, self.simulate(moves))
+        self.assertNotIn("/TABLE/key1/field", [move.path for move in moves])
+
+    def test_sort__no_valid_moves__returns_none(self):
+        # Arrange
+        self.validator.validate.return_value = False
+        sorter = self.create_sorter()
+
+        # Act
+        actual = sorter.sort(self.diff)
+
+        # Assert
+        self.assertIsNone(actual)
+
+    def test_sort__bounded_frontier__moves_lead_to_target_config(self):
+        # Arrange
+        sorter = self.create_sorter(max_frontier_size=1)
+
+        # Act
+        moves = sorter.sort(self.diff)
+
+        # Assert
+        self.assertEqual(self.target_config, self.simulate(moves))
+
+    def test_sort__bounded_frontier__no_moves_left__sorted_with_memoization(self):
+        # Arrange
+        validated_moves = []
+
+        def validate(move, diff):
+            # Only the first explored move is invalid, the other moves were dropped from the frontier
+            validated_moves.append(move)
+            return len(validated_moves) > 1
+
+        self.validator.validate.side_effect = validate
+        sorter = self.create_sorter(max_frontier_size=1)
+
+        # Act
+        moves = sorter.sort(self.diff)
+
+        # Assert
+        self.assertTrue(sorter.frontier_truncated)
+        self.assertEqual(self.target_config, self.simulate(moves))
+
+    def test_sort__same_config_hashes__configs_compared(self):
+        # Arrange
+        sorter = self.create_sorter()
+
+        # Act
+        with patch.object(ps.ConfigHasher, "hash_config", return_value=0), \
+                patch.object(ps.ConfigHasher, "update_hash", return_value=0):
+            moves = sorter.sort(self.diff)
+
+        # Assert
+        self.assertEqual(self.target_config, self.simulate(moves))
+
+    def test_sort__references_to_deleted_keys__estimated(self):
+        # Arrange
+        path_addressing = Mock()
+        path_addressing.create_path.side_effect = self.path_addressing.create_path
+        path_addressing.has_path.side_effect = self.path_addressing.has_path
+        path_addressing.find_ref_paths.side_effect = \
+            create_side_effect_dict({("/TABLE/key2", str(self.current_config)): ["/TABLE/key1/field"]})
+        sorter = self.create_sorter(path_addressing=path_addressing)
+
+        # Act
+        moves = sorter.sort(self.diff)
+
+        # Assert
+        self.assertEqual(self.target_config, self.simulate(moves))
+        self.assertEqual(["/TABLE/key1/field"], sorter.ref_paths)
+        self.assertEqual(1, sorter._estimate_moves_left(ps.Diff({"TABLE": {"key1": {}}}, {"TABLE": {}})))
+        self.assertEqual(3, sorter._estimate_moves_left(self.diff))
+
+    def create_sorter(self, path_addressing=None, max_frontier_size=ps.BestFirstSorter.DEFAULT_MAX_FRONTIER_SIZE):
+        move_wrapper = ps.MoveWrapper([ps.LowLevelMoveGenerator(self.path_addressing)],
+                                      [ps.KeyLevelMoveGenerator()],
+                                      [ps.UpperLevelMoveExtender()],
+                                      [self.validator])
+        return ps.BestFirstSorter(move_wrapper, path_addressing, max_frontier_size)
+
+    def simulate(self, moves):
+        config = self.current_config
+        for move in moves:
+            config = move.apply(config)
+        return config
+
 class TestSortAlgorithmFactory(unittest.TestCase):
     def test_dfs_sorter(self):
         self.verify(ps.Algorithm.DFS, ps.DfsSorter)
@@ -3255,6 +3600,20 @@ class TestSortAlgorithmFactory(unittest.TestCase):
     def test_memoization_sorter(self):
         self.verify(ps.Algorithm.MEMOIZATION, ps.MemoizationSorter)
 
+    def test_best_first_sorter(self):
+        self.verify(ps.Algorithm.ASTAR, ps.BestFirstSorter)
+
+    def test_best_first_sorter__full_config_validated_last(self):
+        # Arrange
+        config_wrapper = ConfigWrapper()
+        factory = ps.SortAlgorithmFactory(OperationWrapper(), config_wrapper, PathAddressing(config_wrapper))
+
+        # Act
+        sorter = factory.create(ps.Algorithm.ASTAR)
+
+        # Assert
+        self.assertIsInstance(sorter.move_wrapper.move_validators[-1], ps.FullConfigMoveValidator)
+
     def verify(self, algo, algo_class):
         # Arrange
         config_wrapper = ConfigWrapper()
@@ -3292,6 +3651,16 @@ class TestPatchSorter(unittest.TestCase):
     def setUp(self):
         self.config_wrapper = ConfigWrapper()
 
+    def test_ctor__incremental_validation__used_by_sort_algorithm_factory(self):
+        for incremental_validation in [True, False]:
+            with self.subTest(incremental_validation=incremental_validation):
+                # Act
+                sorter = ps.PatchSorter(self.config_wrapper, PatchWrapper(self.config_wrapper),
+                                        incremental_validation=incremental_validation)
+
+                # Assert
+                self.assertEqual(incremental_validation, sorter.sort_algorithm_factory.incremental_validation)
+
     def test_patch_sorter_success(self):
         # Format of the JSON file containing the test-cases:
         #
@@ -3312,7 +3681,15 @@ class TestPatchSorter(unittest.TestCase):
             with self.subTest(name=test_case_name):
                 self.run_single_success_case(data[test_case_name], skip_exact_change_list_match)
 
-    def run_single_success_case(self, data, skip_exact_change_list_match):
+    def test_patch_sorter_success__best_first_sorter(self):
+        # The best first sorter can sort the changes in a different order than the expected changes
+        data = Files.PATCH_SORTER_TEST_SUCCESS
+        skip_exact_change_list_match = True
+        for test_case_name in data:
+            with self.subTest(name=test_case_name):
+                self.run_single_success_case(data[test_case_name], skip_exact_change_list_match, ps.Algorithm.ASTAR)
+
+    def run_single_success_case(self, data, skip_exact_change_list_match, algorithm=ps.Algorithm.DFS):
         current_config = data["current_config"]
         patch = jsonpatch.JsonPatch(data["patch"])
         expected_changes = []
@@ -3321,7 +3698,7 @@ class TestPatchSorter(unittest.TestCase):
 
         sorter = self.create_patch_sorter(current_config)
 
-        actual_changes = sorter.sort(patch)
+        actual_changes = sorter.sort(patch, algorithm)
 
         if not skip_exact_change_list_match:
             self.assertEqual(expected_changes, actual_changes)
@@ -3334,6 +3711,50 @@ class TestPatchSorter(unittest.TestCase):
             self.assertTrue(is_valid, f"Change will produce invalid config. Error: {error}")
         self.assertEqual(target_config, simulated_config)
 
+    def test_incremental_validation__same_results(self):
+        # The incremental validation of the changed tables has to accept and reject the same moves as the
+        # validation of the full config, on all the moves tried while sorting the test cases
+        data = Files.PATCH_SORTER_TEST_SUCCESS
+        validated_moves = []
+        for test_case_name in data:
+            for algorithm in [ps.Algorithm.DFS, ps.Algorithm.ASTAR]:
+                with self.subTest(name=test_case_name, algorithm=algorithm):
+                    validated_moves += self.run_single_incremental_validation_case(data[test_case_name], algorithm)
+        self.assertTrue(validated_moves)
+
+    def run_single_incremental_validation_case(self, data, algorithm):
+        current_config = data["current_config"]
+        patch = jsonpatch.JsonPatch(data["patch"])
+        sorter = self.create_patch_sorter(current_config)
+        sort_algorithm_factory = sorter.sort_algorithm_factory
+        sort_algorithm_factory.incremental_validation = True
+        full_validator = ps.FullConfigMoveValidator(self.config_wrapper)
+        validated_moves = []
+        different_moves = []
+
+        def create(algorithm):
+            sort_algorithm = ps.SortAlgorithmFactory.create(sort_algorithm_factory, algorithm)
+            for validator in sort_algorithm.move_wrapper.move_validators:
+                if isinstance(validator, ps.FullConfigMoveValidator):
+                    validator.validate = compare(validator.validate)
+            return sort_algorithm
+
+        def compare(incremental_validate):
+            def validate(move, diff):
+                is_valid = incremental_validate(move, diff)
+                validated_moves.append(move)
+                if is_valid != full_validator.validate(move, diff):
+                    different_moves.append(f"{move}: incremental validation {is_valid}")
+                return is_valid
+            return validate
+
+        sort_algorithm_factory.create = create
+
+        sorter.sort(patch, algorithm)
+
+        self.assertEqual([], different_moves)
+        return validated_moves
+
     def test_patch_sorter_failure(self):
         # Format of the JSON file containing the test-cases:
         #
@@ -1,15 +1,20 @@
 import os
 import sys
 from click.testing import CliRunner
-from unittest import TestCase
+from unittest import TestCase, mock
 import subprocess
 
 import show.main as show
+from utilities_common import constants
+from utilities_common.general import load_module_from_source
 
 root_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(root_path)
 scripts_path = os.path.join(modules_path, "scripts")
 
+intfutil_path = os.path.join(scripts_path, 'intfutil')
+intfutil = load_module_from_source('intfutil', intfutil_path)
+
 show_interface_status_output="""\
       Interface            Lanes    Speed    MTU    FEC      Alias             Vlan    Oper    Admin               Type    Asym PFC
 ---------------  ---------------  -------  -----  -----  ---------  ---------------  ------  -------  -----------------  ----------
@@ -360,6 +365,41 @@ class TestIntfutil(TestCase):
         assert result.exit_code == 0
         assert result.output == show_interface_fec_status_output
 
+    def test_intf_status_round_trips(self):
+        intf_status = intfutil.IntfStatus(None, None, constants.DISPLAY_ALL)
+        intf_status.get_intf_status()
+        # One pipelined read per DB
+        assert intf_status.snapshot.fallback_round_trips == 0
+        assert intf_status.snapshot.round_trips == 3
+
+        # Without the snapshot, the rows are read field by field
+        with mock.patch.object(intfutil.IntfDbSnapshot, 'load'):
+            per_field_status = intfutil.IntfStatus(None, None, constants.DISPLAY_ALL)
+            per_field_status.get_intf_status()
+        assert per_field_status.table == intf_status.table
+        assert per_field_status.snapshot.round_trips > 100
+
+    def test_subintf_status_round_trips(self):
+        intf_status = intfutil.IntfStatus('subport', None, constants.DISPLAY_ALL)
+        intf_status.get_intf_status()
+        assert intf_status.snapshot.fallback_round_trips == 0
+
+        with mock.patch.object(intfutil.IntfDbSnapshot, 'load'):
+            per_field_status = intfutil.IntfStatus('subport', None, constants.DISPLAY_ALL)
+            per_field_status.get_intf_status()
+        assert per_field_status.table == intf_status.table
+
+    def test_intf_description_round_trips(self):
+        intf_description = intfutil.IntfDescription(None, None, constants.DISPLAY_ALL)
+        intf_description.get_intf_description()
+        # Only APPL_DB is read
+        assert intf_description.snapshot.round_trips == 1
+
+        with mock.patch.object(intfutil.IntfDbSnapshot, 'load'):
+            per_field_description = intfutil.IntfDescription(None, None, constants.DISPLAY_ALL)
+            per_field_description.get_intf_description()
+        assert per_field_description.table == intf_description.table
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
@@ -0,0 +1,67 @@
+import importlib
+import os
+import threading
+
+import utilities_common.multi_asic as multi_asic_util
+from utilities_common import constants
+
+
+class NsCollector(object):
+    def __init__(self, max_workers):
+        self.multi_asic = multi_asic_util.MultiAsic(constants.DISPLAY_ALL, max_workers=max_workers)
+        self.db = None
+        self.config_db = None
+        self.threads = set()
+        self.asic1_done = threading.Event()
+
+    @multi_asic_util.run_on_multi_asic
+    def collect(self):
+        namespace = self.multi_asic.current_namespace
+        if namespace == 'asic0' and self.multi_asic.max_workers > 1:
+            # Finish asic0 after asic1 to check the merge order
+            assert self.asic1_done.wait(timeout=10)
+        self.threads.add(threading.get_ident())
+        config_db_asic = self.config_db.get_entry('DEVICE_METADATA', 'localhost')['asic_name']
+        db_asic = self.db.get(self.db.CONFIG_DB, 'DEVICE_METADATA|localhost', 'asic_name')
+        if namespace == 'asic1':
+            self.asic1_done.set()
+        return (namespace, config_db_asic, db_asic)
+
+
+class TestRunOnMultiAsic(object):
+    @classmethod
+    def setup_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "2"
+        os.environ["UTILITIES_UNIT_TESTING_TOPOLOGY"] = "multi_asic"
+        from .mock_tables import dbconnector
+        from .mock_tables import mock_multi_asic
+        importlib.reload(mock_multi_asic)
+        dbconnector.load_namespace_config()
+
+    def test_sequential(self):
+        collector = NsCollector(max_workers=1)
+        results = collector.collect()
+        assert results == [('asic0', 'asic0', 'asic0'), ('asic1', 'asic1', 'asic1')]
+        assert len(collector.threads) == 1
+        # The object is left connected to the last namespace
+        assert collector.multi_asic.current_namespace == 'asic1'
+        assert collector.config_db.get_entry('DEVICE_METADATA', 'localhost')['asic_name'] == 'asic1'
+
+    def test_parallel(self):
+        collector = NsCollector(max_workers=2)
+        results = collector.collect()
+        assert results == [('asic0', 'asic0', 'asic0'), ('asic1', 'asic1', 'asic1')]
+        assert len(collector.threads) == 2
+        # The object itself is not connected to any namespace
+        assert collector.multi_asic.current_namespace is None
+        assert collector.db is None
+        assert collector.config_db is None
+
+    @classmethod
+    def teardown_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "0"
+        os.environ["UTILITIES_UNIT_TESTING_TOPOLOGY"] = ""
+        from .mock_tables import dbconnector
+        from .mock_tables import mock_single_asic
+        importlib.reload(mock_single_asic)
+        dbconnector.load_namespace_config()
@@ -0,0 +1,48 @@
+from unittest import mock
+
+from utilities_common import netstat
+from utilities_common.netstat import STATUS_NA
+
+
+class TestNetstat(object):
+    def test_ns_diff(self):
+        assert netstat.ns_diff('1000', '1') == '999'
+        assert netstat.ns_diff('1', '1000') == '0'
+        assert netstat.ns_diff('1000', STATUS_NA) == '1,000'
+        assert netstat.ns_diff(STATUS_NA, '1000') == STATUS_NA
+        assert netstat.ns_diff('18446744073709551615', '0') == '18,446,744,073,709,551,615'
+
+    def test_ns_rates(self):
+        assert netstat.ns_brate('20000000', '0', 1) == '20.00 MB/s'
+        assert netstat.ns_brate('20000', '0', 1) == '20.00 KB/s'
+        assert netstat.ns_brate('200', '0', 2.0) == '100.00 B/s'
+        assert netstat.ns_brate('200', STATUS_NA, 2.0) == STATUS_NA
+        assert netstat.ns_prate('300', '100', 2.0) == '100.00/s'
+        assert netstat.ns_prate(STATUS_NA, '100', 2.0) == STATUS_NA
+        assert netstat.ns_util('500000000', '0', 1) == '10.00%'
+        assert netstat.ns_util('500000000', '0', 1, 100) == '4.00%'
+        assert netstat.ns_util('500000000', STATUS_NA, 1) == STATUS_NA
+
+    def test_columns(self):
+        new = ['100', '5', STATUS_NA, '100']
+        old = ['40', '10', '0', STATUS_NA]
+        assert netstat.ns_diff_column(new, old) == [60, 0, None, 100]
+        assert netstat.format_diff_column(netstat.ns_diff_column(new, old)) == ['60', '0', STATUS_NA, '100']
+        assert netstat.ns_rate_column(new, old, 2.0) == [30.0, 0.0, None, None]
+        assert netstat.ns_util_column(new, old, 2.0, [1, 1, 1, 1]) == \
+            [30.0/(1000*1000*1000/8.0)*100, 0.0, None, None]
+
+    def test_columns_match_cells(self):
+        rows = netstat.NUMPY_MIN_ROWS * 2
+        new = [str(i * 1000003) for i in range(rows)] + [STATUS_NA, '7']
+        old = [str(i * 999983) for i in range(rows)] + ['1', STATUS_NA]
+        expected_diff = [netstat.ns_diff(n, o) for n, o in zip(new, old)]
+        expected_brate = [netstat.ns_brate(n, o, 3.0) for n, o in zip(new, old)]
+
+        assert netstat.format_diff_column(netstat.ns_diff_column(new, old)) == expected_diff
+        assert netstat.format_brate_column(netstat.ns_rate_column(new, old, 3.0)) == expected_brate
+
+        # Same result without NumPy
+        with mock.patch.object(netstat, 'numpy', None):
+            assert netstat.format_diff_column(netstat.ns_diff_column(new, old)) == expected_diff
+            assert netstat.format_brate_column(netstat.ns_rate_column(new, old, 3.0)) == expected_brate
@@ -0,0 +1,111 @@
+import pytest
+
+from utilities_common.db import Db
+from utilities_common import oid_resolver
+from utilities_common.oid_resolver import OidResolver, get_oid_resolver
+
+
+def populate_asic_objects(db, num_ports):
+    for index in range(num_ports):
+        port_oid = "oid:0x1000000{:06x}".format(index)
+        bridge_port_oid = "oid:0x3a000000{:06x}".format(index)
+        hostif_oid = "oid:0xd000000{:06x}".format(index)
+        db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:" + bridge_port_oid,
+               "SAI_BRIDGE_PORT_ATTR_TYPE", "SAI_BRIDGE_PORT_TYPE_PORT")
+        db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:" + bridge_port_oid,
+               "SAI_BRIDGE_PORT_ATTR_PORT_ID", port_oid)
+        db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF:" + hostif_oid,
+               "SAI_HOSTIF_ATTR_TYPE", "SAI_HOSTIF_TYPE_NETDEV")
+        db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF:" + hostif_oid,
+               "SAI_HOSTIF_ATTR_OBJ_ID", port_oid)
+        db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF:" + hostif_oid,
+               "SAI_HOSTIF_ATTR_NAME", "Ethernet{}".format(index * 4))
+    db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:0x26000000000001",
+           "SAI_VLAN_ATTR_VLAN_ID", "1000")
+    # The default VLAN has no VLAN id attribute
+    db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:0x26000000000002",
+           "NULL", "NULL")
+
+
+class MockPubSub(object):
+    def __init__(self):
+        self.patterns = []
+        self.messages = []
+
+    def psubscribe(self, pattern):
+        self.patterns.append(pattern)
+
+    def get_message(self):
+        return self.messages.pop(0) if self.messages else None
+
+
+class TestOidResolver(object):
+
+    def test_maps(self):
+        db = Db().db
+        populate_asic_objects(db, 8)
+        resolver = OidResolver(db)
+
+        assert resolver.get_bridge_port_map() == {
+            "3a000000{:06x}".format(index): "1000000{:06x}".format(index) for index in range(8)
+        }
+        hostifs = resolver.get_objects(oid_resolver.HOSTIF)
+        assert hostifs["oid:0xd000000000003"]["SAI_HOSTIF_ATTR_NAME"] == "Ethernet12"
+        assert resolver.get_objects(oid_resolver.LAG_MEMBER) == {}
+
+        assert resolver.get_vlan_id_from_bvid("oid:0x26000000000001") == "1000"
+        assert resolver.get_vlan_id_from_bvid("oid:0x26000000000002") is None
+        assert resolver.get_vlan_oid(1000) == "oid:0x26000000000001"
+        assert resolver.get_vlan_oid(2000) is None
+        with pytest.raises(KeyError):
+            resolver.get_vlan_id_from_bvid("oid:0x26000000000003")
+
+    def test_single_pass(self):
+        db = Db().db
+        populate_asic_objects(db, 512)
+        resolver = OidResolver(db)
+
+        resolver.get_bridge_port_map()
+        round_trips = resolver.reader.round_trips
+        # All the objects are read in a few pipelined requests, once
+        assert round_trips < 10
+        resolver.get_objects(oid_resolver.HOSTIF)
+        resolver.get_vlan_oid(1000)
+        assert resolver.reader.round_trips == round_trips
+
+    def test_changed_attributes(self):
+        db = Db().db
+        populate_asic_objects(db, 4)
+        assert OidResolver(db).get_vlan_oid(1000) == "oid:0x26000000000001"
+
+        # Same keys, new attribute value: the next resolver reads the new value
+        db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:0x26000000000001",
+               "SAI_VLAN_ATTR_VLAN_ID", "2000")
+        resolver = OidResolver(db)
+        assert resolver.get_vlan_oid(1000) is None
+        assert resolver.get_vlan_oid(2000) == "oid:0x26000000000001"
+
+    def test_invalidate(self):
+        db = Db().db
+        populate_asic_objects(db, 4)
+        resolver = OidResolver(db)
+        pubsub = MockPubSub()
+        resolver._subscribe = lambda: pubsub
+        assert resolver.get_vlan_oid(2000) is None
+
+        db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:0x26000000000003",
+               "SAI_VLAN_ATTR_VLAN_ID", "2000")
+        assert resolver.get_vlan_oid(2000) is None
+        resolver.invalidate()
+        assert resolver.get_vlan_oid(2000) == "oid:0x26000000000003"
+
+        db.set(db.ASIC_DB, "ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:0x26000000000004",
+               "SAI_VLAN_ATTR_VLAN_ID", "3000")
+        pubsub.messages.append({'type': 'pmessage', 'data': 'hset'})
+        assert resolver.get_vlan_oid(3000) == "oid:0x26000000000004"
+
+    def test_shared_resolver(self):
+        db = Db().db
+        resolver = get_oid_resolver(db)
+        assert get_oid_resolver(db) is resolver
+        assert get_oid_resolver(Db().db) is not resolver
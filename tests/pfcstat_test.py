@@ -289,6 +289,13 @@ class TestMultiAsicPfcstat(object):
         assert return_code == 0
         assert result == show_pfc_counters_all_asic
 
+    def test_pfc_counters_all_max_workers(self):
+        return_code, result = get_result_and_return_code(
+            ['pfcstat', '-s', 'all', '-w', '2']
+        )
+        assert return_code == 0
+        assert result == show_pfc_counters_all
+
     def test_masic_pfc_clear(self):
         pfc_clear(show_pfc_counters_msaic_output_diff)
 
@@ -429,6 +429,20 @@ class TestMultiAsicPortStat(object):
         assert return_code == 0
         assert result == multi_asic_all_intf_counters
 
+    def test_multi_show_intf_counters_all_max_workers(self):
+        return_code, result = get_result_and_return_code(['portstat', '-s', 'all', '-w', '2'])
+        print("return_code: {}".format(return_code))
+        print("result = {}".format(result))
+        assert return_code == 0
+        assert result == multi_asic_all_intf_counters
+
+    def test_multi_show_intf_counters_printall_max_workers(self):
+        return_code, result = get_result_and_return_code(['portstat', '-a', '-s', 'all', '-w', '4'])
+        print("return_code: {}".format(return_code))
+        print("result = {}".format(result))
+        assert return_code == 0
+        assert result == multi_asic_intf_counters_printall
+
     def test_multi_show_intf_counters_asic(self):
         return_code, result = get_result_and_return_code(['portstat', '-n', 'asic0'])
         print("return_code: {}".format(return_code))
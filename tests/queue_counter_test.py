@@ -1,18 +1,21 @@
 import imp
 import json
+import math
 import os
 import sys
 
 from click.testing import CliRunner
-from unittest import TestCase
+from unittest import mock
 from swsscommon.swsscommon import ConfigDBConnector
 
 from .mock_tables import dbconnector
 
 import show.main as show
 import clear.main as clear
+from utilities_common.bulk_reader import BULK_READ_BATCH_SIZE
 from utilities_common.cli import json_dump
 from utilities_common.db import Db
+from utilities_common.general import load_module_from_source
 
 test_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(test_path)
@@ -20,6 +23,8 @@ scripts_path = os.path.join(modules_path, "scripts")
 sys.path.insert(0, test_path)
 sys.path.insert(0, modules_path)
 
+queuestat_path = os.path.join(scripts_path, 'queuestat')
+
 
 show_queue_counters = """\
      Port    TxQ    Counter/pkts    Counter/bytes    Drop/pkts    Drop/bytes
@@ -2412,3 +2417,54 @@ class TestQueue(object):
         os.environ["PATH"] = os.pathsep.join(os.environ["PATH"].split(os.pathsep)[:-1])
         os.environ['UTILITIES_UNIT_TESTING'] = "0"
         print("TEARDOWN")
+
+
+def populate_voq_counters(db, num_ports, num_queues):
+    """ Fill COUNTERS_DB with the VOQs of a synthetic chassis """
+    port_indexes = {}
+    for port_index in range(num_ports):
+        port = "lc{}|asic0|Ethernet{}".format(port_index // 64, port_index % 64 * 4)
+        port_indexes[port] = port_index
+        port_oid = "oid:0x5d{:012x}".format(port_index)
+        db.set(db.COUNTERS_DB, "COUNTERS_SYSTEM_PORT_NAME_MAP", port, port_oid)
+        for queue_index in range(num_queues):
+            queue_oid = "oid:0x15{:06x}{:06x}".format(port_index, queue_index)
+            db.set(db.COUNTERS_DB, "COUNTERS_VOQ_NAME_MAP", "{}:{}".format(port, queue_index), queue_oid)
+            db.set(db.COUNTERS_DB, "COUNTERS_QUEUE_PORT_MAP", queue_oid, port_oid)
+            db.set(db.COUNTERS_DB, "COUNTERS_QUEUE_INDEX_MAP", queue_oid, str(queue_index))
+            db.set(db.COUNTERS_DB, "COUNTERS_QUEUE_TYPE_MAP", queue_oid, "SAI_QUEUE_TYPE_UNICAST_VOQ")
+            db.set(db.COUNTERS_DB, "COUNTERS:" + queue_oid, "SAI_QUEUE_STAT_PACKETS", str(port_index * queue_index))
+            db.set(db.COUNTERS_DB, "COUNTERS:" + queue_oid, "SAI_QUEUE_STAT_BYTES", str(port_index * 1000))
+            db.set(db.COUNTERS_DB, "COUNTERS:" + queue_oid, "SAI_QUEUE_STAT_DROPPED_PACKETS", str(queue_index))
+    return port_indexes
+
+
+class TestQueuestatBulk(object):
+    def test_voq_counters_batched(self):
+        num_ports, num_queues = 256, 8
+        queuestat = load_module_from_source('queuestat', queuestat_path)
+        db = Db().db
+        port_indexes = populate_voq_counters(db, num_ports, num_queues)
+        with mock.patch.object(queuestat, 'SonicV2Connector', return_value=db):
+            stat = queuestat.Queuestat(None, voq=True)
+
+        ports = list(stat.port_queues_map)
+        assert sorted(ports) == sorted(port_indexes)
+        results = list(stat.iter_cnstat(ports))
+        assert [port for port, _ in results] == ports
+        for port, cnstat_dict in results:
+            port_index = port_indexes[port]
+            queues = [key for key in cnstat_dict if key != 'time']
+            assert queues == ["{}:{}".format(port, queue_index) for queue_index in range(num_queues)]
+            for queue_index, queue in enumerate(queues):
+                assert cnstat_dict[queue] == {
+                    'queueindex': str(queue_index),
+                    'queuetype': 'VOQ',
+                    'totalpacket': str(port_index * queue_index),
+                    'totalbytes': str(port_index * 1000),
+                    'droppacket': str(queue_index),
+                    'dropbytes': 'N/A',
+                }
+
+        # The queue maps are read once, the counters in pipelined batches
+        assert stat.reader.round_trips == 3 + math.ceil(num_ports * num_queues / BULK_READ_BATCH_SIZE)
@@ -10,7 +10,8 @@ from unittest.mock import MagicMock, patch
 from tests.route_check_test_data import (
     APPL_DB, MULTI_ASIC, NAMESPACE, DEFAULTNS, ARGS, ASIC_DB, CONFIG_DB,
     DEFAULT_CONFIG_DB, APPL_STATE_DB, DESCR, OP_DEL, OP_SET, PRE, RESULT, RET, TEST_DATA,
-    UPD, FRR_ROUTES
+    UPD, FRR_ROUTES, RT_ENTRY_KEY_PREFIX, RT_ENTRY_KEY_SUFFIX, ROUTE_TABLE, RT_ENTRY_TABLE,
+    VNET_ROUTE_TABLE
 )
 
 import pytest
@@ -124,6 +125,22 @@ class MockSelector:
         return (state, None)
 
 
+class MockMultiSelector(MockSelector):
+    """ Selector over several subscriptions, as used by the daemon mode """
+    def __init__(self):
+        super().__init__()
+        self.subs_list = []
+
+    def addSelectable(self, subs):
+        self.subs_list.append(subs)
+        return 0
+
+    def select(self, timeout):
+        for subs in self.subs_list:
+            subs.update()
+        return (self.TIMEOUT, None)
+
+
 class MockSubscriber:
     def __init__(self, db, tbl):
         self.state = PRE
@@ -243,17 +260,21 @@ class TestRouteCheck(object):
         with patch('sys.argv', ct_data[ARGS].split()), \
             patch('sonic_py_common.multi_asic.get_namespace_list', return_value= ct_data[NAMESPACE]), \
             patch('sonic_py_common.multi_asic.is_multi_asic', return_value= ct_data[MULTI_ASIC]), \
-            patch('route_check.subprocess.check_output', side_effect=lambda *args, **kwargs: self.mock_check_output(ct_data, *args, **kwargs)), \
+            patch('route_check.subprocess.Popen',
+                  side_effect=lambda *args, **kwargs: self.mock_popen(ct_data, *args, **kwargs)), \
             patch('route_check.mitigate_installed_not_offloaded_frr_routes', side_effect=lambda *args, **kwargs: None), \
             patch('route_check.load_db_config', side_effect=lambda: init_db_conns(ct_data[NAMESPACE])):
 
             ret, res = route_check.main()
             self.assert_results(ct_data, ret, res)
 
-    def mock_check_output(self, ct_data, *args, **kwargs):
+    def mock_popen(self, ct_data, *args, **kwargs):
         ns = self.extract_namespace_from_args(args[0])
         routes = ct_data.get(FRR_ROUTES, {}).get(ns, {})
-        return json.dumps(routes)
+        proc = MagicMock()
+        proc.stdout = StringIO(json.dumps(routes))
+        proc.wait.return_value = 0
+        return proc
 
     def assert_results(self, ct_data, ret, res):
         expect_ret = ct_data.get(RET, 0)
@@ -267,6 +288,62 @@ class TestRouteCheck(object):
         assert ret == expect_ret
         assert res == expect_res
 
+    @pytest.mark.parametrize("test_num", TEST_DATA.keys())
+    def test_route_check_daemon(self, mock_dbs, test_num):
+        # The daemon mode reports the same results as the single scans
+        self.init()
+        ct_data = copy.deepcopy(TEST_DATA[test_num])
+        ct_data[ARGS] += " -d"
+        set_test_case_data(ct_data)
+        with patch("route_check.swsscommon.Select", side_effect=MockMultiSelector), \
+             patch("route_check.SUBSCRIBE_WAIT_SECS", 0):
+            self.run_test(ct_data)
+
+    @pytest.mark.parametrize("test_num", TEST_DATA.keys())
+    def test_route_check_parallel(self, mock_dbs, test_num):
+        # Namespaces checked in worker processes give the same results
+        self.init()
+        ct_data = copy.deepcopy(TEST_DATA[test_num])
+        ct_data[ARGS] += " -w 4"
+        set_test_case_data(ct_data)
+        self.run_test(ct_data)
+
+    def build_multi_asic_data(self, num_asics, num_routes):
+        ct_data = {
+            MULTI_ASIC: True,
+            NAMESPACE: ["asic{}".format(i) for i in range(num_asics)],
+            PRE: {},
+            RESULT: {},
+            RET: -1,
+        }
+        for ns in ct_data[NAMESPACE]:
+            routes = ["10.{}.{}.0/24".format(i // 256, i % 256) for i in range(num_routes)]
+            appl = {rt: {"ifname": "PortChannel1"} for rt in routes[1:]}
+            appl["30.0.0.0/24"] = {"ifname": "lo", "nexthop": "0.0.0.0"}
+            asic = {RT_ENTRY_KEY_PREFIX + rt + RT_ENTRY_KEY_SUFFIX: {} for rt in routes[:-1]}
+            asic[RT_ENTRY_KEY_PREFIX + "20.0.0.0/24" + RT_ENTRY_KEY_SUFFIX] = {}
+            ct_data[PRE][ns] = {
+                APPL_DB: {ROUTE_TABLE: appl, VNET_ROUTE_TABLE: {"Vnet1:20.0.0.0/24": {}}},
+                ASIC_DB: {RT_ENTRY_TABLE: asic},
+            }
+            ct_data[RESULT][ns] = {
+                "missed_ROUTE_TABLE_routes": [routes[-1]],
+                "Unaccounted_ROUTE_ENTRY_TABLE_entries": [routes[0]],
+            }
+        return ct_data
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_route_check_multi_asic_scale(self, mock_dbs, max_workers):
+        self.init()
+        ct_data = self.build_multi_asic_data(num_asics=4, num_routes=5000)
+        ct_data[ARGS] = "route_check -w {}".format(max_workers)
+        set_test_case_data(ct_data)
+        # BGP feature state is read from the default namespace
+        init_db_conns([DEFAULTNS])
+        start = time.time()
+        self.run_test(ct_data)
+        logger.info("multi-asic check with {} workers: {:.2f}s".format(max_workers, time.time() - start))
+
     def test_timeout(self, mock_dbs, force_hang):
         # Test timeout
         ex_raised = False
@@ -298,6 +375,40 @@ class TestRouteCheck(object):
         msg = route_check.print_message(syslog.LOG_ERR, "a", "b", "c", "d", "e", "f")
         assert len(msg) == 5
 
+    def test_frr_route_stream(self):
+        routes = {}
+        for test_data in TEST_DATA.values():
+            for ns_routes in test_data.get(FRR_ROUTES, {}).values():
+                routes.update(ns_routes)
+        routes["10.1.0.0/16"] = [
+            {"prefix": "10.1.0.0/16", "vrfName": "Vrf1", "protocol": "bgp", "selected": True,
+             "queued": True, "nexthops": [{"ip": "10.0.0.1", "flags": 3, "active": True}]},
+            {"prefix": "10.1.0.0/16", "vrfName": "default", "protocol": "static", "distance": 1,
+             "nexthops": [{"ip": "10.0.0.2", "interfaceName": "Ethernet\"0"}]},
+        ]
+        routes["10.2.0.0/16"] = []
+        output = json.dumps(routes, indent=2)
+
+        expected = [(prefix, {k: v for k, v in entry.items() if k in route_check.FRR_ROUTE_FIELDS})
+                    for prefix, entries in routes.items() for entry in entries]
+        # Small chunks split the values across reads
+        for chunk_size in (1, 7, 4096):
+            assert list(route_check.iter_frr_route_entries(StringIO(output), chunk_size)) == expected
+
+        assert list(route_check.iter_frr_route_entries(StringIO("{ }"))) == []
+        with pytest.raises(ValueError):
+            list(route_check.iter_frr_route_entries(StringIO(output[:-10])))
+        with pytest.raises(ValueError):
+            list(route_check.iter_frr_route_entries(StringIO("")))
+
+    def test_frr_route_command_failure(self):
+        proc = MagicMock()
+        proc.stdout = StringIO("")
+        proc.wait.return_value = 1
+        with patch('route_check.subprocess.Popen', return_value=proc):
+            with pytest.raises(route_check.subprocess.CalledProcessError):
+                route_check.read_frr_routes(['show', 'ip', 'route', 'json'])
+
     def test_mitigate_routes(self, mock_dbs):
         namespace = DEFAULTNS
         missed_frr_rt = [ { 'prefix': '192.168.0.1', 'protocol': 'bgp' } ]
@@ -307,3 +418,102 @@ class TestRouteCheck(object):
             route_check.mitigate_installed_not_offloaded_frr_routes(namespace, missed_frr_rt, rt_appl)
         # Verify that the stdout are suppressed in this function
         assert not mock_stdout.getvalue()
+
+
+class MockQueueSubscriber:
+    """ Subscription fed by the test, counting the messages popped """
+    def __init__(self, table):
+        self.queue = [(key, OP_SET, {}) for key in table]
+        self.pops = 0
+
+    def pop(self):
+        self.pops += 1
+        if self.queue:
+            return self.queue.pop(0)
+        return ("", "", None)
+
+
+class TestRouteTableCache(object):
+    NUM_ROUTES = 20000
+
+    def build_tables(self):
+        routes = ["10.{}.{}.0/24".format(i // 256, i % 256) for i in range(self.NUM_ROUTES)]
+        appl = routes + ["fe80::/64"]
+        asic = [RT_ENTRY_KEY_PREFIX + rt + RT_ENTRY_KEY_SUFFIX for rt in routes]
+        return appl, asic
+
+    @pytest.fixture
+    def cache(self):
+        appl, asic = self.build_tables()
+        self.tables = {route_check.APPL_ROUTE_TABLE_NAME: appl, route_check.ASIC_TABLE_NAME: asic}
+        self.subs = {}
+        self.select_state = 0
+
+        def subscriber(db, table):
+            self.subs[table] = MockQueueSubscriber(self.tables[table])
+            return self.subs[table]
+
+        selector = MagicMock()
+        selector.select.side_effect = lambda timeout: (self.select_state, None)
+        with patch("route_check.swsscommon.DBConnector"), \
+             patch("route_check.swsscommon.Select", return_value=selector), \
+             patch("route_check.swsscommon.SubscriberStateTable", side_effect=subscriber):
+            cache = route_check.RouteTableCache(DEFAULTNS)
+            cache.sync()
+            yield cache
+
+    def push(self, table, key, op):
+        self.subs[table].queue.append((key, op, {}))
+
+    def test_incremental_updates(self, cache):
+        assert cache.get_misses() == ([], [])
+        assert len(cache.routes[route_check.APPL_DB_NAME]) == self.NUM_ROUTES
+
+        appl_subs = self.subs[route_check.APPL_ROUTE_TABLE_NAME]
+        asic_subs = self.subs[route_check.ASIC_TABLE_NAME]
+        pops = appl_subs.pops + asic_subs.pops
+
+        self.push(route_check.APPL_ROUTE_TABLE_NAME, "Vrf1:192.168.0.0/24", OP_SET)
+        self.push(route_check.APPL_ROUTE_TABLE_NAME, "192.168.0.0/24", OP_SET)
+        self.push(route_check.ASIC_TABLE_NAME, RT_ENTRY_KEY_PREFIX + "10.0.1.0/24" + RT_ENTRY_KEY_SUFFIX, OP_DEL)
+        cache.wait_updates(0)
+        assert cache.get_misses() == (["10.0.1.0/24", "192.168.0.0/24"], [])
+
+        # The route is still present in the other VRF
+        self.push(route_check.APPL_ROUTE_TABLE_NAME, "Vrf1:192.168.0.0/24", OP_DEL)
+        self.push(route_check.APPL_ROUTE_TABLE_NAME, "10.0.2.0/24", OP_DEL)
+        self.push(route_check.ASIC_TABLE_NAME, RT_ENTRY_KEY_PREFIX + "192.168.0.0/24" + RT_ENTRY_KEY_SUFFIX, OP_SET)
+        cache.wait_updates(0)
+        assert cache.get_misses() == (["10.0.1.0/24"], ["10.0.2.0/24"])
+
+        # Only the updates are read, not the full tables
+        assert appl_subs.pops + asic_subs.pops - pops == 6 + 4
+        assert cache.syncs == 1
+
+    def test_resync_on_error(self, cache):
+        self.tables[route_check.ASIC_TABLE_NAME] = self.tables[route_check.ASIC_TABLE_NAME][1:]
+        self.select_state = route_check.swsscommon.Select.ERROR
+        cache.wait_updates(0)
+        assert cache.syncs == 2
+        assert cache.get_misses() == (["10.0.0.0/24"], [])
+
+    def test_resync_backoff_on_repeated_errors(self, cache):
+        self.select_state = route_check.swsscommon.Select.ERROR
+        cache.wait_updates(0)
+        assert cache.syncs == 2
+        # The resync after a second error in a row is delayed
+        cache.wait_updates(0)
+        assert cache.syncs == 2
+        assert cache.resync_time > time.time()
+
+        self.select_state = 0
+        cache.resync_time = time.time()
+        cache.wait_updates(0)
+        assert cache.syncs == 3
+        assert cache.errors == 0
+
+    def test_raise_on_persistent_errors(self, cache):
+        self.select_state = route_check.swsscommon.Select.ERROR
+        with patch("route_check.SUBSCRIBE_BACKOFF_SECS", 0), pytest.raises(RuntimeError):
+            cache.wait_updates(0)
+        assert cache.syncs == route_check.SUBSCRIBE_MAX_ERRORS
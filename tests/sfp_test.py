@@ -1,8 +1,10 @@
 import sys
 import os
+import subprocess
 from click.testing import CliRunner
 from .mock_tables import dbconnector
 from unittest.mock import patch, MagicMock
+from utilities_common.general import load_module_from_source
 
 test_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(test_path)
@@ -11,6 +13,7 @@ sys.path.insert(0, modules_path)
 
 import show.main as show
 import show as show_module
+from show import interfaces  # noqa: E402, F401 - imported lazily by show.main
 
 test_sfp_eeprom_with_dom_output = """\
 Ethernet0: SFP EEPROM detected
@@ -852,6 +855,7 @@ class TestSFP(object):
         print("SETUP")
         os.environ["PATH"] += os.pathsep + scripts_path
         os.environ["UTILITIES_UNIT_TESTING"] = "2"
+        cls.sfpshow = load_module_from_source('sfpshow', os.path.join(scripts_path, 'sfpshow'))
 
     def test_sfp_presence(self):
         runner = CliRunner()
@@ -1008,6 +1012,29 @@ Ethernet36  Present
         expected = "Ethernet200: Transceiver status info not applicable"
         assert result_lines == expected
 
+    def test_sfp_eeprom_snapshot_round_trips(self):
+        sfp = self.sfpshow.SFPShow(None, None, dump_dom=True)
+        sfp.get_eeprom()
+        snapshots = set(sfp.port_snapshots.values())
+        assert len(snapshots) == 1
+        snapshot = snapshots.pop()
+        # The TRANSCEIVER_* tables of all the ports are read in one pipelined request
+        assert snapshot.round_trips == 1
+        assert 'Ethernet0' in snapshot.ports
+        assert 'Ethernet200' not in snapshot.ports
+
+        db = snapshot.db
+        for table in snapshot.tables:
+            key = '{}|Ethernet0'.format(table)
+            assert snapshot.get_all(db.STATE_DB, key) == db.get_all(db.STATE_DB, key)
+        assert snapshot.round_trips == 1
+
+    def test_sfp_presence_snapshot(self):
+        sfp = self.sfpshow.SFPShow('Ethernet200', None)
+        sfp.get_presence()
+        assert sfp.table == [('Ethernet200', 'Not present')]
+        assert list(sfp.port_snapshots) == ['Ethernet200']
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
@@ -1127,6 +1154,10 @@ Ethernet200  Not present
         assert result.exit_code == 0
         assert "\n".join([ l.rstrip() for l in result.output.split('\n')]) == test_qsfp_dd_status_all_output
 
+    def test_qsfp_dd_status_all_max_workers(self):
+        output = subprocess.check_output(['sfpshow', 'status', '-w', '2'], text=True)
+        assert "\n".join([line.rstrip() for line in output.split('\n')]) == test_qsfp_dd_status_all_output
+
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
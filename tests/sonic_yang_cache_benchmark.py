@@ -0,0 +1,80 @@
+"""
+Measures the time taken by config apply-patch, config replace and config interface breakout to start, with the
+YANG models shared in the process by sonic_yang_cache and with the models loaded again on every use as before.
+apply-patch and replace are run with --dry-run, with a patch and a target config that change nothing. breakout
+is measured up to the loading of its ConfigMgmtDPB, as the port is changed afterwards. Run it on a SONiC device
+from the repository root:
+
+    sudo python3 -m tests.sonic_yang_cache_benchmark [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from unittest import mock
+
+from click.testing import CliRunner
+from tabulate import tabulate
+
+import config.main as config
+from generic_config_updater.gu_common import ConfigWrapper
+from utilities_common import sonic_yang_cache
+
+
+def run_config_command(args):
+    result = CliRunner().invoke(config.config, args)
+    if result.exit_code != 0:
+        raise RuntimeError("config {} failed: {}".format(" ".join(args), result.output))
+
+
+def timed_loads(function, *args, shared=True):
+    load_sonic_yang = sonic_yang_cache.load_sonic_yang
+
+    def reload_sonic_yang(*load_args, **load_kwargs):
+        # Models loaded again on every use, as before sonic_yang_cache
+        sonic_yang_cache.clear()
+        return load_sonic_yang(*load_args, **load_kwargs)
+
+    # Every run starts as a new CLI invocation
+    sonic_yang_cache.clear()
+    with mock.patch.object(sonic_yang_cache, '_load', wraps=sonic_yang_cache._load) as mock_load, \
+            mock.patch.object(sonic_yang_cache, 'load_sonic_yang',
+                              load_sonic_yang if shared else reload_sonic_yang):
+        start = time.perf_counter()
+        function(*args)
+        duration = time.perf_counter() - start
+    return duration, mock_load.call_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the loading of the YANG models by config commands")
+    parser.add_argument('--runs', type=int, default=3, help='Number of runs per command, the fastest is reported')
+    args = parser.parse_args()
+
+    body = []
+    with tempfile.TemporaryDirectory() as directory:
+        patch_file = os.path.join(directory, 'empty_patch.json')
+        with open(patch_file, 'w') as f:
+            json.dump([], f)
+        target_file = os.path.join(directory, 'running_config.json')
+        with open(target_file, 'w') as f:
+            json.dump(ConfigWrapper().get_config_db_as_json(), f)
+
+        commands = [
+            ('config apply-patch --dry-run', run_config_command, ['apply-patch', '--dry-run', patch_file]),
+            ('config replace --dry-run', run_config_command, ['replace', '--dry-run', target_file]),
+            ('config interface breakout', config.load_ConfigMgmt, False),
+        ]
+        for command, function, function_args in commands:
+            for shared in (False, True):
+                results = [timed_loads(function, function_args, shared=shared) for _ in range(args.runs)]
+                duration, loads = min(results)
+                body.append([command, 'shared' if shared else 'reloaded', loads, f"{duration:.3f}"])
+
+    print(tabulate(body, ['Command', 'Models', 'Model loads', 'Secs']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+from unittest import mock
+
+from utilities_common import sonic_yang_cache
+
+
+class MockSonicYang(object):
+    loads = 0
+
+    def __init__(self, yang_dir, **kwargs):
+        self.yang_dir = yang_dir
+        self.kwargs = kwargs
+        self.yJson = []
+
+    def loadYangModel(self):
+        MockSonicYang.loads += 1
+        for name in sorted(os.listdir(self.yang_dir)):
+            self.yJson.append({'module': {'@name': name}})
+
+
+class TestSonicYangCache(object):
+
+    def setup_method(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.yang_dir = os.path.join(self.tmp_dir.name, 'yang-models')
+        os.mkdir(self.yang_dir)
+        self.write_module('sonic-port', 'module sonic-port {}')
+        MockSonicYang.loads = 0
+        sonic_yang_cache.clear()
+        self.patcher = mock.patch.object(sonic_yang_cache.sonic_yang, 'SonicYang', MockSonicYang)
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+        sonic_yang_cache.clear()
+        self.tmp_dir.cleanup()
+
+    def write_module(self, name, content):
+        with open(os.path.join(self.yang_dir, name + '.yang'), 'w') as f:
+            f.write(content)
+
+    def test_shared_in_process(self):
+        sy = sonic_yang_cache.load_sonic_yang(self.yang_dir, print_log_enabled=False)
+        assert sy.yJson == [{'module': {'@name': 'sonic-port.yang'}}]
+        assert sonic_yang_cache.load_sonic_yang(self.yang_dir, print_log_enabled=False) is sy
+        assert MockSonicYang.loads == 1
+
+        other_sy = sonic_yang_cache.load_sonic_yang(self.yang_dir, print_log_enabled=True)
+        assert other_sy is not sy
+        assert other_sy.kwargs == {'print_log_enabled': True}
+        assert MockSonicYang.loads == 2
+
+    def test_yang_dir_change(self):
+        sy = sonic_yang_cache.load_sonic_yang(self.yang_dir)
+        yang_dir_hash = sonic_yang_cache.get_yang_dir_hash(self.yang_dir)
+
+        self.write_module('sonic-vlan', 'module sonic-vlan {}')
+        assert sonic_yang_cache.get_yang_dir_hash(self.yang_dir) != yang_dir_hash
+        new_sy = sonic_yang_cache.load_sonic_yang(self.yang_dir)
+        assert new_sy is not sy
+        assert len(new_sy.yJson) == 2
+
+        # Same file names, different content
+        self.write_module('sonic-vlan', 'module sonic-vlan { }')
+        assert sonic_yang_cache.load_sonic_yang(self.yang_dir) is not new_sy
+        assert MockSonicYang.loads == 3
@@ -0,0 +1,197 @@
+"""
+Bulk readers for redis hashes.
+
+Show commands used to fetch every counter hash with one request per key
+(or even one request per field). The helpers below queue HGETALL requests
+on a redis pipeline and flush them in batches, so reading N hashes costs
+about N / batch_size round trips instead of N.
+
+The swsscommon DBConnector behind a connector does not support pipelining,
+so the readers open a redis-py client on the unix socket of the same
+database and pipeline on it. If redis-py is not available, the readers fall
+back to one get_all() per key, which keeps the results identical to the
+per-key code path.
+
+Keys of large tables are listed with SCAN rather than KEYS, so redis is
+not blocked while the whole keyspace is walked.
+"""
+
+import itertools
+
+from swsscommon.swsscommon import SonicDBConfig
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+COUNTER_TABLE_PREFIX = "COUNTERS:"
+RATES_TABLE_PREFIX = "RATES:"
+
+BULK_READ_BATCH_SIZE = 512
+BULK_SCAN_COUNT = 1000
+
+
+def get_pipeline_client(db, db_name):
+    """
+    Return a redis client of the database 'db_name' of 'db' supporting
+    pipelines: the client of 'db' if it does, else a redis-py client on the
+    unix socket of the same database. Return None if it cannot be opened.
+    """
+    client = db.get_redis_client(db_name)
+    if hasattr(client, 'pipeline'):
+        return client
+    if redis is None:
+        return None
+    try:
+        return redis.Redis(unix_socket_path=SonicDBConfig.getDbSock(db_name, client.getNamespace()),
+                           db=client.getDbId(), decode_responses=True)
+    except (AttributeError, RuntimeError):
+        return None
+
+
+class BulkReader(object):
+    """
+    Read many hashes from one database of a SonicV2Connector.
+
+    The number of requests sent to redis is tracked in 'round_trips'.
+    """
+
+    def __init__(self, db, db_name, batch_size=BULK_READ_BATCH_SIZE):
+        self.db = db
+        self.db_name = db_name
+        self.batch_size = batch_size
+        self.round_trips = 0
+        self.client = None
+
+    def _get_client(self):
+        """
+        Return a redis client supporting pipelines, or None.
+        """
+        if self.client is None:
+            self.client = get_pipeline_client(self.db, self.db_name)
+        return self.client
+
+    def _get_pipeline(self):
+        client = self._get_client()
+        if client is None:
+            return None
+        return client.pipeline(transaction=False)
+
+    def get_all(self, keys):
+        """
+        Return a dict mapping every key in 'keys' to its hash content.
+        Missing keys are mapped to an empty dict.
+        """
+        return dict(self.iter_all(keys))
+
+    def iter_all(self, keys):
+        """
+        Iterate over (key, hash content) for every key in 'keys', a batch
+        at a time. Missing keys are mapped to an empty dict.
+        'keys' may be any iterable, it is consumed as the batches are read.
+        """
+        pipe = self._get_pipeline()
+        if pipe is None:
+            for key in keys:
+                self.round_trips += 1
+                yield key, self.db.get_all(self.db_name, key) or {}
+            return
+
+        keys = iter(keys)
+        while True:
+            batch = list(itertools.islice(keys, self.batch_size))
+            if not batch:
+                return
+            for key in batch:
+                pipe.hgetall(key)
+            values = pipe.execute()
+            self.round_trips += 1
+            for key, value in zip(batch, values):
+                yield key, value or {}
+
+    def scan_keys(self, pattern, count=BULK_SCAN_COUNT):
+        """
+        Iterate over the keys matching 'pattern' using SCAN.
+        Falls back to KEYS if the redis client does not support SCAN.
+        """
+        client = self.db.get_redis_client(self.db_name)
+        scan = getattr(client, 'scan', None)
+        if scan is None:
+            self.round_trips += 1
+            for key in self.db.keys(self.db_name, pattern) or []:
+                yield key
+            return
+
+        # SCAN may return a key more than once
+        seen = set()
+        cursor = 0
+        while True:
+            cursor, keys = scan(cursor, pattern, count)
+            self.round_trips += 1
+            for key in keys:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+            if int(cursor) == 0:
+                return
+
+    def get_fields(self, key, fields):
+        """
+        Return a dict mapping every field in 'fields' present in the hash
+        'key' to its value, reading batch_size fields per HMGET request.
+        Falls back to get_all() if the redis client does not support HMGET.
+        """
+        hmget = getattr(self._get_client(), 'hmget', None)
+        if hmget is None:
+            self.round_trips += 1
+            data = self.db.get_all(self.db_name, key) or {}
+            return {field: data[field] for field in fields if field in data}
+
+        result = {}
+        fields = list(fields)
+        for index in range(0, len(fields), self.batch_size):
+            batch = fields[index:index + self.batch_size]
+            self.round_trips += 1
+            for field, value in zip(batch, hmget(key, batch)):
+                if value is not None:
+                    result[field] = value
+        return result
+
+    def get_map(self, key):
+        """
+        Return the content of a single name map hash, e.g. COUNTERS_PORT_NAME_MAP.
+        """
+        self.round_trips += 1
+        return self.db.get_all(self.db_name, key) or {}
+
+
+def get_counters_and_rates(db, name_map, with_counters=True, with_rates=True, reader=None):
+    """
+    Fetch COUNTERS:<oid> and RATES:<oid> for every object in a COUNTERS_DB
+    name map (COUNTERS_PORT_NAME_MAP, COUNTERS_RIF_NAME_MAP, ...) in as few
+    round trips as possible.
+
+    Returns two dicts keyed by object name: counters and rates.
+    Either dict is left empty if it is not requested.
+    A BulkReader may be passed in to account the round trips.
+    """
+    if reader is None:
+        reader = BulkReader(db, db.COUNTERS_DB)
+    keys = []
+    for oid in name_map.values():
+        if with_counters:
+            keys.append(COUNTER_TABLE_PREFIX + oid)
+        if with_rates:
+            keys.append(RATES_TABLE_PREFIX + oid)
+
+    data = reader.get_all(keys)
+
+    counters = {}
+    rates = {}
+    for name, oid in name_map.items():
+        if with_counters:
+            counters[name] = data[COUNTER_TABLE_PREFIX + oid]
+        if with_rates:
+            rates[name] = data[RATES_TABLE_PREFIX + oid]
+    return counters, rates
@@ -1,5 +1,6 @@
 import configparser
 import datetime
+import importlib
 import os
 import re
 import subprocess
@@ -8,6 +9,7 @@ import shutil
 
 import click
 import json
+from collections.abc import MutableMapping
 import lazy_object_proxy
 import netaddr
 
@@ -20,7 +22,125 @@ VLAN_SUB_INTERFACE_SEPARATOR = '.'
 pass_db = click.make_pass_decorator(Db, ensure=True)
 
 
-class AbbreviationGroup(click.Group):
+def load_command(command_ref):
+    """Return the command referenced by command_ref, either a 'module:attribute' import path
+       or a function returning the command (or None)
+    """
+    if callable(command_ref):
+        return command_ref()
+    module_name, attr = command_ref.split(':')
+    return getattr(importlib.import_module(module_name), attr)
+
+
+class LazyCommands(MutableMapping):
+    """The commands of a click.Group, where commands can be registered by reference, see load_command(),
+       and are only imported when they are looked up. Loaders adding commands, e.g. plugins, are only run
+       when a group or a command not registered by then is looked up, or when all the commands are listed.
+    """
+
+    def __init__(self, commands=None):
+        self.commands = dict(commands or {})
+        # name -> (command_ref, condition)
+        self.lazy_commands = {}
+        self.loaders = []
+
+    def add_lazy_command(self, name, command_ref, condition=None):
+        self.commands.pop(name, None)
+        self.lazy_commands[name] = (command_ref, condition)
+
+    def add_loader(self, loader):
+        self.loaders.append(loader)
+
+    def _run_loaders(self):
+        while self.loaders:
+            self.loaders.pop(0)()
+
+    def _check_condition(self, name):
+        command_ref, condition = self.lazy_commands[name]
+        if condition is not None:
+            if not condition():
+                del self.lazy_commands[name]
+                return False
+            self.lazy_commands[name] = (command_ref, None)
+        return True
+
+    def _resolve(self, name):
+        command = self.commands.get(name)
+        if isinstance(command, click.Group) or (command is None and name not in self.lazy_commands):
+            # Loaders can also add subcommands to the groups
+            self._run_loaders()
+        if name in self.commands:
+            return
+        if name not in self.lazy_commands or not self._check_condition(name):
+            return
+        command_ref, _ = self.lazy_commands.pop(name)
+        command = load_command(command_ref)
+        if command is not None:
+            self.commands[name] = command
+            if isinstance(command, click.Group):
+                self._run_loaders()
+
+    def __getitem__(self, name):
+        self._resolve(name)
+        return self.commands[name]
+
+    def __setitem__(self, name, command):
+        self.lazy_commands.pop(name, None)
+        self.commands[name] = command
+
+    def __delitem__(self, name):
+        if name in self.lazy_commands:
+            del self.lazy_commands[name]
+        else:
+            del self.commands[name]
+
+    def __contains__(self, name):
+        if name not in self.commands and name not in self.lazy_commands:
+            self._run_loaders()
+        return name in self.commands or name in self.lazy_commands
+
+    def _names(self):
+        self._run_loaders()
+        for name in list(self.lazy_commands):
+            self._check_condition(name)
+        return list(self.commands) + [name for name in self.lazy_commands if name not in self.commands]
+
+    def __iter__(self):
+        return iter(self._names())
+
+    def __len__(self):
+        return len(self._names())
+
+
+class LazyGroup(click.Group):
+    """This subclass of click.Group supports registering commands from a manifest, their modules are
+       only imported when they are resolved.
+    """
+
+    def _get_lazy_commands(self):
+        if not isinstance(self.commands, LazyCommands):
+            self.commands = LazyCommands(self.commands)
+        return self.commands
+
+    def add_lazy_command(self, name, command_ref, condition=None):
+        """Register the command referenced by command_ref as name, see load_command(). If condition is given,
+           the command is only registered if condition() returns True when the command is resolved.
+        """
+        self._get_lazy_commands().add_lazy_command(name, command_ref, condition)
+
+    def add_lazy_commands(self, manifest):
+        """Register the commands of a {name: command_ref} manifest"""
+        for name, command_ref in manifest.items():
+            self.add_lazy_command(name, command_ref)
+
+    def add_commands_loader(self, loader):
+        """Register a function adding commands to the group, run before looking up a subgroup or a command
+           that is not registered
+        """
+        self._get_lazy_commands().add_loader(loader)
+
+
+class AbbreviationGroup(LazyGroup):
     """This subclass of click.Group supports abbreviated subgroup/subcommand names
     """
 
@@ -81,7 +201,7 @@ class Config(object):
 _config = None
 
 
-class AliasedGroup(click.Group):
+class AliasedGroup(LazyGroup):
     """This subclass of click.Group supports abbreviations and
        looking up aliases in a config file with a bit of magic.
     """
@@ -0,0 +1,193 @@
+"""
+Compact on-disk snapshots of counter dictionaries.
+
+The stat tools (portstat, pfcstat, queuestat, intfstat, ...) save the
+counters at "clear" time and diff against them on every show command.
+A snapshot holds a dictionary of the form
+
+    {'time': <datetime or str>, <name>: {<field>: <value>, ...}, ...}
+
+Integer counters (decimal strings) are stored as uint64 columns, one
+column per field, so loading a snapshot only parses a small JSON header
+and the counter values are read from the mmap'ed file when accessed.
+Other values (N/A, queue types, ...) are kept in the header.
+
+Baselines saved by older versions as plain JSON are still loaded and
+are converted to the snapshot format on the first load.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+from utilities_common.cli import json_serial
+
+SNAPSHOT_MAGIC = b'SNCS'
+SNAPSHOT_VERSION = 1
+
+# magic, version, header length, number of rows, number of columns
+_HEADER = struct.Struct('<4sHIII')
+_ALIGNMENT = 8
+
+STATUS_NA = 'N/A'
+_VALUE_NA = 0xFFFFFFFFFFFFFFFF
+_VALUE_MISSING = 0xFFFFFFFFFFFFFFFE
+_VALUE_MAX = 0xFFFFFFFFFFFFFFFD
+
+
+def _is_counter(value):
+    """ Return True if the value can be stored in a uint64 column """
+    if value == STATUS_NA:
+        return True
+    return isinstance(value, str) and value.isdecimal() and \
+        str(int(value)) == value and int(value) <= _VALUE_MAX
+
+
+class SnapshotRow(Mapping):
+    """ Read-only view of the counters of one row of a snapshot """
+
+    def __init__(self, snapshot, index):
+        self._snapshot = snapshot
+        self._index = index
+
+    def __getitem__(self, field):
+        value = self._snapshot._get_value(self._index, field)
+        if value is None:
+            raise KeyError(field)
+        return value
+
+    def __iter__(self):
+        for field in self._snapshot._fields:
+            if self._snapshot._get_value(self._index, field) is not None:
+                yield field
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class CounterSnapshot(Mapping):
+    """ Read-only dictionary backed by a snapshot file """
+
+    def __init__(self, header, values):
+        self._scalars = header['scalars']
+        self._rows = {name: index for index, name in enumerate(header['rows'])}
+        self._fields = header['fields']
+        self._columns = {name: index for index, name in enumerate(header['columns'])}
+        self._strings = header['strings']
+        self._values = values
+        self._num_rows = len(header['rows'])
+
+    def _get_value(self, index, field):
+        column = self._columns.get(field)
+        if column is None:
+            values = self._strings.get(field)
+            return None if values is None else values[index]
+        value = self._values[column * self._num_rows + index]
+        if value == _VALUE_MISSING:
+            return None
+        if value == _VALUE_NA:
+            return STATUS_NA
+        return str(value)
+
+    def __getitem__(self, key):
+        if key in self._scalars:
+            return self._scalars[key]
+        return SnapshotRow(self, self._rows[key])
+
+    def __iter__(self):
+        yield from self._scalars
+        yield from self._rows
+
+    def __len__(self):
+        return len(self._scalars) + len(self._rows)
+
+    def __contains__(self, key):
+        return key in self._scalars or key in self._rows
+
+
+def dump_snapshot(cnstat_dict, path):
+    """
+    Save a counter dictionary to 'path' in the snapshot format.
+    The file is replaced atomically.
+    """
+    scalars = {}
+    rows = []
+    fields = []
+    for key, value in cnstat_dict.items():
+        if isinstance(value, Mapping):
+            rows.append((key, value))
+            for field in value:
+                if field not in fields:
+                    fields.append(field)
+        else:
+            scalars[key] = value
+
+    columns = [field for field in fields
+               if all(_is_counter(row.get(field, STATUS_NA)) for _, row in rows)]
+    strings = {field: [row.get(field) for _, row in rows]
+               for field in fields if field not in columns}
+
+    values = array('Q')
+    for field in columns:
+        for _, row in rows:
+            value = row.get(field)
+            if value is None:
+                values.append(_VALUE_MISSING)
+            elif value == STATUS_NA:
+                values.append(_VALUE_NA)
+            else:
+                values.append(int(value))
+    if sys.byteorder != 'little':
+        values.byteswap()
+
+    header = json.dumps({
+        'scalars': scalars,
+        'rows': [name for name, _ in rows],
+        'fields': fields,
+        'columns': columns,
+        'strings': strings,
+    }, default=json_serial).encode()
+    header += b' ' * (-(_HEADER.size + len(header)) % _ALIGNMENT)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header), len(rows), len(columns)))
+        f.write(header)
+        values.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path):
+    """
+    Load a counter dictionary saved by dump_snapshot() or by json.dump().
+    JSON files are converted to the snapshot format.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+            f.seek(0)
+            cnstat_dict = json.load(f)
+            try:
+                dump_snapshot(cnstat_dict, path)
+            except IOError:
+                pass
+            return cnstat_dict
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    _, version, header_len, num_rows, num_columns = _HEADER.unpack_from(mm)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError("Unsupported counter snapshot version {} in {}".format(version, path))
+
+    header = json.loads(mm[_HEADER.size:_HEADER.size + header_len])
+    offset = _HEADER.size + header_len
+    size = num_rows * num_columns * 8
+    if sys.byteorder == 'little':
+        values = memoryview(mm)[offset:offset + size].cast('Q')
+    else:
+        values = array('Q', mm[offset:offset + size])
+        values.byteswap()
+    return CounterSnapshot(header, values)
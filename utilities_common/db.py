@@ -1,41 +1,166 @@
+import atexit
+import os
+import sys
+from collections.abc import Mapping
+
 from sonic_py_common import multi_asic, device_info
 from swsscommon.swsscommon import ConfigDBConnector, ConfigDBPipeConnector, SonicV2Connector
 from utilities_common import constants
 from utilities_common.multi_asic import multi_asic_ns_choices
 
+# Set to a non-zero value to print the DB connections opened by the command on exit
+DB_STATS_ENV = 'UTILITIES_DB_STATS'
+
+# SonicV2Connector methods taking the DB name as first argument, and needing a connection to it
+DB_ACCESS_METHODS = ('get_redis_client', 'publish', 'keys', 'scan', 'get', 'hexists', 'get_all', 'hmset', 'set',
+                     'delete', 'delete_all_by_pattern', 'exists')
+
+# (namespace, DB name) of the connections opened by this process
+opened_connections = []
+
+
+def record_connection(namespace, db_name):
+    if not opened_connections and os.environ.get(DB_STATS_ENV, '0') != '0':
+        atexit.register(report_connections)
+    opened_connections.append((namespace, db_name))
+
+
+def report_connections():
+    names = ['{}/{}'.format(namespace or 'default', db_name) for namespace, db_name in opened_connections]
+    sys.stderr.write('{} DB connection(s) opened: {}\n'.format(len(names), ', '.join(names)))
+
+
+class OnDemandSonicV2Connector(SonicV2Connector):
+    """SonicV2Connector connecting to each DB when it is first accessed, instead of connecting to all the DBs"""
+
+    def __init__(self, db_list=None, **kwargs):
+        super(OnDemandSonicV2Connector, self).__init__(**kwargs)
+        self.on_demand_namespace = kwargs.get('namespace') or constants.DEFAULT_NAMESPACE
+        self.on_demand_db_list = db_list
+        self.connected_dbs = set()
+
+    def connect(self, db_name, retry_on=True):
+        super(OnDemandSonicV2Connector, self).connect(db_name, retry_on)
+        if db_name not in self.connected_dbs:
+            self.connected_dbs.add(db_name)
+            record_connection(self.on_demand_namespace, db_name)
+
+    def close(self, db_name):
+        super(OnDemandSonicV2Connector, self).close(db_name)
+        self.connected_dbs.discard(db_name)
+
+    def connect_on_demand(self, db_name):
+        if db_name in self.connected_dbs:
+            return
+        if self.on_demand_db_list is not None and db_name not in self.on_demand_db_list:
+            return
+        self.connect(db_name)
+
+
+def _on_demand_method(name):
+    method = getattr(SonicV2Connector, name)
+
+    def on_demand_method(self, db_name, *args, **kwargs):
+        self.connect_on_demand(db_name)
+        return method(self, db_name, *args, **kwargs)
+
+    on_demand_method.__name__ = name
+    return on_demand_method
+
+
+for _name in DB_ACCESS_METHODS:
+    if hasattr(SonicV2Connector, _name):
+        setattr(OnDemandSonicV2Connector, _name, _on_demand_method(_name))
+
+
+class OnDemandClients(Mapping):
+    """The DB clients of each namespace, created by create_client(namespace) when first accessed"""
+
+    def __init__(self, get_namespaces, create_client):
+        self.get_namespaces = get_namespaces
+        self.create_client = create_client
+        self.clients = {}
+
+    def __getitem__(self, namespace):
+        if namespace not in self.clients:
+            if namespace not in self.get_namespaces():
+                raise KeyError(namespace)
+            self.clients[namespace] = self.create_client(namespace)
+        return self.clients[namespace]
+
+    def __iter__(self):
+        return iter(self.get_namespaces())
+
+    def __len__(self):
+        return len(self.get_namespaces())
+
 
 class Db(object):
+    """The DB clients used by the CLI commands. The clients are only created, and connected to the DBs,
+       when they are first used, see OnDemandSonicV2Connector.
+    """
+
     def __init__(self):
-        self.cfgdb_clients = {}
-        self.db_clients = {}
-        self.cfgdb = ConfigDBConnector()
-        self.cfgdb.connect()
-        self.cfgdb_pipe = ConfigDBPipeConnector()
-        self.cfgdb_pipe.connect()
-        self.db = SonicV2Connector(host="127.0.0.1")
-
-        # Skip connecting to chassis databases in line cards
-        self.db_list = list(self.db.get_db_list())
-        if not device_info.is_supervisor():
-            try:
-                self.db_list.remove('CHASSIS_APP_DB')
-                self.db_list.remove('CHASSIS_STATE_DB')
-            except Exception:
-                pass
-
-        for db_id in self.db_list:
-            self.db.connect(db_id)
-
-        self.cfgdb_clients[constants.DEFAULT_NAMESPACE] = self.cfgdb
-        self.db_clients[constants.DEFAULT_NAMESPACE] = self.db
-
-        if multi_asic.is_multi_asic():
-            self.ns_list = multi_asic_ns_choices()
-            for ns in self.ns_list:
-                self.cfgdb_clients[ns] = (
-                    multi_asic.connect_config_db_for_ns(ns)
-                )
-                self.db_clients[ns] = multi_asic.connect_to_all_dbs_for_ns(ns)
+        self._namespaces = None
+        self._db_list = None
+        self._cfgdb_pipe = None
+        self.cfgdb_clients = OnDemandClients(self._get_namespaces, self._create_cfgdb)
+        self.db_clients = OnDemandClients(self._get_namespaces, self._create_db)
+
+    def _get_namespaces(self):
+        if self._namespaces is None:
+            self._namespaces = [constants.DEFAULT_NAMESPACE]
+            if multi_asic.is_multi_asic():
+                self._namespaces += self.ns_list
+        return self._namespaces
+
+    @property
+    def ns_list(self):
+        return multi_asic_ns_choices()
+
+    @property
+    def db_list(self):
+        if self._db_list is None:
+            # Skip connecting to chassis databases in line cards
+            db_list = list(SonicV2Connector(host="127.0.0.1").get_db_list())
+            if not device_info.is_supervisor():
+                try:
+                    db_list.remove('CHASSIS_APP_DB')
+                    db_list.remove('CHASSIS_STATE_DB')
+                except Exception:
+                    pass
+            self._db_list = db_list
+        return self._db_list
+
+    def _create_cfgdb(self, namespace):
+        if namespace == constants.DEFAULT_NAMESPACE:
+            cfgdb = ConfigDBConnector()
+            cfgdb.connect()
+        else:
+            cfgdb = multi_asic.connect_config_db_for_ns(namespace)
+        record_connection(namespace, 'CONFIG_DB')
+        return cfgdb
+
+    def _create_db(self, namespace):
+        if namespace == constants.DEFAULT_NAMESPACE:
+            return OnDemandSonicV2Connector(self.db_list, host="127.0.0.1")
+        return OnDemandSonicV2Connector(namespace=namespace, use_unix_socket_path=True)
+
+    @property
+    def cfgdb(self):
+        return self.cfgdb_clients[constants.DEFAULT_NAMESPACE]
+
+    @property
+    def db(self):
+        return self.db_clients[constants.DEFAULT_NAMESPACE]
+
+    @property
+    def cfgdb_pipe(self):
+        if self._cfgdb_pipe is None:
+            self._cfgdb_pipe = ConfigDBPipeConnector()
+            self._cfgdb_pipe.connect()
+            record_connection(constants.DEFAULT_NAMESPACE, 'CONFIG_DB')
+        return self._cfgdb_pipe
 
     def get_data(self, table, key):
         data = self.cfgdb.get_table(table)
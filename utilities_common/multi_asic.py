@@ -1,5 +1,7 @@
 import argparse
+import copy
 import functools
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 import netifaces
@@ -14,7 +16,7 @@ class MultiAsic(object):
 
     def __init__(
         self, display_option=constants.DISPLAY_ALL, namespace_option=None,
-        db=None
+        db=None, max_workers=1
     ):
         # Load database config files
         load_db_config()
@@ -23,6 +25,8 @@ class MultiAsic(object):
         self.current_namespace = None
         self.is_multi_asic = multi_asic.is_multi_asic()
         self.db = db
+        # Number of namespaces processed concurrently by run_on_multi_asic
+        self.max_workers = max_workers
 
     def get_display_option(self):
         return self.display_option
@@ -129,6 +133,25 @@ def multi_asic_click_option_namespace(func):
    func = _multi_asic_click_option_namespace(func)
    return func
 
+
+def _connect_ns(obj, ns):
+    '''
+    Set the current namespace on the object and provide it with the
+    config DB and all DB connections of that namespace.
+    '''
+    obj.multi_asic.current_namespace = ns
+    # if object instance already has db connections, use them
+    if obj.multi_asic.db and obj.multi_asic.db.cfgdb_clients.get(ns):
+        obj.config_db = obj.multi_asic.db.cfgdb_clients[ns]
+    else:
+        obj.config_db = multi_asic.connect_config_db_for_ns(ns)
+
+    if obj.multi_asic.db and obj.multi_asic.db.db_clients.get(ns):
+        obj.db = obj.multi_asic.db.db_clients[ns]
+    else:
+        obj.db = multi_asic.connect_to_all_dbs_for_ns(ns)
+
+
 def run_on_multi_asic(func):
     '''
     This decorator is used on the CLI functions which needs to be
@@ -137,24 +160,36 @@ def run_on_multi_asic(func):
     for every iteration, it connects to all the DBs and provides an handle
     to the wrapped function.
 
+    The values returned by the wrapped function are returned as a list,
+    in the order of the namespaces. The decorated function used to return
+    None, callers checking its return value now get a list, empty if there
+    is no namespace to run on.
+
+    If multi_asic.max_workers is greater than 1, the namespaces are
+    processed concurrently. Every namespace then runs on its own shallow
+    copy of the object with its own DB connections, so the wrapped function
+    must return its result instead of storing it in the object.
     '''
     @functools.wraps(func)
     def wrapped_run_on_all_asics(self, *args, **kwargs):
         ns_list = self.multi_asic.get_ns_list_based_on_options()
-        for ns in ns_list:
-            self.multi_asic.current_namespace = ns
-            # if object instance already has db connections, use them
-            if self.multi_asic.db and self.multi_asic.db.cfgdb_clients.get(ns):
-                self.config_db = self.multi_asic.db.cfgdb_clients[ns]
-            else:
-                self.config_db = multi_asic.connect_config_db_for_ns(ns)
-
-            if self.multi_asic.db and self.multi_asic.db.db_clients.get(ns):
-                self.db = self.multi_asic.db.db_clients[ns]
-            else:
-                self.db = multi_asic.connect_to_all_dbs_for_ns(ns)
-
-            func(self,  *args, **kwargs)
+        max_workers = min(self.multi_asic.max_workers, len(ns_list))
+        if max_workers <= 1:
+            results = []
+            for ns in ns_list:
+                _connect_ns(self, ns)
+                results.append(func(self,  *args, **kwargs))
+            return results
+
+        def run_on_ns(ns):
+            ns_self = copy.copy(self)
+            ns_self.multi_asic = copy.copy(self.multi_asic)
+            _connect_ns(ns_self, ns)
+            return func(ns_self, *args, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() yields the results in the order of ns_list
+            return list(executor.map(run_on_ns, ns_list))
     return wrapped_run_on_all_asics
 
 
@@ -1,60 +1,135 @@
 # network statistics utility functions #
 
 import json
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 STATUS_NA = 'N/A'
 PORT_RATE = 40
 
-def ns_diff(newstr, oldstr):
+# Columns shorter than this are computed without NumPy, as converting
+# them to arrays costs more than it saves
+NUMPY_MIN_ROWS = 64
+
+
+def _parse_column(values):
     """
-        Calculate the diff.
+        Convert a column of counters to integers and a mask of valid values.
+        N/A counters are converted to 0.
     """
-    if newstr == STATUS_NA:
-        return STATUS_NA
+    valid = [value != STATUS_NA for value in values]
+    numbers = [int(value) if is_valid else 0 for value, is_valid in zip(values, valid)]
+    return numbers, valid
+
+
+def _diff_numbers(new, old):
+    """
+        Calculate max(0, new - old) for two columns of integers.
+    """
+    if numpy is not None and len(new) >= NUMPY_MIN_ROWS:
+        new = numpy.array(new, dtype=numpy.uint64)
+        old = numpy.array(old, dtype=numpy.uint64)
+        return numpy.where(new > old, new - old, 0).tolist()
+    new, old = array('Q', new), array('Q', old)
+    return [n - o if n > o else 0 for n, o in zip(new, old)]
+
+
+def ns_diff_column(new_values, old_values):
+    """
+        Calculate the diff of two columns of counters.
+        Returns an integer per row, or None if the new counter is N/A.
+        An N/A old counter is considered as 0.
+    """
+    new, new_valid = _parse_column(new_values)
+    old, _ = _parse_column(old_values)
+    diffs = _diff_numbers(new, old)
+    return [diff if is_valid else None for diff, is_valid in zip(diffs, new_valid)]
 
-    # if new is valid but old is not we should return new
-    if oldstr == STATUS_NA:
-        oldstr = '0'
 
-    new, old = int(newstr), int(oldstr)
-    return '{:,}'.format(max(0, new - old))
+def ns_rate_column(new_values, old_values, delta):
+    """
+        Calculate the rate per second of two columns of counters.
+        Returns a float per row, or None if any of the counters is N/A.
+    """
+    new, new_valid = _parse_column(new_values)
+    old, old_valid = _parse_column(old_values)
+    diffs = _diff_numbers(new, old)
+    if numpy is not None and len(diffs) >= NUMPY_MIN_ROWS:
+        rates = (numpy.array(diffs, dtype=numpy.float64) / delta).tolist()
+    else:
+        rates = [diff / delta for diff in diffs]
+    return [rate if new_ok and old_ok else None
+            for rate, new_ok, old_ok in zip(rates, new_valid, old_valid)]
+
+
+def ns_util_column(new_values, old_values, delta, port_rates=PORT_RATE):
+    """
+        Calculate the utilization of two columns of byte counters.
+        'port_rates' is the port speed in Gbps, either per row or for all rows.
+        Returns a percentage per row, or None if any of the counters is N/A.
+    """
+    rates = ns_rate_column(new_values, old_values, delta)
+    if not isinstance(port_rates, (list, tuple)):
+        port_rates = [port_rates] * len(rates)
+    return [None if rate is None else rate/(port_rate*1000*1000*1000/8.0)*100
+            for rate, port_rate in zip(rates, port_rates)]
+
+
+def format_diff_column(diffs):
+    """
+        Format a column of diffs with comma.
+    """
+    return [STATUS_NA if diff is None else '{:,}'.format(diff) for diff in diffs]
+
+
+def format_brate_column(rates):
+    """
+        Format a column of byte rates.
+    """
+    return [format_brate(STATUS_NA if rate is None else rate) for rate in rates]
+
+
+def format_prate_column(rates):
+    """
+        Format a column of packet rates.
+    """
+    return [format_prate(STATUS_NA if rate is None else rate) for rate in rates]
+
+
+def format_util_column(utils):
+    """
+        Format a column of utilizations.
+    """
+    return [STATUS_NA if util is None else "{:.2f}%".format(util) for util in utils]
+
+
+def ns_diff(newstr, oldstr):
+    """
+        Calculate the diff.
+    """
+    return format_diff_column(ns_diff_column([newstr], [oldstr]))[0]
 
 def ns_brate(newstr, oldstr, delta):
     """
         Calculate the byte rate.
     """
-    if newstr == STATUS_NA or oldstr == STATUS_NA:
-        return STATUS_NA
-    else:
-        rate = int(ns_diff(newstr, oldstr).replace(',',''))/delta
-        if rate > 1000*1000*10:
-            rate = "{:.2f}".format(rate/1000/1000)+' MB'
-        elif rate > 1000*10:
-            rate = "{:.2f}".format(rate/1000)+' KB'
-        else:
-            rate = "{:.2f}".format(rate)+' B'
-        return rate+'/s'
+    return format_brate_column(ns_rate_column([newstr], [oldstr], delta))[0]
 
 def ns_prate(newstr, oldstr, delta):
     """
         Calculate the packet rate.
     """
-    if newstr == STATUS_NA or oldstr == STATUS_NA:
-        return STATUS_NA
-    else:
-        rate = int(ns_diff(newstr, oldstr).replace(',',''))/delta
-        return "{:.2f}".format(rate)+'/s'
+    return format_prate_column(ns_rate_column([newstr], [oldstr], delta))[0]
 
 def ns_util(newstr, oldstr, delta, port_rate=PORT_RATE):
     """
         Calculate the util.
     """
-    if newstr == STATUS_NA or oldstr == STATUS_NA:
-        return STATUS_NA
-    else:
-        rate = int(ns_diff(newstr, oldstr).replace(',',''))/delta
-        util = rate/(port_rate*1000*1000*1000/8.0)*100
-        return "{:.2f}%".format(util)
+    return format_util_column(ns_util_column([newstr], [oldstr], delta, port_rate))[0]
 
 def table_as_json(table, header):
     """
@@ -0,0 +1,140 @@
+"""
+Resolve ASIC_DB object OIDs to the objects they refer to.
+
+fdbshow, nbrshow and fast-reboot-dump map FDB entries to interfaces and
+VLANs through the ASIC_DB bridge port, host interface, LAG member and
+VLAN objects. Reading those objects one key at a time is slow on large
+systems, so OidResolver lists them with SCAN and reads them all in one
+pipelined pass.
+
+The objects read are kept in the process, until an ASIC_DB keyspace
+event is seen on them. They are not cached on disk: ASIC_DB has no epoch
+telling when an object was changed, and checking the attributes of the
+cached objects costs as much as reading them again.
+"""
+
+from utilities_common.bulk_reader import BulkReader
+
+ASIC_STATE_PREFIX = 'ASIC_STATE:'
+
+BRIDGE_PORT = 'SAI_OBJECT_TYPE_BRIDGE_PORT'
+HOSTIF = 'SAI_OBJECT_TYPE_HOSTIF'
+LAG_MEMBER = 'SAI_OBJECT_TYPE_LAG_MEMBER'
+VLAN = 'SAI_OBJECT_TYPE_VLAN'
+
+OBJECT_TYPES = (BRIDGE_PORT, HOSTIF, LAG_MEMBER, VLAN)
+
+OID_PREFIX_LEN = len('oid:0x')
+
+
+class OidResolver(object):
+    """
+    Maps of the ASIC_DB objects of one SonicV2Connector.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.reader = BulkReader(db, db.ASIC_DB)
+        self._objects = None
+        self._pubsub = None
+
+    def _subscribe(self):
+        """
+        Subscribe to the keyspace events of the objects, to be told when
+        the objects read are no longer valid.
+        """
+        try:
+            client = self.db.get_redis_client(self.db.ASIC_DB)
+            pubsub = client.pubsub()
+            db_id = self.db.get_dbid(self.db.ASIC_DB)
+            for object_type in OBJECT_TYPES:
+                pubsub.psubscribe('__keyspace@{}__:{}{}:*'.format(db_id, ASIC_STATE_PREFIX, object_type))
+        except Exception:
+            # Without notifications the objects are kept until invalidate()
+            return None
+        return pubsub
+
+    def _is_stale(self):
+        if self._pubsub is None:
+            return False
+        stale = False
+        while True:
+            message = self._pubsub.get_message()
+            if not message:
+                return stale
+            if message.get('type') == 'pmessage':
+                stale = True
+
+    def invalidate(self):
+        """
+        Drop the objects read, they are read again on next use.
+        """
+        self._objects = None
+
+    def _load(self):
+        if self._pubsub is None:
+            self._pubsub = self._subscribe()
+        else:
+            # The objects are read again below
+            self._is_stale()
+
+        keys = {}
+        for object_type in OBJECT_TYPES:
+            keys[object_type] = list(self.reader.scan_keys(ASIC_STATE_PREFIX + object_type + ':*'))
+        data = self.reader.get_all(key for object_type in OBJECT_TYPES for key in keys[object_type])
+        objects = {}
+        for object_type in OBJECT_TYPES:
+            objects[object_type] = {key.split(':', 2)[2]: data[key] for key in keys[object_type]}
+        self._objects = objects
+
+    def get_objects(self, object_type):
+        """
+        Return a dict mapping the OID of every object of object_type
+        (e.g. SAI_OBJECT_TYPE_BRIDGE_PORT) to its attributes.
+        """
+        if self._objects is None or self._is_stale():
+            self._load()
+        return self._objects[object_type]
+
+    def get_bridge_port_map(self):
+        """
+        Return the bridge port to port map, as port_util.get_bridge_port_map():
+        OIDs without their 'oid:0x' prefix.
+        """
+        if_br_oid_map = {}
+        for br_port_id, attrs in self.get_objects(BRIDGE_PORT).items():
+            if 'SAI_BRIDGE_PORT_ATTR_PORT_ID' in attrs:
+                if_br_oid_map[br_port_id[OID_PREFIX_LEN:]] = attrs['SAI_BRIDGE_PORT_ATTR_PORT_ID'][OID_PREFIX_LEN:]
+        return if_br_oid_map
+
+    def get_vlan_id_from_bvid(self, bvid):
+        """
+        Return the VLAN id of a VLAN OID, None if it has no VLAN id.
+        Raise KeyError if there is no such VLAN.
+        """
+        return self.get_objects(VLAN)[bvid].get('SAI_VLAN_ATTR_VLAN_ID')
+
+    def get_vlan_oid(self, vlan_id):
+        """
+        Return the OID of a VLAN id, None if there is no such VLAN.
+        """
+        for oid, attrs in self.get_objects(VLAN).items():
+            if 'SAI_VLAN_ATTR_VLAN_ID' in attrs and int(attrs['SAI_VLAN_ATTR_VLAN_ID']) == vlan_id:
+                return oid
+        return None
+
+
+_resolvers = {}
+
+
+def get_oid_resolver(db):
+    """
+    Return the OidResolver of a SonicV2Connector, shared in the process.
+    """
+    resolver = _resolvers.get(id(db))
+    if resolver is not None and resolver.db is db:
+        return resolver
+
+    resolver = OidResolver(db)
+    _resolvers[id(db)] = resolver
+    return resolver
@@ -0,0 +1,69 @@
+"""
+Share loaded sonic_yang models in the process.
+
+Loading the YANG models (SonicYang.loadYangModel) parses every module of
+the YANG directory and converts each one to JSON, which takes seconds.
+GCU (ConfigWrapper, PathAddressing) and ConfigMgmt (DPB, config load)
+used to do it several times per command.
+
+load_sonic_yang() loads the models once per process and YANG directory
+content, and returns the same SonicYang instance until the directory
+changes. Users work on copy.copy() of it: the copies share the libyang
+context and the models, and have their own data tree.
+
+The models are not cached on disk: SonicYang has no public interface to
+load models converted beforehand.
+"""
+
+import glob
+import hashlib
+import os
+import threading
+
+import sonic_yang
+
+_lock = threading.Lock()
+_loaded = {}
+
+
+def get_yang_dir_hash(yang_dir):
+    """
+    Return a digest of the names and contents of the YANG modules in yang_dir.
+    """
+    digest = hashlib.sha1()
+    for path in sorted(glob.glob(os.path.join(yang_dir, '*.yang'))):
+        digest.update(os.path.basename(path).encode())
+        digest.update(b'\0')
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _load(yang_dir, **kwargs):
+    sy = sonic_yang.SonicYang(yang_dir, **kwargs)
+    sy.loadYangModel()
+    return sy
+
+
+def load_sonic_yang(yang_dir, **kwargs):
+    """
+    Return a SonicYang instance of yang_dir with the YANG models loaded, shared in the process.
+    kwargs are passed to SonicYang(). Do not load data in the returned instance, load it in a copy.copy() of it.
+    """
+    yang_dir_hash = get_yang_dir_hash(yang_dir)
+    key = (os.path.abspath(yang_dir), tuple(sorted(kwargs.items())))
+    with _lock:
+        loaded = _loaded.get(key)
+        if loaded is None or loaded[0] != yang_dir_hash:
+            loaded = (yang_dir_hash, _load(yang_dir, **kwargs))
+            _loaded[key] = loaded
+        return loaded[1]
+
+
+def clear():
+    """
+    Drop the models loaded in the process.
+    """
+    with _lock:
+        _loaded.clear()
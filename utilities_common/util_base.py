@@ -84,8 +84,13 @@ class UtilHelper(object):
         else:
             return False
 
-    def load_and_register_plugins(self, plugins, cli):
-        """ Load plugins and register them """
+    def load_and_register_plugins(self, plugins, cli, lazy=False):
+        """ Load plugins and register them. If lazy, they are only loaded when cli
+            looks up a command which is not registered, see clicommon.LazyGroup. """
+
+        if lazy:
+            cli.add_commands_loader(lambda: self.load_and_register_plugins(plugins, cli))
+            return
 
         for plugin in self.load_plugins(plugins):
             self.register_plugin(plugin, cli)
\ No newline at end of file